@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from worknest.paginator import EstimatedCountPaginator
 from .models import CustomUser, Company, JobSeeker
 
 
@@ -10,6 +11,8 @@ class CustomUserAdmin(UserAdmin):
     list_filter = ('user_type', 'onboarding_completed', 'is_staff', 'is_superuser', 'is_active', 'date_joined')
     list_editable = ('is_active', 'is_staff')
     list_per_page = 25
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         (None, {'fields': ('username', 'password')}),
@@ -31,23 +34,23 @@ class CustomUserAdmin(UserAdmin):
     actions = ['make_staff', 'remove_staff', 'activate_users', 'deactivate_users']
     
     def make_staff(self, request, queryset):
-        queryset.update(is_staff=True)
-        self.message_user(request, f"{queryset.count()} users marked as staff")
+        updated = queryset.update(is_staff=True)
+        self.message_user(request, f"{updated} users marked as staff")
     make_staff.short_description = "Mark selected users as staff"
     
     def remove_staff(self, request, queryset):
-        queryset.update(is_staff=False)
-        self.message_user(request, f"{queryset.count()} users removed from staff")
+        updated = queryset.update(is_staff=False)
+        self.message_user(request, f"{updated} users removed from staff")
     remove_staff.short_description = "Remove staff status from selected users"
     
     def activate_users(self, request, queryset):
-        queryset.update(is_active=True)
-        self.message_user(request, f"{queryset.count()} users activated")
+        updated = queryset.update(is_active=True)
+        self.message_user(request, f"{updated} users activated")
     activate_users.short_description = "Activate selected users"
     
     def deactivate_users(self, request, queryset):
-        queryset.update(is_active=False)
-        self.message_user(request, f"{queryset.count()} users deactivated")
+        updated = queryset.update(is_active=False)
+        self.message_user(request, f"{updated} users deactivated")
     deactivate_users.short_description = "Deactivate selected users"
 
 
@@ -57,6 +60,8 @@ class CompanyAdmin(admin.ModelAdmin):
     list_filter = ('location', 'created_at')
     search_fields = ('name', 'user__email', 'location')
     readonly_fields = ('created_at', 'updated_at')
+    raw_id_fields = ('user',)
+    list_select_related = ('user',)
 
 
 @admin.register(JobSeeker)
@@ -64,4 +69,6 @@ class JobSeekerAdmin(admin.ModelAdmin):
     list_display = ('name', 'user', 'created_at')
     list_filter = ('created_at',)
     search_fields = ('name', 'user__email')
-    readonly_fields = ('created_at', 'updated_at')
\ No newline at end of file
+    readonly_fields = ('created_at', 'updated_at')
+    raw_id_fields = ('user',)
+    list_select_related = ('user',)
\ No newline at end of file
@@ -0,0 +1,93 @@
+from asgiref.sync import sync_to_async
+from allauth.socialaccount.models import SocialAccount
+from django.conf import settings
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from worknest.async_api import error_response, json_response, read_data
+
+from . import google
+from .models import CustomUser
+from .oauth_views import login_payload, set_refresh_cookie
+
+
+# Async versions of the OAuth views, routed instead of the DRF ones when
+# ASYNC_VIEWS is on (ASGI mode). Waiting on Google does not hold a thread.
+
+@csrf_exempt
+@require_POST
+async def google_oauth_login(request):
+    """Handle Google OAuth login"""
+    try:
+        access_token = read_data(request).get('access_token')
+        if not access_token:
+            return json_response({'error': 'Access token is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            google_data = await google.aget_userinfo(access_token)
+        except google.GoogleUnavailable as e:
+            return json_response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except google.GoogleOAuthError as e:
+            return json_response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        email = google_data.get('email')
+        if not email:
+            return json_response({'error': 'Email not provided by Google'}, status=status.HTTP_400_BAD_REQUEST)
+
+        user, created = await CustomUser.objects.aget_or_create(
+            email=email,
+            defaults={
+                'username': email,
+                'name': google_data.get('name') or '',
+                'onboarding_completed': False,
+            }
+        )
+        await SocialAccount.objects.aget_or_create(
+            user=user,
+            provider='google',
+            defaults={
+                'uid': google_data.get('id'),
+                'extra_data': google_data,
+            }
+        )
+
+        refresh, response_data = await sync_to_async(login_payload)(user)
+        response = json_response(response_data, status=status.HTTP_200_OK)
+        set_refresh_cookie(response, refresh)
+        return response
+
+    except APIException as e:
+        return error_response(e, request)
+    except Exception as e:
+        return json_response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@csrf_exempt
+@require_POST
+async def google_token_exchange(request):
+    """Exchange Google authorization code for access token"""
+    try:
+        data = read_data(request)
+        code = data.get('code')
+        if not code:
+            return json_response({'error': 'Authorization code is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+        google_app = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']
+        if not google_app['client_id'] or not google_app['secret']:
+            return json_response({'error': 'Google OAuth not configured'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        try:
+            access_token = await google.aexchange_code(code, data.get('redirect_uri'))
+        except google.GoogleUnavailable as e:
+            return json_response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except google.GoogleOAuthError as e:
+            return json_response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return json_response({'access_token': access_token}, status=status.HTTP_200_OK)
+
+    except APIException as e:
+        return error_response(e, request)
+    except Exception as e:
+        return json_response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
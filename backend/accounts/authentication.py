@@ -0,0 +1,139 @@
+import threading
+import time
+import types
+import uuid
+
+from django.conf import settings
+from django.db import router
+from django.db.models import Model
+from django.db.models.base import DEFERRED
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import Company, CustomUser, JobSeeker
+from .tokens import COMPANY_ID_CLAIM, IS_STAFF_CLAIM, JOB_SEEKER_ID_CLAIM, USER_TYPE_CLAIM
+
+
+class UserFieldCache:
+    """Small in-process TTL cache of full user rows, keyed by user ID"""
+
+    max_entries = 10000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'JWT_USER_CACHE_TIMEOUT', 10)
+
+    def get(self, user_id):
+        entry = self.entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, user_id, values):
+        if self.timeout <= 0:
+            return
+        with self.lock:
+            if len(self.entries) >= self.max_entries:
+                self.entries.clear()
+            self.entries[user_id] = (time.monotonic() + self.timeout, values)
+
+    def delete(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+
+user_field_cache = UserFieldCache()
+
+
+def build_deferred(model, db, **values):
+    """Model instance with only the given fields loaded and every other field deferred"""
+    fields = model._meta.concrete_fields
+    instance = model.from_db(db, list(values), [values.get(field.attname, DEFERRED) for field in fields])
+    # Load the remaining fields together on first access instead of one query per field
+    instance.refresh_from_db = types.MethodType(load_deferred_fields, instance)
+    return instance
+
+
+def load_deferred_fields(instance, using=None, fields=None):
+    deferred_fields = instance.get_deferred_fields()
+    if fields is None or not deferred_fields or not set(fields) <= deferred_fields:
+        return Model.refresh_from_db(instance, using, fields)
+
+    if isinstance(instance, CustomUser):
+        values = user_field_cache.get(instance.pk)
+        if values is None:
+            attnames = [field.attname for field in CustomUser._meta.concrete_fields]
+            values = CustomUser._base_manager.using(using or instance._state.db).filter(
+                pk=instance.pk
+            ).values(*attnames).first()
+            if values is None:
+                raise AuthenticationFailed(_('User not found'), code='user_not_found')
+            user_field_cache.set(instance.pk, values)
+        for attname in deferred_fields:
+            setattr(instance, attname, values[attname])
+    else:
+        Model.refresh_from_db(instance, using, list(deferred_fields))
+
+
+def token_user(validated_token):
+    """
+    Build request.user from the access token claims without a query.
+
+    Claims that are missing or null are unknown rather than false (a profile
+    may have been created after the token was issued), so those fields and
+    relations are left to load from the database as usual. ``is_active`` is
+    not a claim either: it loads with the other fields, and a user the
+    in-process cache already knows to be inactive is rejected.
+    """
+    db = router.db_for_read(CustomUser)
+    user_id = uuid.UUID(str(validated_token[api_settings.USER_ID_CLAIM]))
+
+    cached_values = user_field_cache.get(user_id)
+    if cached_values is not None:
+        if not cached_values['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        user = CustomUser.from_db(db, list(cached_values), list(cached_values.values()))
+    else:
+        values = {'id': user_id, IS_STAFF_CLAIM: bool(validated_token.get(IS_STAFF_CLAIM))}
+        if validated_token.get(USER_TYPE_CLAIM):
+            values['user_type'] = validated_token[USER_TYPE_CLAIM]
+        user = build_deferred(CustomUser, db, **values)
+
+    for claim, model, accessor in (
+        (COMPANY_ID_CLAIM, Company, 'company_profile'),
+        (JOB_SEEKER_ID_CLAIM, JobSeeker, 'jobseeker_profile'),
+    ):
+        profile_id = validated_token.get(claim)
+        if profile_id:
+            profile = build_deferred(model, db, id=uuid.UUID(profile_id), user_id=user_id)
+            profile._state.fields_cache['user'] = user
+            user._state.fields_cache[accessor] = profile
+
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that skips the per-request user lookup.
+
+    Access tokens issued by ProfileRefreshToken carry the user's type, staff
+    flag and profile IDs, which is all ownership checks need. request.user is
+    built from those claims; any other field is loaded on first access, from
+    a short-lived in-process cache when possible. As with any stateless JWT,
+    a deactivated or deleted user keeps access until the access token
+    expires (unless that cache has seen the change); refreshing fails.
+    Tokens issued without the claims fall back to the regular lookup.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        if USER_TYPE_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        return token_user(validated_token)
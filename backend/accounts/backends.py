@@ -0,0 +1,24 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_login_failed
+
+
+class EmailPasswordBackend(ModelBackend):
+    """ModelBackend for email/password logins (email is the USERNAME_FIELD)"""
+
+    path = 'accounts.backends.EmailPasswordBackend'
+
+
+def authenticate_email_password(request, email, password):
+    """
+    Authenticate an email/password login with EmailPasswordBackend only.
+
+    django.contrib.auth.authenticate() walks every configured backend, so a
+    wrong password was also checked by the allauth backend, hashing it a
+    second time. Inactive users are rejected after a single hash too.
+    """
+    user = EmailPasswordBackend().authenticate(request, username=email, password=password)
+    if user is None:
+        user_login_failed.send(sender=__name__, credentials={'username': email}, request=request)
+        return None
+    user.backend = EmailPasswordBackend.path
+    return user
@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import weakref
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+USERINFO_CACHE_KEY = 'google:userinfo:{digest}'
+
+_session = None
+_session_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+class GoogleOAuthError(Exception):
+    """Google rejected the request (bad code or token)"""
+
+
+class GoogleUnavailable(GoogleOAuthError):
+    """Google could not be reached in time"""
+
+
+def get_session():
+    """
+    Process-wide requests session with a keep-alive connection pool.
+
+    Connection errors are retried for any method, since the request never
+    reached Google; read errors and 5xx responses only for GET, because an
+    authorization code can be redeemed once. Read timeouts are retried at
+    most once so a slow Google holds a worker for at most two read timeouts.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retries = Retry(
+                    total=settings.GOOGLE_OAUTH_RETRIES,
+                    read=min(settings.GOOGLE_OAUTH_RETRIES, 1),
+                    backoff_factor=0.2,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset({'GET'}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=settings.GOOGLE_OAUTH_POOL_SIZE,
+                    max_retries=retries,
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def request(method, url, **kwargs):
+    timeout = (settings.GOOGLE_OAUTH_CONNECT_TIMEOUT, settings.GOOGLE_OAUTH_READ_TIMEOUT)
+    try:
+        return get_session().request(method, url, timeout=timeout, **kwargs)
+    except requests.RequestException as e:
+        logger.warning('Google OAuth request to %s failed: %s', url, e)
+        raise GoogleUnavailable('Google is not reachable, please try again') from e
+
+
+def get_async_client():
+    """
+    httpx client for the running event loop, with the same pool size and timeouts.
+
+    An AsyncClient is bound to the loop it first ran on, so one is kept per
+    loop (a single long-lived loop per worker under uvicorn). Connection
+    failures are retried by the transport; see arequest for the rest.
+    """
+    # Imported here: only ASGI workers need httpx, and it pulls in anyio
+    # (and trio when installed), which would add ~100 ms to every startup
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        transport = httpx.AsyncHTTPTransport(
+            retries=settings.GOOGLE_OAUTH_RETRIES,
+            limits=httpx.Limits(
+                max_connections=settings.GOOGLE_OAUTH_POOL_SIZE,
+                max_keepalive_connections=settings.GOOGLE_OAUTH_POOL_SIZE,
+            ),
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(settings.GOOGLE_OAUTH_READ_TIMEOUT, connect=settings.GOOGLE_OAUTH_CONNECT_TIMEOUT),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def arequest(method, url, **kwargs):
+    """Async request(); GETs are retried once on a read timeout or a 5xx response"""
+    import httpx
+
+    attempts = 1 + (min(settings.GOOGLE_OAUTH_RETRIES, 1) if method == 'GET' else 0)
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            response = await get_async_client().request(method, url, **kwargs)
+        except httpx.ReadTimeout as e:
+            if last_attempt:
+                logger.warning('Google OAuth request to %s failed: %s', url, e)
+                raise GoogleUnavailable('Google is not reachable, please try again') from e
+            continue
+        except httpx.HTTPError as e:
+            logger.warning('Google OAuth request to %s failed: %s', url, e)
+            raise GoogleUnavailable('Google is not reachable, please try again') from e
+        if response.status_code < 500 or last_attempt:
+            return response
+        await asyncio.sleep(0.2)
+
+
+def token_request_data(code, redirect_uri):
+    app = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']
+    return {
+        'client_id': app['client_id'],
+        'client_secret': app['secret'],
+        'code': code,
+        'grant_type': 'authorization_code',
+        'redirect_uri': redirect_uri,
+    }
+
+
+def access_token_from(response):
+    if response.status_code != 200:
+        logger.warning('Google token exchange failed with HTTP %s: %s', response.status_code, response.text[:500])
+        raise GoogleOAuthError('Failed to exchange code for token')
+
+    access_token = response.json().get('access_token')
+    if not access_token:
+        raise GoogleOAuthError('No access token received from Google')
+    return access_token
+
+
+def userinfo_cache_key(access_token):
+    return USERINFO_CACHE_KEY.format(digest=hashlib.sha256(access_token.encode()).hexdigest())
+
+
+def userinfo_from(response):
+    if response.status_code != 200:
+        raise GoogleOAuthError('Invalid access token')
+    return response.json()
+
+
+def exchange_code(code, redirect_uri):
+    """Exchange an authorization code for a Google access token"""
+    response = request('POST', settings.GOOGLE_OAUTH_TOKEN_URL, data=token_request_data(code, redirect_uri))
+    return access_token_from(response)
+
+
+async def aexchange_code(code, redirect_uri):
+    response = await arequest('POST', settings.GOOGLE_OAUTH_TOKEN_URL, data=token_request_data(code, redirect_uri))
+    return access_token_from(response)
+
+
+def get_userinfo(access_token):
+    """
+    Verify a Google access token and return its userinfo.
+
+    Verified results are cached for GOOGLE_USERINFO_CACHE_TIMEOUT seconds under
+    a hash of the token, so retried or repeated logins skip the round trip.
+    """
+    key = userinfo_cache_key(access_token)
+    userinfo = cache.get(key)
+    if userinfo is not None:
+        return userinfo
+
+    response = request('GET', settings.GOOGLE_OAUTH_USERINFO_URL, headers={
+        'Authorization': f'Bearer {access_token}',
+    })
+    userinfo = userinfo_from(response)
+    cache.set(key, userinfo, settings.GOOGLE_USERINFO_CACHE_TIMEOUT)
+    return userinfo
+
+
+async def aget_userinfo(access_token):
+    key = userinfo_cache_key(access_token)
+    userinfo = await cache.aget(key)
+    if userinfo is not None:
+        return userinfo
+
+    response = await arequest('GET', settings.GOOGLE_OAUTH_USERINFO_URL, headers={
+        'Authorization': f'Bearer {access_token}',
+    })
+    userinfo = userinfo_from(response)
+    await cache.aset(key, userinfo, settings.GOOGLE_USERINFO_CACHE_TIMEOUT)
+    return userinfo
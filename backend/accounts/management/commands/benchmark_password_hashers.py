@@ -0,0 +1,70 @@
+import json
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, make_password
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+from jobs.benchmark import percentile
+
+
+class Command(BaseCommand):
+    help = (
+        'Time hashing and verifying a password with every PASSWORD_HASHER strategy '
+        'at the configured cost parameters and report the results as JSON'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Hash/verify rounds per hasher')
+        parser.add_argument('--password', default='correct horse battery staple')
+
+    def handle(self, *args, **options):
+        results = {}
+        for strategy, path in settings.PASSWORD_HASHER_STRATEGIES.items():
+            hasher = import_string(path)()
+            try:
+                results[strategy] = self.time_hasher(hasher, options['password'], options['iterations'])
+            except ValueError as e:
+                # The hasher's optional library (e.g. argon2-cffi) is not installed
+                results[strategy] = {'error': str(e)}
+                self.stderr.write(f'{strategy:<8} {e}')
+                continue
+            self.stderr.write(
+                f'{strategy:<8} hash p50 {results[strategy]["hash_ms"]["p50"]:>8.2f} ms  '
+                f'verify p50 {results[strategy]["verify_ms"]["p50"]:>8.2f} ms  '
+                f'{results[strategy]["verifications_per_second"]:>7.1f} logins/s per core'
+            )
+
+        self.stdout.write(json.dumps({
+            'preferred': settings.PASSWORD_HASHER,
+            'default_hasher': get_hasher('default').algorithm,
+            'iterations': options['iterations'],
+            'hashers': results,
+        }, indent=2))
+
+    def time_hasher(self, hasher, password, iterations):
+        hash_times, verify_times = [], []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            encoded = make_password(password, hasher=hasher)
+            hash_times.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            assert check_password(password, encoded)
+            verify_times.append((time.perf_counter() - started) * 1000)
+
+        hash_times.sort()
+        verify_times.sort()
+        mean_verify = sum(verify_times) / len(verify_times)
+        return {
+            'algorithm': hasher.algorithm,
+            'parameters': {
+                name: getattr(hasher, name)
+                for name in ('time_cost', 'memory_cost', 'parallelism', 'work_factor', 'block_size', 'iterations')
+                if hasattr(hasher, name)
+            },
+            'hash_ms': {'p50': round(percentile(hash_times, 50), 3), 'p95': round(percentile(hash_times, 95), 3)},
+            'verify_ms': {'p50': round(percentile(verify_times, 50), 3), 'p95': round(percentile(verify_times, 95), 3)},
+            'verifications_per_second': round(1000 / mean_verify, 1),
+        }
@@ -74,6 +74,12 @@ class CustomUser(AbstractUser):
             if len(name_parts) > 1:
                 self.last_name = name_parts[1]
         super().save(*args, **kwargs)
+    
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Admin changelist: default ordering and date_joined filter
+            models.Index(fields=['-date_joined', '-id'], name='user_date_joined_idx'),
+        ]
 
 
 class Company(models.Model):
@@ -2,18 +2,37 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import login
 from django.conf import settings
-from allauth.socialaccount.models import SocialAccount, SocialApp
-from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
-from allauth.socialaccount.providers.github.views import GitHubOAuth2Adapter
-import requests
+from .tokens import ProfileRefreshToken
+from allauth.socialaccount.models import SocialAccount
 
+from . import google
 from .models import CustomUser
 from .serializers import UserSerializer
 
 
+def login_payload(user):
+    """Refresh token and response body for a user who just signed in"""
+    refresh = ProfileRefreshToken.for_user(user)
+    return refresh, {
+        'access_token': str(refresh.access_token),
+        'user': UserSerializer(user).data,
+    }
+
+
+def set_refresh_cookie(response, refresh):
+    """Set the refresh token as an httpOnly cookie"""
+    response.set_cookie(
+        settings.SIMPLE_JWT_COOKIE_NAME,
+        str(refresh),
+        max_age=settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds(),
+        httponly=settings.SIMPLE_JWT_COOKIE_HTTP_ONLY,
+        secure=settings.SIMPLE_JWT_COOKIE_SECURE,
+        samesite=settings.SIMPLE_JWT_COOKIE_SAMESITE,
+        domain=settings.SIMPLE_JWT_COOKIE_DOMAIN,
+    )
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def google_oauth_login(request):
@@ -24,14 +43,13 @@ def google_oauth_login(request):
             return Response({'error': 'Access token is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         # Verify token with Google
-        google_response = requests.get(
-            f'https://www.googleapis.com/oauth2/v2/userinfo?access_token={access_token}'
-        )
-        
-        if google_response.status_code != 200:
-            return Response({'error': 'Invalid access token'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            google_data = google.get_userinfo(access_token)
+        except google.GoogleUnavailable as e:
+            return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except google.GoogleOAuthError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        google_data = google_response.json()
         email = google_data.get('email')
         name = google_data.get('name')
         google_id = google_data.get('id')
@@ -59,27 +77,9 @@ def google_oauth_login(request):
             }
         )
         
-        # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
-        access_token = refresh.access_token
-        
-        # Prepare response
-        response_data = {
-            'access_token': str(access_token),
-            'user': UserSerializer(user).data
-        }
-        
-        # Create response and set refresh token as httpOnly cookie
+        refresh, response_data = login_payload(user)
         response = Response(response_data, status=status.HTTP_200_OK)
-        response.set_cookie(
-            settings.SIMPLE_JWT_COOKIE_NAME,
-            str(refresh),
-            max_age=settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds(),
-            httponly=settings.SIMPLE_JWT_COOKIE_HTTP_ONLY,
-            secure=settings.SIMPLE_JWT_COOKIE_SECURE,
-            samesite=settings.SIMPLE_JWT_COOKIE_SAMESITE,
-            domain=settings.SIMPLE_JWT_COOKIE_DOMAIN,
-        )
+        set_refresh_cookie(response, refresh)
         
         return response
         
@@ -103,37 +103,17 @@ def google_token_exchange(request):
             return Response({'error': 'Authorization code is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         # Get Google client credentials from settings
-        google_client_id = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['client_id']
-        google_client_secret = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']['secret']
-        
-        # Debug logging for production
-        print(f"DEBUG: Google Client ID: {google_client_id[:20]}...")
-        print(f"DEBUG: Google Client Secret: {google_client_secret[:15]}...")
-        print(f"DEBUG: Redirect URI: {redirect_uri}")
-        print(f"DEBUG: Auth Code: {code[:20]}...")
-        
-        if not google_client_id or not google_client_secret:
+        google_app = settings.SOCIALACCOUNT_PROVIDERS['google']['APP']
+        if not google_app['client_id'] or not google_app['secret']:
             return Response({'error': 'Google OAuth not configured'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
         # Exchange code for access token with Google
-        token_response = requests.post("https://oauth2.googleapis.com/token", {
-            "client_id": google_client_id,
-            "client_secret": google_client_secret,
-            "code": code,
-            "grant_type": "authorization_code",
-            "redirect_uri": redirect_uri,
-        })
-        
-        if token_response.status_code != 200:
-            print(f"DEBUG: Google API Error Status: {token_response.status_code}")
-            print(f"DEBUG: Google API Error Response: {token_response.text}")
-            return Response({'error': 'Failed to exchange code for token'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        token_data = token_response.json()
-        access_token = token_data.get("access_token")
-        
-        if not access_token:
-            return Response({"error": "No access token received from Google"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            access_token = google.exchange_code(code, redirect_uri)
+        except google.GoogleUnavailable as e:
+            return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except google.GoogleOAuthError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({"access_token": access_token}, status=status.HTTP_200_OK)
         
@@ -1,10 +1,27 @@
 from rest_framework import serializers
-from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.utils import timezone
+from .authentication import user_field_cache
+from .backends import authenticate_email_password
+from monitoring.serializers import TimedSerializerMixin
 from .models import CustomUser, Company, JobSeeker
 
 
+def set_onboarded(user, user_type):
+    """Mark the user as onboarded as the given user type"""
+    now = timezone.now()
+    values = {
+        'user_type': user_type,
+        'onboarding_completed': True,
+        'last_onboarding_completed_at': now,
+        'updated_at': now,
+    }
+    CustomUser.objects.filter(pk=user.pk).update(**values)
+    user_field_cache.delete(user.pk)
+    for field, value in values.items():
+        setattr(user, field, value)
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration"""
     
@@ -21,6 +38,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = ('email', 'name', 'password', 'confirm_password')
+        # validate_email already checks uniqueness; skip the model's duplicate query
+        extra_kwargs = {'email': {'validators': []}}
     
     def validate_email(self, value):
         if CustomUser.objects.filter(email=value).exists():
@@ -55,25 +74,18 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
         
         if email and password:
-            user = authenticate(
-                request=self.context.get('request'),
-                username=email,
-                password=password
-            )
+            user = authenticate_email_password(self.context.get('request'), email, password)
             
             if not user:
                 raise serializers.ValidationError('Invalid email or password')
             
-            if not user.is_active:
-                raise serializers.ValidationError('User account is disabled')
-            
             attrs['user'] = user
             return attrs
         else:
             raise serializers.ValidationError('Must include email and password')
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for user profile"""
     company_name = serializers.SerializerMethodField()
     
@@ -92,7 +104,7 @@ class UserSerializer(serializers.ModelSerializer):
         return None
 
 
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for company profile"""
     
     class Meta:
@@ -107,16 +119,14 @@ class CompanySerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         company = Company.objects.create(user=user, **validated_data)
         
-        # Update user type and onboarding status
-        user.user_type = CustomUser.UserType.COMPANY
-        user.onboarding_completed = True
-        user.last_onboarding_completed_at = timezone.now()
-        user.save()
+        # Update user type and onboarding status with a targeted UPDATE, since
+        # request.user only carries the fields from its token claims
+        set_onboarded(user, CustomUser.UserType.COMPANY)
         
         return company
 
 
-class JobSeekerSerializer(serializers.ModelSerializer):
+class JobSeekerSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for job seeker profile"""
     
     class Meta:
@@ -131,10 +141,8 @@ class JobSeekerSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         job_seeker = JobSeeker.objects.create(user=user, **validated_data)
         
-        # Update user type and onboarding status
-        user.user_type = CustomUser.UserType.JOB_SEEKER
-        user.onboarding_completed = True
-        user.last_onboarding_completed_at = timezone.now()
-        user.save()
+        # Update user type and onboarding status with a targeted UPDATE, since
+        # request.user only carries the fields from its token claims
+        set_onboarded(user, CustomUser.UserType.JOB_SEEKER)
         
         return job_seeker
\ No newline at end of file
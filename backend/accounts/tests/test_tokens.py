@@ -0,0 +1,127 @@
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from accounts.authentication import ClaimsJWTAuthentication, user_field_cache
+from accounts.models import Company, CustomUser, JobSeeker
+from accounts.tokens import (
+    COMPANY_ID_CLAIM, IS_STAFF_CLAIM, JOB_SEEKER_ID_CLAIM, USER_TYPE_CLAIM, ProfileRefreshToken, refresh_tokens,
+)
+
+
+class TokenTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('tokens@example.com', 'tokens-password', user_type='COMPANY')
+        cls.company = Company.objects.create(
+            user=cls.user, name='Acme', location='Remote', website='https://acme.example.com',
+        )
+
+    def setUp(self):
+        user_field_cache.entries.clear()
+        self.addCleanup(user_field_cache.entries.clear)
+
+    def bearer_client(self, access_token):
+        client = APIClient(HTTP_HOST='localhost')
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        return client
+
+
+class ProfileClaimsTests(TokenTestCase):
+
+    def test_tokens_carry_the_profile_claims(self):
+        access = ProfileRefreshToken.for_user(self.user).access_token
+
+        self.assertEqual(access[USER_TYPE_CLAIM], 'COMPANY')
+        self.assertIs(access[IS_STAFF_CLAIM], False)
+        self.assertEqual(access[COMPANY_ID_CLAIM], str(self.company.pk))
+        self.assertIsNone(access[JOB_SEEKER_ID_CLAIM])
+
+    def test_requests_authenticate_from_the_claims(self):
+        client = self.bearer_client(ProfileRefreshToken.for_user(self.user).access_token)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/api/my-jobs/')
+
+        self.assertEqual(response.status_code, 200)
+        tables = (CustomUser._meta.db_table, Company._meta.db_table)
+        self.assertEqual([query['sql'] for query in queries if any(table in query['sql'] for table in tables)], [])
+
+    def test_tokens_without_claims_load_the_user(self):
+        client = self.bearer_client(RefreshToken.for_user(self.user).access_token)
+        self.assertEqual(client.get('/api/my-jobs/').status_code, 200)
+
+    def test_user_known_to_be_inactive_is_rejected(self):
+        access = ProfileRefreshToken.for_user(self.user).access_token
+        client = self.bearer_client(access)
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        # Reading a field the claims lack loads the row into the in-process cache
+        ClaimsJWTAuthentication().get_user(access).email
+
+        response = client.get('/api/my-jobs/')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'user_inactive')
+
+
+class RefreshTokenTests(TokenTestCase):
+
+    def login(self):
+        client = APIClient(HTTP_HOST='localhost')
+        response = client.post('/api/auth/login/', {'email': 'tokens@example.com', 'password': 'tokens-password'})
+        self.assertEqual(response.status_code, 200)
+        return client, response.json()['access_token']
+
+    def refresh(self, client):
+        return client.post('/api/auth/token/refresh/')
+
+    def test_round_trip_rotates_the_cookie(self):
+        client, access = self.login()
+        old_refresh = client.cookies[settings.SIMPLE_JWT_COOKIE_NAME].value
+
+        response = self.refresh(client)
+
+        self.assertEqual(response.status_code, 200)
+        new_refresh = response.cookies[settings.SIMPLE_JWT_COOKIE_NAME].value
+        self.assertNotEqual(new_refresh, old_refresh)
+        self.assertTrue(response.cookies[settings.SIMPLE_JWT_COOKIE_NAME]['httponly'])
+        new_access = AccessToken(response.json()['access_token'])
+        self.assertNotEqual(new_access['jti'], AccessToken(access)['jti'])
+        self.assertEqual(new_access[COMPANY_ID_CLAIM], str(self.company.pk))
+        self.assertEqual(RefreshToken(new_refresh)[COMPANY_ID_CLAIM], str(self.company.pk))
+        self.assertEqual(self.bearer_client(new_access).get('/api/my-jobs/').status_code, 200)
+
+    def test_refresh_rebuilds_the_claims(self):
+        client, access = self.login()
+        self.assertIsNone(AccessToken(access)[JOB_SEEKER_ID_CLAIM])
+        job_seeker = JobSeeker.objects.create(
+            user=self.user, name='Acme', about='About', resume='https://example.com/cv.pdf',
+        )
+        CustomUser.objects.filter(pk=self.user.pk).update(user_type='JOB_SEEKER', is_staff=True)
+
+        access = AccessToken(self.refresh(client).json()['access_token'])
+
+        self.assertEqual(access[JOB_SEEKER_ID_CLAIM], str(job_seeker.pk))
+        self.assertEqual(access[USER_TYPE_CLAIM], 'JOB_SEEKER')
+        self.assertIs(access[IS_STAFF_CLAIM], True)
+
+    def test_refresh_fails_for_inactive_and_deleted_users(self):
+        client, _ = self.login()
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.refresh(client).status_code, 401)
+
+        encoded = str(ProfileRefreshToken.for_user(self.user))
+        CustomUser.objects.filter(pk=self.user.pk).delete()
+        with self.assertRaisesMessage(TokenError, 'User not found'):
+            refresh_tokens(encoded)
+
+    def test_refresh_needs_a_valid_cookie(self):
+        client = APIClient(HTTP_HOST='localhost')
+        self.assertEqual(self.refresh(client).status_code, 401)
+        client.cookies[settings.SIMPLE_JWT_COOKIE_NAME] = 'not-a-token'
+        self.assertEqual(self.refresh(client).status_code, 401)
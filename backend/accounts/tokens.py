@@ -0,0 +1,138 @@
+from contextlib import nullcontext
+
+from django.apps import apps
+from django.db import transaction
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .models import CustomUser
+
+
+USER_TYPE_CLAIM = 'user_type'
+IS_STAFF_CLAIM = 'is_staff'
+COMPANY_ID_CLAIM = 'company_id'
+JOB_SEEKER_ID_CLAIM = 'job_seeker_id'
+
+BLACKLIST_APP = 'rest_framework_simplejwt.token_blacklist'
+
+
+def load_claims_user(user_id):
+    """The current user row with the fields and profile IDs the claims are built from, or None"""
+    return CustomUser.objects.select_related('company_profile', 'jobseeker_profile').only(
+        'id', 'user_type', 'is_staff', 'is_active', 'company_profile__id', 'jobseeker_profile__id'
+    ).filter(pk=user_id).first()
+
+
+def profile_claims(user):
+    """Claims describing the type and profiles of a user from load_claims_user()"""
+    company = getattr(user, 'company_profile', None)
+    job_seeker = getattr(user, 'jobseeker_profile', None)
+    return {
+        USER_TYPE_CLAIM: user.user_type,
+        IS_STAFF_CLAIM: user.is_staff,
+        COMPANY_ID_CLAIM: str(company.pk) if company else None,
+        JOB_SEEKER_ID_CLAIM: str(job_seeker.pk) if job_seeker else None,
+    }
+
+
+def get_profile_claims(user_id):
+    """
+    Claims describing the user's type and profiles, read with a single query.
+
+    Returns None if the user does not exist or is inactive.
+    """
+    user = load_claims_user(user_id)
+    if not api_settings.USER_AUTHENTICATION_RULE(user):
+        return None
+    return profile_claims(user)
+
+
+def blacklist_installed():
+    return apps.is_installed(BLACKLIST_APP)
+
+
+def blacklist_token(token, encoded):
+    """Blacklist a verified refresh token, reusing its encoded form instead of re-signing it"""
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+    outstanding, _ = OutstandingToken.objects.get_or_create(
+        jti=token[api_settings.JTI_CLAIM],
+        defaults={
+            'user_id': token.get(api_settings.USER_ID_CLAIM),
+            'token': encoded,
+            'expires_at': datetime_from_epoch(token['exp']),
+        },
+    )
+    BlacklistedToken.objects.get_or_create(token=outstanding)
+
+
+def record_outstanding_token(token, encoded):
+    from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+    OutstandingToken.objects.create(
+        user_id=token[api_settings.USER_ID_CLAIM],
+        jti=token[api_settings.JTI_CLAIM],
+        token=encoded,
+        created_at=token.current_time,
+        expires_at=datetime_from_epoch(token['exp']),
+    )
+
+
+class ProfileRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the user's type and profile IDs.
+
+    The claims are copied into every access token derived from it, which lets
+    ClaimsJWTAuthentication authenticate requests without loading the user.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim, value in (get_profile_claims(user.pk) or {}).items():
+            token[claim] = value
+        return token
+
+
+def refresh_tokens(encoded_refresh):
+    """
+    Single-pass refresh of an encoded refresh token.
+
+    The token is decoded and verified once, the user is reloaded and its
+    claims rebuilt from the current row (so a changed user type or a profile
+    created since login reaches the access token, whatever the old token
+    said), it is rotated once, and with the blacklist app installed the old
+    token is blacklisted and the new one recorded in one transaction.
+    Returns ``(access, encoded_refresh)``; the refresh token is None when
+    rotation is off. Raises TokenError for invalid tokens and for users that
+    were deleted or deactivated.
+    """
+    refresh = ProfileRefreshToken(encoded_refresh)
+
+    user = load_claims_user(refresh[api_settings.USER_ID_CLAIM])
+    if user is None:
+        raise TokenError('User not found')
+    if not api_settings.USER_AUTHENTICATION_RULE(user):
+        raise TokenError('User is inactive')
+    for claim, value in profile_claims(user).items():
+        refresh[claim] = value
+
+    if not api_settings.ROTATE_REFRESH_TOKENS:
+        return refresh.access_token, None
+
+    use_blacklist = blacklist_installed()
+    with transaction.atomic() if use_blacklist else nullcontext():
+        if use_blacklist and api_settings.BLACKLIST_AFTER_ROTATION:
+            blacklist_token(refresh, encoded_refresh)
+
+        refresh.set_jti()
+        refresh.set_exp()
+        refresh.set_iat()
+        rotated = str(refresh)
+
+        if use_blacklist:
+            record_outstanding_token(refresh, rotated)
+
+    return refresh.access_token, rotated
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     UserRegistrationView,
@@ -10,7 +11,11 @@ from .views import (
     CreateCompanyView,
     CreateJobSeekerView,
 )
-from .oauth_views import google_oauth_login, google_token_exchange
+
+if settings.ASYNC_VIEWS:
+    from .async_views import google_oauth_login, google_token_exchange
+else:
+    from .oauth_views import google_oauth_login, google_token_exchange
 
 urlpatterns = [
     # Authentication endpoints
@@ -4,11 +4,13 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-from django.contrib.auth import login
+from rest_framework_simplejwt.settings import api_settings
+from django.contrib.auth.models import update_last_login
 from django.utils import timezone
 from django.conf import settings
 
 from .models import CustomUser, Company, JobSeeker
+from .tokens import ProfileRefreshToken, blacklist_installed, blacklist_token, refresh_tokens
 from rest_framework import serializers
 from .serializers import (
     UserRegistrationSerializer,
@@ -33,7 +35,7 @@ class UserRegistrationView(generics.CreateAPIView):
             user = serializer.save()
             
             # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            refresh = ProfileRefreshToken.for_user(user)
             access_token = refresh.access_token
             
             # Prepare response
@@ -80,10 +82,12 @@ class UserLoginView(generics.GenericAPIView):
         serializer.is_valid(raise_exception=True)
         
         user = serializer.validated_data['user']
-        login(request, user)
+        # The API is session-less, so only record the login (no django.contrib.auth.login)
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
         
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = ProfileRefreshToken.for_user(user)
         access_token = refresh.access_token
         
         # Prepare response
@@ -120,37 +124,28 @@ class CookieTokenRefreshView(TokenRefreshView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        # Add refresh token to request data
-        request.data._mutable = True
-        request.data['refresh'] = refresh_token
-        request.data._mutable = False
-        
+        # Decode, rotate and sign once; the cookie gets exactly the rotated token
         try:
-            response = super().post(request, *args, **kwargs)
-            
-            # If successful, set new refresh token in cookie (rotation enabled)
-            if response.status_code == 200:
-                # Get new refresh token if rotation is enabled
-                refresh = RefreshToken(refresh_token)
-                new_refresh = refresh.rotate() if settings.SIMPLE_JWT.get('ROTATE_REFRESH_TOKENS') else refresh
-                
-                response.set_cookie(
-                    settings.SIMPLE_JWT_COOKIE_NAME,
-                    str(new_refresh),
-                    max_age=settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds(),
-                    httponly=settings.SIMPLE_JWT_COOKIE_HTTP_ONLY,
-                    secure=settings.SIMPLE_JWT_COOKIE_SECURE,
-                    samesite=settings.SIMPLE_JWT_COOKIE_SAMESITE,
-                    domain=settings.SIMPLE_JWT_COOKIE_DOMAIN,
-                )
-            
-            return response
-            
-        except (InvalidToken, TokenError) as e:
+            access_token, new_refresh_token = refresh_tokens(refresh_token)
+        except TokenError:
             return Response(
                 {'error': 'Invalid refresh token'}, 
                 status=status.HTTP_401_UNAUTHORIZED
             )
+        
+        response = Response({'access_token': str(access_token)}, status=status.HTTP_200_OK)
+        if new_refresh_token:
+            response.set_cookie(
+                settings.SIMPLE_JWT_COOKIE_NAME,
+                new_refresh_token,
+                max_age=settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds(),
+                httponly=settings.SIMPLE_JWT_COOKIE_HTTP_ONLY,
+                secure=settings.SIMPLE_JWT_COOKIE_SECURE,
+                samesite=settings.SIMPLE_JWT_COOKIE_SAMESITE,
+                domain=settings.SIMPLE_JWT_COOKIE_DOMAIN,
+            )
+        
+        return response
 
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
@@ -160,7 +155,8 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_object(self):
-        return self.request.user
+        # request.user is built from token claims; read the current row
+        return CustomUser.objects.select_related('company_profile').get(pk=self.request.user.pk)
 
 
 @api_view(['POST'])
@@ -168,7 +164,7 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
 def complete_onboarding(request):
     """Mark user's onboarding as completed"""
     
-    user = request.user
+    user = CustomUser.objects.get(pk=request.user.pk)
     user.onboarding_completed = True
     user.last_onboarding_completed_at = timezone.now()
     user.save()
@@ -183,7 +179,7 @@ def complete_onboarding(request):
 def reset_onboarding(request):
     """Reset user's onboarding status (optional endpoint)"""
     
-    user = request.user
+    user = CustomUser.objects.get(pk=request.user.pk)
     user.onboarding_completed = False
     user.save()
     
@@ -200,10 +196,9 @@ def logout_view(request):
     # Get refresh token from cookie and blacklist it
     refresh_token = request.COOKIES.get(settings.SIMPLE_JWT_COOKIE_NAME)
     
-    if refresh_token:
+    if refresh_token and blacklist_installed():
         try:
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+            blacklist_token(RefreshToken(refresh_token), refresh_token)
         except (InvalidToken, TokenError):
             pass  # Token was already invalid
     
@@ -0,0 +1,105 @@
+"""
+Gunicorn settings, read automatically when gunicorn starts in this directory:
+
+    gunicorn                                  # threaded WSGI workers
+    GUNICORN_WORKER_CLASS=uvicorn gunicorn    # ASGI (async views)
+    GUNICORN_WORKER_CLASS=gevent gunicorn     # needs gevent and psycogreen installed
+
+Every setting can be overridden from the environment. The app is preloaded
+in the master, so Django setup, model and URLconf imports happen once and
+are shared by all workers through fork; recycled workers start instantly.
+Release tasks (migrate, create_superuser) are not run here: run them once per
+deploy, before the new containers start (see the Dockerfile).
+"""
+import os
+
+import decouple
+
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'gevent': 'gevent',
+    'uvicorn': 'uvicorn.workers.UvicornWorker',
+}
+
+
+def available_cpus():
+    # Honours CPU affinity (e.g. taskset), unlike os.cpu_count()
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+kind = decouple.config('GUNICORN_WORKER_CLASS', default='gthread')
+if kind not in WORKER_CLASSES:
+    raise ValueError(f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}, not {kind!r}')
+
+if kind == 'gevent':
+    # Optional dependencies, not in requirements.txt: without psycogreen every
+    # query would block the whole worker, so both are required
+    try:
+        from gevent import monkey
+        from psycogreen.gevent import patch_psycopg
+    except ImportError as error:
+        raise RuntimeError(
+            'GUNICORN_WORKER_CLASS=gevent needs the gevent and psycogreen packages '
+            f'(pip install gevent psycogreen): {error}'
+        ) from error
+    # Patch before the app is preloaded, so Django and the database driver
+    # are imported on top of the cooperative socket and threading modules
+    monkey.patch_all()
+    patch_psycopg()
+
+worker_class = WORKER_CLASSES[kind]
+wsgi_app = 'worknest.asgi:application' if kind == 'uvicorn' else 'worknest.wsgi:application'
+
+bind = f'0.0.0.0:{decouple.config("PORT", default=8000, cast=int)}'
+
+# Blocking sync workers need more processes per CPU; threaded, gevent and
+# uvicorn workers overlap I/O within a process
+workers = decouple.config(
+    'WEB_CONCURRENCY', default=available_cpus() * 2 + 1 if kind == 'sync' else available_cpus() + 1, cast=int,
+)
+threads = decouple.config('GUNICORN_THREADS', default=4 if kind == 'gthread' else 1, cast=int)
+worker_connections = decouple.config('GUNICORN_WORKER_CONNECTIONS', default=100, cast=int)
+
+# One pooled database connection per thread (see DB_POOL)
+if kind in ('sync', 'gthread') and decouple.config('DB_POOL_MAX_SIZE', default=None) is None:
+    os.environ['DB_POOL_MAX_SIZE'] = str(threads)
+
+preload_app = decouple.config('GUNICORN_PRELOAD', default=True, cast=bool)
+
+# Recycle workers after a random number of requests around max_requests so
+# they do not all restart at once; in-flight requests get graceful_timeout
+max_requests = decouple.config('GUNICORN_MAX_REQUESTS', default=1000, cast=int)
+max_requests_jitter = decouple.config('GUNICORN_MAX_REQUESTS_JITTER', default=max_requests // 10, cast=int)
+timeout = decouple.config('GUNICORN_TIMEOUT', default=30, cast=int)
+graceful_timeout = decouple.config('GUNICORN_GRACEFUL_TIMEOUT', default=30, cast=int)
+keepalive = decouple.config('GUNICORN_KEEPALIVE', default=5, cast=int)
+
+# Worker heartbeats go to a file; keep it in memory rather than on the
+# container's overlay filesystem
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = decouple.config('GUNICORN_ACCESS_LOG', default='-')
+errorlog = '-'
+
+
+def when_ready(server):
+    """Finish loading the preloaded app in the master, before the first fork"""
+    if not server.cfg.preload_app:
+        return
+    from django.db import connections
+    from django.urls import get_resolver
+
+    # Import the URLconf (and with it every view) and build the reverse
+    # lookup tables once, instead of on each worker's first request
+    get_resolver().reverse_dict
+    if kind == 'uvicorn':
+        # Used lazily by the async Google OAuth views
+        import httpx  # noqa: F401
+    # Workers must not share a database connection opened while loading
+    connections.close_all()
@@ -1,19 +1,28 @@
 from django.contrib import admin
+from django.db import transaction
+from worknest.paginator import EstimatedCountPaginator
 from .models import JobPost, SavedJobPost
+from . import stats
+from .cache import invalidate_job_feed
 
 
 @admin.register(JobPost)
 class JobPostAdmin(admin.ModelAdmin):
     list_display = ('job_title', 'get_company_name', 'location', 'employment_type', 'status', 'salary_range', 'applications', 'created_at')
-    list_filter = ('status', 'employment_type', 'location', 'created_at', 'listing_duration')
+    # Only filters that need no SELECT DISTINCT over the whole table
+    list_filter = ('status', 'created_at')
     search_fields = ('job_title', 'company__name', 'location', 'job_description')
     readonly_fields = ('created_at', 'updated_at', 'id')
+    raw_id_fields = ('company',)
+    list_select_related = ('company',)
     list_per_page = 25
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_editable = ('status',)
     date_hierarchy = 'created_at'
     
     def get_company_name(self, obj):
-        return obj.company.name if obj.company else 'No Company'
+        return obj.company.name
     get_company_name.short_description = 'Company'
     get_company_name.admin_order_field = 'company__name'
     
@@ -28,19 +37,30 @@ class JobPostAdmin(admin.ModelAdmin):
     
     actions = ['activate_jobs', 'draft_jobs', 'expire_jobs']
     
+    def set_status(self, queryset, status):
+        """Update the selected jobs' status, keeping the stats and cached feeds in step"""
+        with transaction.atomic():
+            # Read before the update: in a changelist filtered on status the
+            # queryset no longer matches the rows once they have changed
+            company_ids = list(queryset.order_by().values_list('company_id', flat=True).distinct())
+            updated = stats.bulk_update(queryset, status=status)
+        if updated:
+            invalidate_job_feed(company_ids)
+        return updated
+    
     def activate_jobs(self, request, queryset):
-        queryset.update(status='ACTIVE')
-        self.message_user(request, f"{queryset.count()} jobs activated")
+        updated = self.set_status(queryset, 'ACTIVE')
+        self.message_user(request, f"{updated} jobs activated")
     activate_jobs.short_description = "Activate selected jobs"
     
     def draft_jobs(self, request, queryset):
-        queryset.update(status='DRAFT')
-        self.message_user(request, f"{queryset.count()} jobs moved to draft")
+        updated = self.set_status(queryset, 'DRAFT')
+        self.message_user(request, f"{updated} jobs moved to draft")
     draft_jobs.short_description = "Move selected jobs to draft"
     
     def expire_jobs(self, request, queryset):
-        queryset.update(status='EXPIRED')
-        self.message_user(request, f"{queryset.count()} jobs expired")
+        updated = self.set_status(queryset, 'EXPIRED')
+        self.message_user(request, f"{updated} jobs expired")
     expire_jobs.short_description = "Expire selected jobs"
     
     fieldsets = (
@@ -66,6 +86,7 @@ class SavedJobPostAdmin(admin.ModelAdmin):
     list_filter = ('created_at',)
     search_fields = ('user__email', 'job__job_title', 'job__company__name')
     readonly_fields = ('created_at', 'updated_at')
-    
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related('user', 'job', 'job__company')
\ No newline at end of file
+    raw_id_fields = ('user', 'job')
+    list_select_related = ('user', 'job', 'job__company')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
\ No newline at end of file
@@ -0,0 +1,63 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponseNotModified
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import APIException
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from worknest.async_api import authenticate, error_response, json_response
+
+from .cache import aget_feed_version, feed_cache_key, make_etag, not_modified
+from .stats import aget_totals
+from .views import JobPostListCreateView
+
+
+# Async versions of the job feed and stats endpoints, routed instead of the
+# DRF ones when ASYNC_VIEWS is on (ASGI mode)
+
+job_list_create_view = JobPostListCreateView.as_view()
+
+
+def anonymous_feed_request(request):
+    return (
+        getattr(settings, 'JOB_FEED_CACHE_TIMEOUT', 0) > 0
+        and request.method in ('GET', 'HEAD')
+        and jwt_settings.AUTH_HEADER_NAME not in request.META
+    )
+
+
+@csrf_exempt
+async def job_list_create(request):
+    """
+    List all job posts or create a new one.
+
+    Cached anonymous feed pages are served straight from the event loop.
+    Cache misses, authenticated requests and job creation go through the
+    DRF view in a worker thread, which filters, paginates and fills the cache.
+    """
+    if anonymous_feed_request(request):
+        key = feed_cache_key(await aget_feed_version(), request)
+        etag = make_etag(key)
+        if not_modified(request, etag):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+
+        data = await cache.aget(key)
+        if data is not None:
+            return json_response(data, headers={'ETag': etag})
+
+    return await sync_to_async(job_list_create_view)(request)
+
+
+@require_GET
+async def job_post_stats(request):
+    """Get general job posting statistics"""
+    try:
+        await authenticate(request)
+    except APIException as e:
+        return error_response(e, request)
+
+    return json_response(await aget_totals())
@@ -0,0 +1,323 @@
+import json
+import math
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import requests
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import CustomUser
+from .models import JobApplication, JobPost, SavedJobPost
+from .synthetic import DEFAULT_PASSWORD
+
+
+LOGIN_PATH = '/api/auth/login/'
+REFRESH_PATH = '/api/auth/token/refresh/'
+SEARCH_TERMS = ['python', 'engineer', 'senior data', 'remote', 'kubernetes', 'product manager']
+SERVER_TIMING_QUERIES = re.compile(r'\bdb;[^,]*desc="(\d+) queries"')
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class ClientTransport:
+    """Drive the API in-process through the Django test client, counting queries directly"""
+
+    supports_concurrency = False
+
+    def __init__(self, host='localhost'):
+        # Server errors are reported as failed requests instead of aborting the run
+        self.client = Client(raise_request_exception=False, HTTP_HOST=host)
+        self.headers = {}
+
+    def authenticate(self, access_token):
+        self.headers['Authorization'] = f'Bearer {access_token}'
+
+    def request(self, method, path, data=None):
+        body = json.dumps(data) if data is not None else ''
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.generic(
+                method, path, body, content_type='application/json', headers=self.headers,
+            )
+        try:
+            payload = json.loads(response.content) if response.content else None
+        except ValueError:
+            payload = None
+        return response.status_code, payload, len(queries.captured_queries)
+
+
+class HTTPTransport:
+    """Drive a running server (e.g. a local gunicorn) over HTTP with a keep-alive session"""
+
+    supports_concurrency = True
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def authenticate(self, access_token):
+        self.session.headers['Authorization'] = f'Bearer {access_token}'
+
+    def clone(self):
+        transport = HTTPTransport(self.base_url, self.timeout)
+        transport.session.headers.update(self.session.headers)
+        transport.session.cookies.update(self.session.cookies)
+        return transport
+
+    def request(self, method, path, data=None):
+        response = self.session.request(method, self.base_url + path, json=data, timeout=self.timeout)
+        try:
+            payload = response.json() if response.content else None
+        except ValueError:
+            payload = None
+        # Query counts come from the Server-Timing header set by RequestMetricsMiddleware
+        match = SERVER_TIMING_QUERIES.search(response.headers.get('Server-Timing', ''))
+        return response.status_code, payload, int(match.group(1)) if match else None
+
+
+@dataclass
+class BenchmarkState:
+    """Users and objects the scenarios run against"""
+
+    seeker_email: str
+    company_email: str
+    password: str
+    job_ids: list
+    save_job_ids: list
+    apply_job_ids: list
+    saved_ids: list = field(default_factory=list)
+
+
+@dataclass
+class Scenario:
+    """
+    A benchmarked endpoint.
+
+    ``build(state, iteration)`` returns ``(method, path, data)``, or None once
+    the scenario has run out of objects to work on; ``after(state, payload)``
+    is called with every successful response.
+    """
+
+    name: str
+    user: Optional[str]
+    build: Callable
+    after: Optional[Callable] = None
+    concurrent: bool = True
+
+
+def cycle(values, iteration):
+    return values[iteration % len(values)] if values else None
+
+
+def job_detail(state, i):
+    job_id = cycle(state.job_ids, i)
+    if job_id is None:
+        return None
+    return 'GET', f'/api/jobs/{job_id}/', None
+
+
+def save_job(state, i):
+    if i >= len(state.save_job_ids):
+        return None
+    return 'POST', f'/api/jobs/{state.save_job_ids[i]}/save/', None
+
+
+def remember_saved_job(state, payload):
+    if payload and 'saved_job' in payload:
+        state.saved_ids.append(payload['saved_job']['id'])
+
+
+def unsave_job(state, i):
+    if not state.saved_ids:
+        return None
+    return 'DELETE', f'/api/saved-jobs/{state.saved_ids.pop()}/remove/', None
+
+
+def apply_to_job(state, i):
+    if i >= len(state.apply_job_ids):
+        return None
+    return 'POST', f'/api/jobs/{state.apply_job_ids[i]}/apply/', {'cover_letter': 'Benchmark application'}
+
+
+def login(state, i):
+    return 'POST', LOGIN_PATH, {'email': state.seeker_email, 'password': state.password}
+
+
+SCENARIOS = [
+    Scenario('jobs.feed.anonymous', None, lambda state, i: ('GET', '/api/jobs/', None)),
+    Scenario('jobs.feed', 'seeker', lambda state, i: ('GET', '/api/jobs/', None)),
+    Scenario('jobs.feed.cursor', 'seeker', lambda state, i: ('GET', '/api/jobs/?pagination=cursor', None)),
+    Scenario('jobs.search', 'seeker', lambda state, i: ('GET', f'/api/jobs/?search={cycle(SEARCH_TERMS, i)}', None)),
+    Scenario('jobs.filter', 'seeker', lambda state, i: ('GET', '/api/jobs/?employment_type=Full-time&location=Remote', None)),
+    Scenario('jobs.order', 'seeker', lambda state, i: ('GET', '/api/jobs/?ordering=-salary_from', None)),
+    Scenario('jobs.detail', 'seeker', job_detail),
+    Scenario('jobs.save', 'seeker', save_job, after=remember_saved_job, concurrent=False),
+    Scenario('jobs.unsave', 'seeker', unsave_job, concurrent=False),
+    Scenario('jobs.apply', 'seeker', apply_to_job, concurrent=False),
+    Scenario('applications.mine', 'seeker', lambda state, i: ('GET', '/api/my-applications/', None)),
+    Scenario('applications.company', 'company', lambda state, i: ('GET', '/api/company-applications/', None)),
+    Scenario('auth.login', None, login),
+    Scenario('auth.refresh', 'seeker', lambda state, i: ('POST', REFRESH_PATH, None), concurrent=False),
+]
+
+
+def build_state(prefix='synthetic', password=DEFAULT_PASSWORD, max_objects=1000):
+    """Pick the busiest synthetic job seeker and company, like the heaviest real users"""
+    seekers = CustomUser.objects.filter(
+        email__startswith=f'{prefix}-', user_type=CustomUser.UserType.JOB_SEEKER,
+    )
+    seeker = seekers.annotate(applied=Count('job_applications')).order_by('-applied', 'email').first()
+    company_id = (
+        JobApplication.objects.filter(job__company__user__email__startswith=f'{prefix}-')
+        .order_by().values('job__company').annotate(applications=Count('id'))
+        .order_by('-applications').values_list('job__company', flat=True).first()
+    )
+    company = CustomUser.objects.filter(company_profile__id=company_id).first()
+    if seeker is None or company is None:
+        raise BenchmarkError(
+            f'No synthetic users with prefix "{prefix}"; run generate_synthetic_data first or use --generate'
+        )
+
+    active = JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE).order_by('-created_at')
+    return BenchmarkState(
+        seeker_email=seeker.email,
+        company_email=company.email,
+        password=password,
+        job_ids=[str(pk) for pk in active.values_list('pk', flat=True)[:max_objects]],
+        save_job_ids=[str(pk) for pk in active.exclude(
+            pk__in=SavedJobPost.objects.filter(user=seeker).values('job')
+        ).values_list('pk', flat=True)[:max_objects]],
+        apply_job_ids=[str(pk) for pk in active.exclude(
+            pk__in=JobApplication.objects.filter(user=seeker).values('job')
+        ).values_list('pk', flat=True)[:max_objects]],
+    )
+
+
+def summarize(samples, elapsed):
+    """Throughput, latency percentiles and query counts of one scenario"""
+    latencies = sorted(latency for latency, _, _ in samples)
+    queries = [count for _, count, _ in samples if count is not None]
+    errors = sum(1 for _, _, status in samples if status >= 400)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput_rps': round(len(samples) / elapsed, 2) if elapsed and samples else None,
+        'latency_ms': {
+            'mean': round(sum(latencies) / len(latencies), 3) if latencies else None,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': latencies[-1] if latencies else None,
+        },
+        'queries': {
+            'mean': round(sum(queries) / len(queries), 2) if queries else None,
+            'max': max(queries) if queries else None,
+        },
+    }
+
+
+class BenchmarkRunner:
+    """Run every scenario a fixed number of times and collect per-request samples"""
+
+    def __init__(self, make_transport, state, requests_per_scenario=50, warmup=5, concurrency=1):
+        self.make_transport = make_transport
+        self.state = state
+        self.requests_per_scenario = requests_per_scenario
+        self.warmup = warmup
+        self.concurrency = concurrency
+        self.transports = {}
+
+    def transport_for(self, user):
+        if user not in self.transports:
+            transport = self.make_transport()
+            if user is not None:
+                email = self.state.seeker_email if user == 'seeker' else self.state.company_email
+                status, payload, _ = transport.request(
+                    'POST', LOGIN_PATH, {'email': email, 'password': self.state.password},
+                )
+                if status != 200:
+                    raise BenchmarkError(f'Could not log in as {email} (HTTP {status})')
+                transport.authenticate(payload['access_token'])
+            self.transports[user] = transport
+        return self.transports[user]
+
+    def execute(self, scenario, transport, iteration):
+        request = scenario.build(self.state, iteration)
+        if not request:
+            return None
+        method, path, data = request
+        started = time.perf_counter()
+        status, payload, queries = transport.request(method, path, data)
+        latency = round((time.perf_counter() - started) * 1000, 3)
+        if scenario.after is not None and status < 400:
+            scenario.after(self.state, payload)
+        return latency, queries, status
+
+    def run_scenario(self, scenario):
+        transport = self.transport_for(scenario.user)
+        for iteration in range(self.warmup):
+            self.execute(scenario, transport, iteration)
+
+        iterations = range(self.warmup, self.warmup + self.requests_per_scenario)
+        started = time.perf_counter()
+        if self.concurrency > 1 and scenario.concurrent and transport.supports_concurrency:
+            chunks = [iterations[worker::self.concurrency] for worker in range(self.concurrency)]
+            with ThreadPoolExecutor(self.concurrency) as executor:
+                results = executor.map(
+                    lambda chunk: self.run_chunk(scenario, transport.clone(), chunk), chunks,
+                )
+                samples = [sample for chunk in results for sample in chunk]
+        else:
+            samples = self.run_chunk(scenario, transport, iterations)
+        elapsed = time.perf_counter() - started
+        return summarize(samples, elapsed)
+
+    def run_chunk(self, scenario, transport, iterations):
+        samples = []
+        for iteration in iterations:
+            sample = self.execute(scenario, transport, iteration)
+            if sample is None:
+                break
+            samples.append(sample)
+        return samples
+
+    def run(self, scenarios=SCENARIOS, progress=None):
+        results = {}
+        for scenario in scenarios:
+            results[scenario.name] = self.run_scenario(scenario)
+            if progress is not None:
+                progress(scenario.name, results[scenario.name])
+        return results
+
+
+def compare_results(baseline, current):
+    """Per-scenario change of p50/p95 latency and mean query count against a baseline run"""
+    comparison = {}
+    for name, result in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        row = {}
+        for metric in ('p50', 'p95'):
+            old, new = before['latency_ms'][metric], result['latency_ms'][metric]
+            row[f'{metric}_change_pct'] = round((new - old) / old * 100, 1) if old and new is not None else None
+        row['queries_before'] = before['queries']['mean']
+        row['queries_after'] = result['queries']['mean']
+        comparison[name] = row
+    return comparison
@@ -0,0 +1,175 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+FEED_VERSION_KEY = 'jobs:feed:version'
+COMPANY_VERSION_KEY = 'jobs:company:{company_id}:version'
+
+
+def new_version():
+    # Time based so a version key that was evicted never restarts at a value
+    # an older cache entry may still carry
+    return time.time_ns()
+
+
+def get_version(key):
+    version = cache.get(key)
+    if version is None:
+        version = new_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+async def aget_version(key):
+    version = await cache.aget(key)
+    if version is None:
+        version = new_version()
+        if not await cache.aadd(key, version, timeout=None):
+            version = await cache.aget(key, version)
+    return version
+
+
+def bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, new_version(), timeout=None)
+
+
+def get_feed_version():
+    return get_version(FEED_VERSION_KEY)
+
+
+async def aget_feed_version():
+    return await aget_version(FEED_VERSION_KEY)
+
+
+def get_company_version(company_id):
+    return get_version(COMPANY_VERSION_KEY.format(company_id=company_id))
+
+
+def invalidate_job_feed(company_ids=()):
+    """Invalidate cached feed pages and the job details of the given companies"""
+    bump_version(FEED_VERSION_KEY)
+    for company_id in set(company_ids):
+        bump_version(COMPANY_VERSION_KEY.format(company_id=company_id))
+
+
+def normalize_query_params(query_params):
+    """Return a canonical, order-independent representation of the query string"""
+    return '&'.join(
+        f'{key}={value}'
+        for key in sorted(query_params)
+        for value in sorted(query_params.getlist(key))
+        if value != ''
+    )
+
+
+def query_params_hash(query_params):
+    """
+    Digest of the normalized query string for use in cache keys: shared
+    backends such as memcached reject keys with spaces or over 250
+    characters, and search terms and field lists bring both.
+    """
+    return hashlib.sha1(normalize_query_params(query_params).encode('utf-8')).hexdigest()
+
+
+def feed_cache_key(version, request):
+    return f'jobs:feed:{version}:{request.get_host()}:{query_params_hash(request.GET)}'
+
+
+def detail_cache_key(pk, request):
+    return f'jobs:detail:{pk}:{query_params_hash(request.GET)}'
+
+
+def make_etag(*parts):
+    digest = hashlib.sha1(':'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+
+def cacheable_request(request):
+    return (
+        getattr(settings, 'JOB_FEED_CACHE_TIMEOUT', 0) > 0
+        and request.method in ('GET', 'HEAD')
+        and not request.user.is_authenticated
+    )
+
+
+def not_modified(request, etag):
+    if_none_match = request.headers.get('If-None-Match')
+    return bool(if_none_match) and etag in parse_etags(if_none_match)
+
+
+def cached_response(request, data, etag):
+    if not_modified(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    return Response(data, headers={'ETag': etag})
+
+
+class JobFeedCacheMixin:
+    """
+    Cache anonymous job feed and job detail responses.
+
+    Feed pages are keyed on the normalized query string and a global feed
+    version; job details (keyed on the job and the query string, which may
+    select fields) are stored with their company's version and
+    revalidated against it on read. Both versions are bumped by the JobPost
+    and Company signal handlers, so entries never need to be deleted
+    explicitly. Responses carry an ETag and honour If-None-Match.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not cacheable_request(request):
+            return super().list(request, *args, **kwargs)
+
+        key = feed_cache_key(get_feed_version(), request)
+        etag = make_etag(key)
+
+        if not_modified(request, etag):
+            return cached_response(request, None, etag)
+
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            cache.set(key, data, settings.JOB_FEED_CACHE_TIMEOUT)
+
+        return cached_response(request, data, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not cacheable_request(request):
+            return super().retrieve(request, *args, **kwargs)
+
+        key = detail_cache_key(kwargs[self.lookup_url_kwarg or self.lookup_field], request)
+        entry = cache.get(key)
+        company_id = version = None
+        if entry is not None:
+            company_id = entry['company_id']
+            version = get_company_version(company_id)
+            if entry['version'] == version:
+                return cached_response(request, entry['data'], entry['etag'])
+
+        # The version is read before the data so a concurrent write can never
+        # leave stale data cached under the newer version
+        instance = self.get_object()
+        if instance.company_id != company_id:
+            version = get_company_version(instance.company_id)
+
+        entry = {
+            'company_id': instance.company_id,
+            'version': version,
+            'etag': make_etag(key, version),
+            'data': self.get_serializer(instance).data,
+        }
+        cache.set(key, entry, settings.JOB_FEED_CACHE_TIMEOUT)
+
+        return cached_response(request, entry['data'], entry['etag'])
@@ -0,0 +1,37 @@
+import json
+from html import unescape
+
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+
+EXCERPT_LENGTH = 280
+
+# TipTap nodes whose children are inline text, joined without a separator
+TEXT_BLOCKS = {'paragraph', 'heading', 'codeBlock'}
+
+
+def tiptap_text(node):
+    if node.get('type') == 'text':
+        return node.get('text', '')
+    if node.get('type') == 'hardBreak':
+        return ' '
+    children = [tiptap_text(child) for child in node.get('content') or [] if isinstance(child, dict)]
+    return ('' if node.get('type') in TEXT_BLOCKS else ' ').join(children)
+
+
+def plain_text(description):
+    """Plain text of a job description stored as TipTap JSON, HTML or text"""
+    try:
+        document = json.loads(description)
+    except (TypeError, ValueError):
+        document = None
+    if isinstance(document, dict):
+        text = tiptap_text(document)
+    else:
+        text = unescape(strip_tags(description or ''))
+    return ' '.join(text.split())
+
+
+def make_excerpt(description):
+    return Truncator(plain_text(description)).chars(EXCERPT_LENGTH)
@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.utils import timezone
+
+from . import stats
+from .cache import invalidate_job_feed
+from .models import JobPost
+
+
+def expire_due_jobs(now=None):
+    """
+    Expire every active job post whose listing duration has run out.
+
+    Uses a single set-based UPDATE over the partial (status, expires_at)
+    index and, since queryset updates do not send model signals, adjusts the
+    platform stats and invalidates the cached feed for the affected
+    companies. Returns the number of job posts expired.
+    """
+    now = now or timezone.now()
+    due = JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE, expires_at__lte=now)
+
+    with transaction.atomic():
+        company_ids = list(due.order_by().values_list('company_id', flat=True).distinct())
+        expired = stats.bulk_update(due, status=JobPost.JobPostStatus.EXPIRED, updated_at=now)
+
+    if expired:
+        invalidate_job_feed(company_ids)
+    return expired
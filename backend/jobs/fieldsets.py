@@ -0,0 +1,82 @@
+"""
+Sparse fieldsets for the job endpoints.
+
+``?fields=id,job_title`` limits a response to the named fields and
+``?omit=benefits`` drops fields from it. Serializers using
+SparseFieldsetMixin may also declare ``Meta.optional_fields``, which are left
+out unless requested with ``?fields=``. SparseQuerysetMixin then defers the
+columns the selected fields do not read, so they are not fetched at all.
+"""
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+
+
+def requested_names(request, param):
+    """Comma separated field names of a query parameter, or None if absent"""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    value = request.query_params.get(param)
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """ModelSerializer mixin selecting its fields from ``?fields=`` and ``?omit=``"""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        optional = set(getattr(self.Meta, 'optional_fields', ()))
+
+        # Only the serializer the view returns follows the query parameters;
+        # nested ones just leave out their optional fields
+        request = self.context.get('request') if self.is_top_level() else None
+        selected = requested_names(request, FIELDS_QUERY_PARAM)
+        omitted = requested_names(request, OMIT_QUERY_PARAM) or set()
+
+        errors = {}
+        for param, names in ((FIELDS_QUERY_PARAM, selected), (OMIT_QUERY_PARAM, omitted)):
+            unknown = sorted((names or set()) - set(fields))
+            if unknown:
+                errors[param] = [f'Unknown field(s): {", ".join(unknown)}']
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        if selected is None:
+            selected = set(fields) - optional
+        return {name: field for name, field in fields.items() if name in selected and name not in omitted}
+
+    def is_top_level(self):
+        return self.parent is None or (self.parent.parent is None and isinstance(self.parent, serializers.ListSerializer))
+
+
+def model_sources(serializer):
+    """Names of the model fields the serializer's fields read, directly or through a relation"""
+    return {field.source_attrs[0] for field in serializer.fields.values() if field.source_attrs}
+
+
+class SparseQuerysetMixin:
+    """
+    View mixin deferring the model columns that the selected serializer
+    fields do not use on read requests.
+
+    The primary key, foreign keys (needed by select_related) and the view's
+    ``ordering_fields`` (read by the paginator's cursors) are always loaded.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        needed = model_sources(self.get_serializer()) | set(getattr(self, 'ordering_fields', None) or ())
+        deferred = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if not field.primary_key and not field.is_relation and field.name not in needed
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
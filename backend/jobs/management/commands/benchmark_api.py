@@ -0,0 +1,146 @@
+import json
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from jobs.benchmark import (
+    SCENARIOS, BenchmarkError, BenchmarkRunner, ClientTransport, HTTPTransport,
+    build_state, compare_results,
+)
+from jobs.cache import invalidate_job_feed
+from jobs.models import JobApplication, JobPost, SavedJobPost
+from jobs.synthetic import DEFAULT_PASSWORD, generate
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the main API endpoints and report throughput, p50/p95/p99 latency '
+        'and query counts as JSON. Runs in-process through the Django test client '
+        '(all changes rolled back) or against a running server with --url '
+        '(save/apply/unsave changes are kept)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='Measured requests per scenario')
+        parser.add_argument('--warmup', type=int, default=5, help='Unmeasured requests per scenario')
+        parser.add_argument('--url', help='Base URL of a running server, e.g. http://127.0.0.1:8000')
+        parser.add_argument('--concurrency', type=int, default=1, help='Parallel clients for read scenarios (--url only)')
+        parser.add_argument('--scenario', action='append', dest='scenarios', help='Only run these scenarios')
+        parser.add_argument('--prefix', default='synthetic', help='Email prefix of the synthetic users to use')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument(
+            '--generate', type=int, default=0, metavar='JOBS',
+            help='Generate a synthetic dataset with this many job posts first (in-process only)',
+        )
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+        parser.add_argument('--compare', help='Baseline JSON report to compare against')
+        parser.add_argument(
+            '--max-regression', type=float, metavar='PCT',
+            help='With --compare, fail if any p95 latency grew by more than PCT percent or any query count grew',
+        )
+
+    def handle(self, *args, **options):
+        scenarios = SCENARIOS
+        if options['scenarios']:
+            scenarios = [scenario for scenario in SCENARIOS if scenario.name in options['scenarios']]
+            unknown = set(options['scenarios']) - {scenario.name for scenario in scenarios}
+            if unknown:
+                raise CommandError(f'Unknown scenario(s): {", ".join(sorted(unknown))}')
+
+        if options['url']:
+            if options['generate']:
+                raise CommandError('--generate only works in-process; run generate_synthetic_data first')
+            report = self.run_benchmark(scenarios, options, lambda: HTTPTransport(options['url']))
+        else:
+            if options['concurrency'] > 1:
+                raise CommandError('--concurrency needs --url; the test client runs requests one at a time')
+            with transaction.atomic():
+                if options['generate']:
+                    jobs = options['generate']
+                    self.stderr.write(f'Generating {jobs} synthetic job posts...')
+                    generate(companies=max(10, jobs // 50), jobs=jobs, job_seekers=max(10, jobs // 5),
+                             prefix=options['prefix'])
+                report = self.run_benchmark(scenarios, options, ClientTransport)
+                transaction.set_rollback(True)
+            # Feed pages cached during the run may contain rolled back jobs
+            invalidate_job_feed()
+
+        if options['compare']:
+            with open(options['compare']) as baseline_file:
+                baseline = json.load(baseline_file)
+            report['comparison'] = compare_results(baseline['scenarios'], report['scenarios'])
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                output_file.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f'Report written to {options["output"]}'))
+        else:
+            self.stdout.write(output)
+
+        if options['compare'] and options['max_regression'] is not None:
+            self.check_regressions(report['comparison'], options['max_regression'])
+
+    def run_benchmark(self, scenarios, options, make_transport):
+        try:
+            state = build_state(options['prefix'], options['password'])
+            runner = BenchmarkRunner(
+                make_transport, state,
+                requests_per_scenario=options['requests'],
+                warmup=options['warmup'],
+                concurrency=options['concurrency'],
+            )
+            results = runner.run(scenarios, progress=self.progress)
+        except BenchmarkError as e:
+            raise CommandError(str(e))
+
+        return {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'git_commit': git_commit(),
+                'python': sys.version.split()[0],
+                'target': options['url'] or 'in-process',
+                'database': connection.vendor,
+                'requests_per_scenario': options['requests'],
+                'warmup': options['warmup'],
+                'concurrency': options['concurrency'],
+                'dataset': {
+                    'jobs': JobPost.objects.count(),
+                    'active_jobs': JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE).count(),
+                    'saved_jobs': SavedJobPost.objects.count(),
+                    'applications': JobApplication.objects.count(),
+                },
+            },
+            'scenarios': results,
+        }
+
+    def progress(self, name, result):
+        latency = result['latency_ms']
+        self.stderr.write(
+            f'{name:<24} {result["requests"]:>5} req  {result["throughput_rps"] or 0:>8.1f} req/s  '
+            f'p50 {latency["p50"] or 0:>8.2f} ms  p95 {latency["p95"] or 0:>8.2f} ms  '
+            f'queries {result["queries"]["mean"]}'
+        )
+
+    def check_regressions(self, comparison, max_regression):
+        regressions = []
+        for name, row in comparison.items():
+            if row['p95_change_pct'] is not None and row['p95_change_pct'] > max_regression:
+                regressions.append(f'{name} p95 +{row["p95_change_pct"]}%')
+            if (row['queries_before'] is not None and row['queries_after'] is not None
+                    and row['queries_after'] > row['queries_before']):
+                regressions.append(f'{name} queries {row["queries_before"]} -> {row["queries_after"]}')
+        if regressions:
+            raise CommandError(f'Performance regressions: {"; ".join(regressions)}')
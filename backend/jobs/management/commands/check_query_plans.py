@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from jobs.query_plans import analyze, get_checks, is_supported, plan_problems
+from jobs.synthetic import generate
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the main query of each jobs endpoint and fail if any of them '
+        'falls back to a full table scan or an unindexed sort'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Generate this many synthetic job posts first (rolled back afterwards)',
+        )
+        parser.add_argument(
+            '--keep', action='store_true',
+            help='Keep the synthetic data instead of rolling it back',
+        )
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if not is_supported(vendor):
+            raise CommandError(f'Query plan checks are not supported on {vendor}')
+
+        with transaction.atomic():
+            if options['seed']:
+                jobs = options['seed']
+                self.stdout.write(f'Generating {jobs} synthetic job posts...')
+                generate(companies=max(10, jobs // 50), jobs=jobs, job_seekers=max(10, jobs // 5),
+                         prefix='queryplan')
+            analyze(connection)
+
+            failures = self.run_checks(vendor, options['verbosity'])
+
+            if not options['keep']:
+                transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f'{len(failures)} query plan check(s) failed: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('All query plans use indexes'))
+
+    def run_checks(self, vendor, verbosity):
+        checks = get_checks()
+        if not checks:
+            raise CommandError('No active job posts to explain against; use --seed')
+
+        failures = []
+        for name, queryset, allow_sort in checks:
+            plan = queryset.explain()
+            problems = plan_problems(vendor, plan, allow_sort)
+
+            if problems:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'FAIL {name}: {"; ".join(problems)}'))
+            else:
+                self.stdout.write(f'ok   {name}')
+            if problems or verbosity > 1:
+                self.stdout.write(self.indent(plan))
+        return failures
+
+    def indent(self, plan):
+        return '\n'.join(f'       {line}' for line in plan.splitlines())
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.expiration import expire_due_jobs
+
+
+class Command(BaseCommand):
+    help = 'Expire active job posts whose listing duration has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep running and sweep every --interval seconds (for a worker process)',
+        )
+        parser.add_argument(
+            '--interval', type=int, default=300,
+            help='Seconds between sweeps when running with --loop (default: 300)',
+        )
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            self.sweep()
+            return
+
+        self.stdout.write(f'Sweeping expired job posts every {options["interval"]}s')
+        try:
+            while True:
+                close_old_connections()
+                self.sweep()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
+
+    def sweep(self):
+        expired = expire_due_jobs()
+        self.stdout.write(self.style.SUCCESS(f'Expired {expired} job posts'))
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import CustomUser
+from jobs.synthetic import DEFAULT_PASSWORD, generate
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate synthetic companies, job posts, job seekers, saved jobs and '
+        'applications with realistic size distributions'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=50)
+        parser.add_argument('--jobs', type=int, default=5000)
+        parser.add_argument('--job-seekers', type=int, default=1000)
+        parser.add_argument('--saved-per-seeker', type=int, default=5, help='Mean saved jobs per job seeker')
+        parser.add_argument('--applications-per-seeker', type=int, default=3, help='Mean applications per job seeker')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, so runs are reproducible')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--prefix', default='synthetic', help='Prefix of the generated user emails')
+        parser.add_argument(
+            '--clear', action='store_true',
+            help='Delete the users (and everything they own) of a previous run with the same prefix first',
+        )
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+
+        with transaction.atomic():
+            if options['clear']:
+                deleted, _ = CustomUser.objects.filter(email__startswith=f'{prefix}-').delete()
+                self.stdout.write(f'Deleted {deleted} objects from a previous run')
+            elif CustomUser.objects.filter(email__startswith=f'{prefix}-').exists():
+                self.stdout.write(self.style.ERROR(
+                    f'Synthetic users with prefix "{prefix}" already exist; use --clear or another --prefix'
+                ))
+                return
+
+            dataset = generate(
+                companies=options['companies'],
+                jobs=options['jobs'],
+                job_seekers=options['job_seekers'],
+                saved_per_seeker=options['saved_per_seeker'],
+                applications_per_seeker=options['applications_per_seeker'],
+                seed=options['seed'],
+                batch_size=options['batch_size'],
+                prefix=prefix,
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(dataset.companies)} companies, {len(dataset.jobs)} job posts, '
+            f'{len(dataset.job_seekers)} job seekers, {dataset.saved_jobs} saved jobs and '
+            f'{dataset.applications} applications'
+        ))
+        self.stdout.write(f'All synthetic users have the password "{DEFAULT_PASSWORD}"')
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.stats import is_reconciled, reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recompute the platform statistics from the job, company and application tables and fix any drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep running and reconcile every --interval seconds (for a worker process)',
+        )
+        parser.add_argument(
+            '--interval', type=int, default=3600,
+            help='Seconds between runs when running with --loop (default: 3600)',
+        )
+        parser.add_argument(
+            '--if-missing', action='store_true',
+            help='Only reconcile if the stats were never computed (seeds them on deploy)',
+        )
+
+    def handle(self, *args, **options):
+        if options['if_missing'] and is_reconciled():
+            self.stdout.write('Platform stats already computed')
+            return
+
+        if not options['loop']:
+            self.reconcile()
+            return
+
+        self.stdout.write(f'Reconciling platform stats every {options["interval"]}s')
+        try:
+            while True:
+                close_old_connections()
+                self.reconcile()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
+
+    def reconcile(self):
+        drift = reconcile()
+        for (metric, dimension), (stored, actual) in sorted(drift.items()):
+            label = f'{metric}[{dimension}]' if dimension else metric
+            self.stdout.write(f'{label}: {stored} -> {actual}')
+        self.stdout.write(self.style.SUCCESS(f'Reconciled platform stats, {len(drift)} counters corrected'))
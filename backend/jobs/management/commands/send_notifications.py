@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.notifications import drain, purge_sent
+
+
+class Command(BaseCommand):
+    help = 'Send the queued notification emails, retrying failed deliveries with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep running and poll the outbox every --interval seconds (for a worker process)',
+        )
+        parser.add_argument(
+            '--interval', type=int, default=10,
+            help='Seconds between polls when running with --loop (default: 10)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int,
+            help='Notifications claimed per batch (default: NOTIFICATION_BATCH_SIZE)',
+        )
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            self.sweep(options['batch_size'])
+            return
+
+        self.stdout.write(f'Sending notifications every {options["interval"]}s')
+        try:
+            while True:
+                close_old_connections()
+                self.sweep(options['batch_size'], verbose=False)
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
+
+    def sweep(self, batch_size, verbose=True):
+        totals = {'notifications': 0, 'emails': 0, 'retried': 0, 'failed': 0}
+        while True:
+            result = drain(batch_size)
+            for key, value in result.items():
+                totals[key] += value
+            # A batch of only retries leaves nothing due; stop instead of spinning
+            if not result['notifications'] or result['retried'] + result['failed'] == result['notifications']:
+                break
+        purged = purge_sent()
+
+        if verbose or totals['notifications']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Processed {totals["notifications"]} notifications: {totals["emails"]} emails sent, '
+                f'{totals["retried"]} to retry, {totals["failed"]} failed; purged {purged} old notifications'
+            ))
@@ -0,0 +1,183 @@
+# Generated by Django 5.0.1 on 2026-10-17 17:44
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Frozen copies of the search triggers as of this migration; jobs.search
+# queries what they maintain. Later changes need a new migration.
+
+POSTGRES_SEARCH_SQL = [
+    """
+    UPDATE jobs_jobpost AS job SET search_vector =
+        setweight(to_tsvector('english', coalesce(job.job_title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(company.name, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(job.job_description, '')), 'C')
+    FROM accounts_company AS company
+    WHERE company.id = job.company_id;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION jobs_jobpost_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        -- Updates issued by the company trigger already carry the new vector
+        IF pg_trigger_depth() > 1 THEN
+            RETURN NEW;
+        END IF;
+        IF TG_OP = 'UPDATE'
+           AND NEW.job_title IS NOT DISTINCT FROM OLD.job_title
+           AND NEW.job_description IS NOT DISTINCT FROM OLD.job_description
+           AND NEW.company_id IS NOT DISTINCT FROM OLD.company_id THEN
+            NEW.search_vector := OLD.search_vector;
+            RETURN NEW;
+        END IF;
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.job_title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(
+                (SELECT name FROM accounts_company WHERE id = NEW.company_id), '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.job_description, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER jobs_jobpost_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON jobs_jobpost
+    FOR EACH ROW EXECUTE FUNCTION jobs_jobpost_search_vector_update();
+    """,
+    """
+    CREATE OR REPLACE FUNCTION jobs_company_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        UPDATE jobs_jobpost SET search_vector =
+            setweight(to_tsvector('english', coalesce(job_title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.name, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(job_description, '')), 'C')
+        WHERE company_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER jobs_company_search_vector_trigger
+    AFTER UPDATE OF name ON accounts_company
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION jobs_company_search_vector_update();
+    """,
+    'CREATE INDEX IF NOT EXISTS jobs_jobpost_search_vector_gin ON jobs_jobpost USING gin (search_vector);',
+]
+
+POSTGRES_SEARCH_REVERSE_SQL = [
+    'DROP INDEX IF EXISTS jobs_jobpost_search_vector_gin;',
+    'DROP TRIGGER IF EXISTS jobs_company_search_vector_trigger ON accounts_company;',
+    'DROP FUNCTION IF EXISTS jobs_company_search_vector_update();',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_search_vector_trigger ON jobs_jobpost;',
+    'DROP FUNCTION IF EXISTS jobs_jobpost_search_vector_update();',
+]
+
+SQLITE_SEARCH_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_jobpost_fts USING fts5(
+        job_id UNINDEXED, job_title, company_name, job_description,
+        tokenize = 'porter unicode61'
+    );
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_jobpost_fts_insert AFTER INSERT ON jobs_jobpost BEGIN
+        INSERT INTO jobs_jobpost_fts (job_id, job_title, company_name, job_description)
+        VALUES (NEW.id, NEW.job_title,
+                (SELECT name FROM accounts_company WHERE id = NEW.company_id),
+                NEW.job_description);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_jobpost_fts_update AFTER UPDATE ON jobs_jobpost
+    WHEN OLD.job_title IS NOT NEW.job_title
+      OR OLD.job_description IS NOT NEW.job_description
+      OR OLD.company_id IS NOT NEW.company_id
+    BEGIN
+        DELETE FROM jobs_jobpost_fts WHERE job_id = OLD.id;
+        INSERT INTO jobs_jobpost_fts (job_id, job_title, company_name, job_description)
+        VALUES (NEW.id, NEW.job_title,
+                (SELECT name FROM accounts_company WHERE id = NEW.company_id),
+                NEW.job_description);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_jobpost_fts_delete AFTER DELETE ON jobs_jobpost BEGIN
+        DELETE FROM jobs_jobpost_fts WHERE job_id = OLD.id;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_company_fts_update AFTER UPDATE OF name ON accounts_company
+    WHEN OLD.name IS NOT NEW.name
+    BEGIN
+        UPDATE jobs_jobpost_fts SET company_name = NEW.name
+        WHERE job_id IN (SELECT id FROM jobs_jobpost WHERE company_id = NEW.id);
+    END;
+    """,
+    """
+    INSERT INTO jobs_jobpost_fts (job_id, job_title, company_name, job_description)
+    SELECT job.id, job.job_title, company.name, job.job_description
+    FROM jobs_jobpost AS job LEFT JOIN accounts_company AS company ON company.id = job.company_id;
+    """,
+]
+
+SQLITE_SEARCH_REVERSE_SQL = [
+    'DROP TRIGGER IF EXISTS jobs_company_fts_update;',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_fts_delete;',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_fts_update;',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_fts_insert;',
+    'DROP TABLE IF EXISTS jobs_jobpost_fts;',
+]
+
+
+def install_search_backend(apps, schema_editor):
+    """Create the triggers and index that maintain the job search data"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        statements = POSTGRES_SEARCH_SQL
+    elif vendor == 'sqlite':
+        if not sqlite_supports_fts5(schema_editor.connection):
+            return
+        statements = SQLITE_SEARCH_SQL
+    else:
+        return
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def uninstall_search_backend(apps, schema_editor):
+    """Drop the triggers and index created by install_search_backend"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        statements = POSTGRES_SEARCH_REVERSE_SQL
+    elif vendor == 'sqlite':
+        statements = SQLITE_SEARCH_REVERSE_SQL
+    else:
+        return
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def sqlite_supports_fts5(connection):
+    """Check whether the SQLite build behind connection ships the FTS5 module"""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_jobapplication'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(install_search_backend, uninstall_search_backend),
+    ]
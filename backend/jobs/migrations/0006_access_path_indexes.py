@@ -0,0 +1,39 @@
+# Generated by Django 5.0.1 on 2026-10-17 17:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['employment_type', '-created_at', '-id'], name='jobpost_active_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['location', '-created_at', '-id'], name='jobpost_active_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['salary_from', 'id'], name='jobpost_active_salary_from_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['salary_to', 'id'], name='jobpost_active_salary_to_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['company', '-created_at', '-id'], name='jobpost_company_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedjobpost',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='savedjob_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.1 on 2026-10-17 17:50
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_expires_at(apps, schema_editor):
+    JobPost = apps.get_model('jobs', 'JobPost')
+    durations = JobPost.objects.order_by().values_list('listing_duration', flat=True).distinct()
+    for duration in list(durations):
+        JobPost.objects.filter(listing_duration=duration).update(
+            expires_at=F('created_at') + timedelta(days=duration)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='expires_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_expires_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['expires_at'], name='jobpost_active_expires_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-17 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_jobpost_expires_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(max_length=100)),
+                ('dimension', models.CharField(blank=True, max_length=255)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='platformstat',
+            constraint=models.UniqueConstraint(fields=('metric', 'dimension'), name='platformstat_metric_dimension_uniq'),
+        ),
+    ]
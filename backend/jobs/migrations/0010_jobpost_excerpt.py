@@ -0,0 +1,149 @@
+# Generated by Django 5.0.1 on 2026-10-17 18:16
+
+import json
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+
+# Frozen copies of the SQLite search table and triggers of migration 0004
+# and of jobs.excerpts as of this migration, so that later changes to the
+# app code do not change what this migration does.
+
+SQLITE_SEARCH_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_jobpost_fts USING fts5(
+        job_id UNINDEXED, job_title, company_name, job_description,
+        tokenize = 'porter unicode61'
+    );
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_jobpost_fts_insert AFTER INSERT ON jobs_jobpost BEGIN
+        INSERT INTO jobs_jobpost_fts (job_id, job_title, company_name, job_description)
+        VALUES (NEW.id, NEW.job_title,
+                (SELECT name FROM accounts_company WHERE id = NEW.company_id),
+                NEW.job_description);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_jobpost_fts_update AFTER UPDATE ON jobs_jobpost
+    WHEN OLD.job_title IS NOT NEW.job_title
+      OR OLD.job_description IS NOT NEW.job_description
+      OR OLD.company_id IS NOT NEW.company_id
+    BEGIN
+        DELETE FROM jobs_jobpost_fts WHERE job_id = OLD.id;
+        INSERT INTO jobs_jobpost_fts (job_id, job_title, company_name, job_description)
+        VALUES (NEW.id, NEW.job_title,
+                (SELECT name FROM accounts_company WHERE id = NEW.company_id),
+                NEW.job_description);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_jobpost_fts_delete AFTER DELETE ON jobs_jobpost BEGIN
+        DELETE FROM jobs_jobpost_fts WHERE job_id = OLD.id;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_company_fts_update AFTER UPDATE OF name ON accounts_company
+    WHEN OLD.name IS NOT NEW.name
+    BEGIN
+        UPDATE jobs_jobpost_fts SET company_name = NEW.name
+        WHERE job_id IN (SELECT id FROM jobs_jobpost WHERE company_id = NEW.id);
+    END;
+    """,
+    """
+    INSERT INTO jobs_jobpost_fts (job_id, job_title, company_name, job_description)
+    SELECT job.id, job.job_title, company.name, job.job_description
+    FROM jobs_jobpost AS job LEFT JOIN accounts_company AS company ON company.id = job.company_id;
+    """,
+]
+
+SQLITE_SEARCH_REVERSE_SQL = [
+    'DROP TRIGGER IF EXISTS jobs_company_fts_update;',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_fts_delete;',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_fts_update;',
+    'DROP TRIGGER IF EXISTS jobs_jobpost_fts_insert;',
+    'DROP TABLE IF EXISTS jobs_jobpost_fts;',
+]
+
+
+def sqlite_supports_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def sqlite_detach_search(apps, schema_editor):
+    """
+    Drop the SQLite search triggers and table before AddField rebuilds
+    jobs_jobpost, which the triggers do not survive; sqlite_attach_search
+    recreates and repopulates them afterwards.
+    """
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in SQLITE_SEARCH_REVERSE_SQL:
+            schema_editor.execute(statement)
+
+
+def sqlite_attach_search(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite' and sqlite_supports_fts5(schema_editor.connection):
+        for statement in SQLITE_SEARCH_SQL:
+            schema_editor.execute(statement)
+
+
+EXCERPT_LENGTH = 280
+
+# TipTap nodes whose children are inline text, joined without a separator
+TEXT_BLOCKS = {'paragraph', 'heading', 'codeBlock'}
+
+
+def tiptap_text(node):
+    if node.get('type') == 'text':
+        return node.get('text', '')
+    if node.get('type') == 'hardBreak':
+        return ' '
+    children = [tiptap_text(child) for child in node.get('content') or [] if isinstance(child, dict)]
+    return ('' if node.get('type') in TEXT_BLOCKS else ' ').join(children)
+
+
+def make_excerpt(description):
+    try:
+        document = json.loads(description)
+    except (TypeError, ValueError):
+        document = None
+    if isinstance(document, dict):
+        text = tiptap_text(document)
+    else:
+        text = unescape(strip_tags(description or ''))
+    return Truncator(' '.join(text.split())).chars(EXCERPT_LENGTH)
+
+
+def backfill_excerpt(apps, schema_editor):
+    JobPost = apps.get_model('jobs', 'JobPost')
+    batch = []
+    for job in JobPost.objects.only('pk', 'job_description').iterator(chunk_size=500):
+        job.excerpt = make_excerpt(job.job_description)
+        batch.append(job)
+        if len(batch) == 500:
+            JobPost.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    JobPost.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(sqlite_detach_search, sqlite_attach_search),
+        migrations.AddField(
+            model_name='jobpost',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.RunPython(sqlite_attach_search, sqlite_detach_search),
+        migrations.RunPython(backfill_excerpt, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-17 18:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_customuser_date_joined_index'),
+        ('jobs', '0010_jobpost_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['-created_at', '-id'], name='jobpost_created_idx'),
+        ),
+    ]
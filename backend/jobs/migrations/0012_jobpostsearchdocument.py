@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-17 19:02
+
+import jobs.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_jobpost_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobPostSearchDocument',
+            fields=[
+                ('rowid', models.AutoField(db_column='rowid', primary_key=True, serialize=False)),
+                ('document', jobs.search.FtsDocumentField(db_column='jobs_jobpost_fts')),
+            ],
+            options={
+                'db_table': 'jobs_jobpost_fts',
+                'managed': False,
+            },
+        ),
+    ]
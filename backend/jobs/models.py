@@ -1,5 +1,10 @@
 from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.utils import timezone
 from accounts.models import CustomUser, Company
+from .excerpts import make_excerpt
+from .search import FTS_DOCUMENT_RELATION, FTS_TABLE, FtsDocumentField
+from datetime import timedelta
 import uuid
 
 
@@ -21,6 +26,7 @@ class JobPost(models.Model):
     salary_from = models.PositiveIntegerField()
     salary_to = models.PositiveIntegerField()
     job_description = models.TextField()
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)  # Plain-text start of job_description for lists
     listing_duration = models.PositiveIntegerField()  # Duration in days
     benefits = models.JSONField(default=list, blank=True)  # List of benefits
     
@@ -32,15 +38,58 @@ class JobPost(models.Model):
     )
     applications = models.PositiveIntegerField(default=0)
     payment_session_id = models.CharField(max_length=255, blank=True, null=True)  # Stripe session ID
+    search_vector = SearchVectorField(null=True, editable=False)  # Maintained by database triggers, see jobs.search
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField(null=True, editable=False)  # created_at + listing_duration
     
     def __str__(self):
         return f"{self.job_title} at {self.company.name}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded values so jobs.stats can tell what a save changes
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+    
+    def save(self, *args, **kwargs):
+        # Keep the denormalized expiry in sync so the sweeper can find due jobs by index
+        self.expires_at = (self.created_at or timezone.now()) + timedelta(days=self.listing_duration)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'job_description' in update_fields:
+            self.excerpt = make_excerpt(self.job_description)
+        if update_fields is not None:
+            if 'listing_duration' in update_fields:
+                update_fields = {*update_fields, 'expires_at'}
+            if 'job_description' in update_fields:
+                update_fields = {*update_fields, 'excerpt'}
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+    
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of the active job feed on (created_at, id)
+            models.Index(fields=['status', '-created_at', '-id'], name='jobpost_status_created_idx'),
+            # Feed filters and salary orderings only ever look at active jobs
+            models.Index(fields=['employment_type', '-created_at', '-id'], name='jobpost_active_type_idx',
+                         condition=models.Q(status='ACTIVE')),
+            models.Index(fields=['location', '-created_at', '-id'], name='jobpost_active_location_idx',
+                         condition=models.Q(status='ACTIVE')),
+            models.Index(fields=['salary_from', 'id'], name='jobpost_active_salary_from_idx',
+                         condition=models.Q(status='ACTIVE')),
+            models.Index(fields=['salary_to', 'id'], name='jobpost_active_salary_to_idx',
+                         condition=models.Q(status='ACTIVE')),
+            # My jobs list of a company
+            models.Index(fields=['company', '-created_at', '-id'], name='jobpost_company_created_idx'),
+            # Expiration sweeper
+            models.Index(fields=['expires_at'], name='jobpost_active_expires_idx',
+                         condition=models.Q(status='ACTIVE')),
+            # Admin changelist: default ordering, date hierarchy and created_at filter
+            models.Index(fields=['-created_at', '-id'], name='jobpost_created_idx'),
+        ]
 
 
 class SavedJobPost(models.Model):
@@ -59,6 +108,9 @@ class SavedJobPost(models.Model):
     class Meta:
         unique_together = ('user', 'job')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='savedjob_user_created_idx'),
+        ]
 
 
 class JobApplication(models.Model):
@@ -81,6 +133,84 @@ class JobApplication(models.Model):
     class Meta:
         unique_together = ('user', 'job')
         ordering = ['-applied_at']
+        indexes = [
+            # Keyset pagination of application lists on (applied_at, id)
+            models.Index(fields=['job', '-applied_at', '-id'], name='jobapp_job_applied_idx'),
+            models.Index(fields=['user', '-applied_at', '-id'], name='jobapp_user_applied_idx'),
+        ]
         
     def __str__(self):
-        return f"{self.user.email} applied to {self.job.job_title}"
\ No newline at end of file
+        return f"{self.user.email} applied to {self.job.job_title}"
+
+
+class PlatformStat(models.Model):
+    """
+    One counter value of the platform statistics, e.g. the number of active
+    jobs in a location. Maintained incrementally by jobs.stats.
+    """
+    
+    metric = models.CharField(max_length=100)
+    dimension = models.CharField(max_length=255, blank=True)  # Empty for totals
+    value = models.BigIntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['metric', 'dimension'], name='platformstat_metric_dimension_uniq'),
+        ]
+    
+    def __str__(self):
+        return f"{self.metric}[{self.dimension}] = {self.value}"
+
+
+class Notification(models.Model):
+    """
+    Outbox of notifications to deliver. Rows are written in the transaction
+    of the change they announce and sent by `manage.py send_notifications`.
+    """
+    
+    class Kind(models.TextChoices):
+        APPLICATION_STATUS = 'application_status', 'Application status changed'
+    
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        SENT = 'SENT', 'Sent'
+        FAILED = 'FAILED', 'Failed'
+    
+    recipient = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='notifications')
+    kind = models.CharField(max_length=50, choices=Kind.choices)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)  # Not sent before this time (retry backoff)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            # Worker queue: pending notifications that are due, oldest first
+            models.Index(fields=['available_at', 'id'], name='notification_pending_idx',
+                         condition=models.Q(status='PENDING')),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} for {self.recipient_id} ({self.status})"
+
+
+class JobPostSearchDocument(models.Model):
+    """
+    A row of the SQLite FTS5 search table, which migration 0004 creates and
+    its triggers maintain; read-only, and absent on PostgreSQL. Lets
+    jobs.search join the table through the ORM.
+    """
+    
+    rowid = models.AutoField(primary_key=True, db_column='rowid')
+    job = models.OneToOneField(
+        JobPost, on_delete=models.DO_NOTHING, db_constraint=False, related_name=FTS_DOCUMENT_RELATION,
+    )
+    document = FtsDocumentField(db_column=FTS_TABLE)
+    
+    class Meta:
+        managed = False
+        db_table = FTS_TABLE
@@ -0,0 +1,187 @@
+"""
+Transactional outbox for email notifications.
+
+The request path only inserts Notification rows, in the same transaction as
+the change they announce. ``drain()`` (run by ``manage.py send_notifications``)
+claims due rows in batches, folds everything queued for one recipient into a
+single email, sends it through Django's email backend and reschedules failed
+deliveries with exponential backoff.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import mail
+from django.db import connection, transaction
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from .models import JobApplication, JobPost, Notification
+
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_status_changes(changes):
+    """Queue a notification for every application status change, in one INSERT"""
+    Notification.objects.bulk_create([
+        Notification(
+            recipient_id=change['user_id'],
+            kind=Notification.Kind.APPLICATION_STATUS,
+            payload={
+                'application_id': str(change['application_id']),
+                'job_id': str(change['job_id']),
+                'old_status': change['old_status'],
+                'new_status': change['new_status'],
+            },
+        )
+        for change in changes
+    ])
+
+
+def claim_batch(batch_size, now):
+    """Lock the oldest due notifications, skipping rows another worker holds"""
+    pending = Notification.objects.filter(status=Notification.Status.PENDING, available_at__lte=now)
+    if connection.features.has_select_for_update_skip_locked:
+        pending = pending.select_for_update(skip_locked=True)
+    return list(pending.order_by('available_at', 'id')[:batch_size])
+
+
+def coalesce(notifications):
+    """
+    Net status change per application, in queue order.
+
+    Several changes of one application collapse into a single change from the
+    first old status to the last new one, and are dropped if those are equal.
+    """
+    changes = {}
+    for notification in notifications:
+        payload = notification.payload
+        change = changes.setdefault(payload['application_id'], dict(payload))
+        change['new_status'] = payload['new_status']
+    return [change for change in changes.values() if change['old_status'] != change['new_status']]
+
+
+def status_label(value):
+    try:
+        return JobApplication.ApplicationStatus(value).label
+    except ValueError:
+        return value
+
+
+def status_change_message(email, changes, jobs):
+    """Email summarizing an applicant's status changes, or None if nothing is left to report"""
+    lines = [
+        f'- {jobs[change["job_id"]]}: {status_label(change["old_status"])} -> {status_label(change["new_status"])}'
+        for change in changes
+        if change['job_id'] in jobs
+    ]
+    if not email or not lines:
+        return None
+
+    if len(lines) == 1:
+        subject = 'Update on your job application'
+        intro = 'The status of your application has changed:'
+    else:
+        subject = f'Updates on {len(lines)} of your job applications'
+        intro = 'The status of some of your applications has changed:'
+    body = '\n'.join(['Hi,', '', intro, '', *lines, '', 'The WorkNest team'])
+    return mail.EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [email])
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=settings.NOTIFICATION_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def drain(batch_size=None, email_connection=None):
+    """
+    Send one batch of due notifications.
+
+    Returns ``{'notifications': claimed, 'emails': sent, 'retried': n,
+    'failed': n}``; ``notifications`` is 0 once the queue is empty. The claimed
+    rows stay locked until the batch is recorded, so concurrent workers (on
+    databases with SKIP LOCKED) never send the same notification twice.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+    result = {'notifications': 0, 'emails': 0, 'retried': 0, 'failed': 0}
+    now = timezone.now()
+
+    with transaction.atomic():
+        batch = claim_batch(batch_size, now)
+        if not batch:
+            return result
+        result['notifications'] = len(batch)
+
+        by_recipient = {}
+        for notification in batch:
+            by_recipient.setdefault(notification.recipient_id, []).append(notification)
+        emails = dict(CustomUser.objects.filter(id__in=by_recipient).values_list('id', 'email'))
+        job_ids = {notification.payload['job_id'] for notification in batch}
+        jobs = {
+            str(job_id): f'{job_title} at {company_name}'
+            for job_id, job_title, company_name in JobPost.objects.filter(id__in=job_ids).values_list(
+                'id', 'job_title', 'company__name'
+            )
+        }
+
+        messages = [
+            (notifications, status_change_message(emails.get(recipient_id), coalesce(notifications), jobs))
+            for recipient_id, notifications in by_recipient.items()
+        ]
+        errors = send_messages([message for _, message in messages if message is not None], email_connection)
+
+        delivered, undelivered = [], []
+        for notifications, message in messages:
+            error = errors.get(id(message)) if message is not None else None
+            if error is None:
+                delivered.extend(notifications)
+                result['emails'] += message is not None
+                continue
+            for notification in notifications:
+                notification.attempts += 1
+                notification.last_error = error
+                if notification.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+                    notification.status = Notification.Status.FAILED
+                    result['failed'] += 1
+                else:
+                    notification.available_at = now + retry_delay(notification.attempts)
+                    result['retried'] += 1
+                undelivered.append(notification)
+
+        Notification.objects.filter(pk__in=[notification.pk for notification in delivered]).update(
+            status=Notification.Status.SENT, sent_at=now
+        )
+        Notification.objects.bulk_update(undelivered, ['status', 'attempts', 'available_at', 'last_error'])
+
+    return result
+
+
+def send_messages(messages, email_connection=None):
+    """Send the messages over one connection; returns ``{id(message): error}`` for the failed ones"""
+    if not messages:
+        return {}
+    email_connection = email_connection or mail.get_connection()
+    try:
+        email_connection.open()
+    except Exception as e:
+        logger.warning('Could not connect to the email backend: %s', e)
+        return {id(message): str(e) for message in messages}
+
+    errors = {}
+    try:
+        for message in messages:
+            try:
+                email_connection.send_messages([message])
+            except Exception as e:
+                logger.warning('Sending notification email to %s failed: %s', message.to, e)
+                errors[id(message)] = str(e)
+    finally:
+        email_connection.close()
+    return errors
+
+
+def purge_sent(now=None):
+    """Delete sent notifications older than NOTIFICATION_RETENTION_DAYS; returns the number deleted"""
+    cutoff = (now or timezone.now()) - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    deleted, _ = Notification.objects.filter(status=Notification.Status.SENT, sent_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,169 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+FALSY_VALUES = ('0', 'false', 'no', 'off')
+
+
+class StandardPagination(PageNumberPagination):
+    """Page number pagination with a client-selectable, bounded page size"""
+
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on ``(<ordering field>, pk)``.
+
+    The ordering field is taken from the queryset's current ordering, so it
+    follows ``OrderingFilter`` and ``view.ordering``. Pages are fetched with
+    ``WHERE (field, pk) < (last_field, last_pk)`` instead of ``OFFSET``, which
+    keeps deep pages as cheap as the first one.
+
+    Keyset mode is used when the client sends ``?cursor=`` or
+    ``?pagination=cursor``; otherwise (or when the queryset is ordered by
+    something that cannot be used as a key, such as a search rank) requests
+    are served by ``fallback_class``. ``?count=false`` skips the total count.
+    """
+
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    count_query_param = 'count'
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    fallback_class = StandardPagination
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.fallback = None
+
+        key_field = self.get_key_field(queryset) if self.keyset_requested(request) else None
+        if key_field is None:
+            self.fallback = self.fallback_class()
+            return self.fallback.paginate_queryset(queryset, request, view)
+
+        field, descending = key_field
+        self.field = field
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.count = queryset.count() if self.count_requested(request) else None
+
+        position = self.decode_cursor(request)
+        reverse = bool(position and position['reverse'])
+        # Walking backwards flips the direction of both the ordering and the comparison
+        walk_descending = descending != reverse
+        prefix = '-' if walk_descending else ''
+        queryset = queryset.order_by(f'{prefix}{field.name}', f'{prefix}pk')
+
+        if position is not None:
+            lookup = 'lt' if walk_descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{field.name}__{lookup}': position['value']})
+                | Q(**{field.name: position['value'], f'pk__{lookup}': position['pk']})
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = position is not None, has_more
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return Response(response)
+
+    def keyset_requested(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == 'cursor'
+        )
+
+    def count_requested(self, request):
+        value = request.query_params.get(self.count_query_param, '')
+        return value.lower() not in FALSY_VALUES
+
+    def get_key_field(self, queryset):
+        """Return (field, descending) for the leading ordering, or None if it cannot be a key"""
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        if not ordering or not isinstance(ordering[0], str):
+            return None
+
+        name = ordering[0]
+        descending = name.startswith('-')
+        try:
+            field = queryset.model._meta.get_field(name.lstrip('-'))
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.null or field.is_relation:
+            return None
+        return field, descending
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            value, pk, reverse = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            pk_field = self.field.model._meta.pk
+            return {
+                'value': self.field.to_python(value),
+                'pk': pk_field.to_python(pk),
+                'reverse': bool(reverse),
+            }
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse):
+        payload = [self.field.value_to_string(instance), str(instance.pk), int(reverse)]
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
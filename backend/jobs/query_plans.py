@@ -0,0 +1,100 @@
+"""
+Index checks for the main query of each jobs endpoint.
+
+Each check EXPLAINs a query and reports full table scans and, unless the
+check expects one, sorts that no index provides. ``manage.py
+check_query_plans`` runs them against the current database and
+``jobs.tests.test_query_plans`` against synthetic data, so that a lost
+index fails the test suite.
+"""
+import re
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import JobApplication, JobPost, SavedJobPost
+
+
+# Plan lines that mean a whole table is read, per database vendor
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (?!.*\bUSING\b)(?P<table>\w+)'),
+    'postgresql': re.compile(r'\bSeq Scan on (?P<table>\w+)'),
+}
+SORT_PATTERNS = {
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY'),
+    'postgresql': re.compile(r'\bSort Key:'),
+}
+PAGE = 21
+
+
+def is_supported(vendor):
+    return vendor in FULL_SCAN_PATTERNS
+
+
+def plan_problems(vendor, plan, allow_sort=False):
+    """Full scans and, unless allowed, unindexed sorts in an EXPLAIN output"""
+    problems = [
+        f'full scan of {match.group("table")}'
+        for match in FULL_SCAN_PATTERNS[vendor].finditer(plan)
+    ]
+    if not allow_sort and SORT_PATTERNS[vendor].search(plan):
+        problems.append('unindexed sort')
+    return problems
+
+
+def get_checks():
+    """
+    ``(name, queryset, allow_sort)`` for the main query of each endpoint,
+    parameterized with existing rows; empty if there is no active job post.
+    """
+    active = JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE)
+    job = active.order_by('-created_at').first()
+    if job is None:
+        return []
+
+    company_id = (
+        JobPost.objects.order_by().values('company').annotate(jobs=Count('id'))
+        .order_by('-jobs').values_list('company', flat=True).first()
+    )
+    busiest_job_id = (
+        JobApplication.objects.order_by().values('job').annotate(applications=Count('id'))
+        .order_by('-applications').values_list('job', flat=True).first()
+    ) or job.pk
+    applicant_id = JobApplication.objects.values_list('user', flat=True).first()
+    saver_id = SavedJobPost.objects.values_list('user', flat=True).first()
+    feed = active.select_related('company')
+
+    return [
+        ('job feed', feed.order_by('-created_at', '-pk')[:PAGE], False),
+        ('job feed next page', feed.filter(
+            Q(created_at__lt=job.created_at) | Q(created_at=job.created_at, pk__lt=job.pk)
+        ).order_by('-created_at', '-pk')[:PAGE], False),
+        ('job feed by employment type', feed.filter(employment_type=job.employment_type)
+            .order_by('-created_at', '-pk')[:PAGE], False),
+        ('job feed by location', feed.filter(location=job.location)
+            .order_by('-created_at', '-pk')[:PAGE], False),
+        ('job feed by salary_from', feed.order_by('salary_from', 'pk')[:PAGE], False),
+        ('job feed by -salary_to', feed.order_by('-salary_to', '-pk')[:PAGE], False),
+        ('job detail', JobPost.objects.filter(pk=job.pk), False),
+        ('my jobs', JobPost.objects.filter(company_id=company_id).order_by('-created_at', '-pk')[:PAGE], False),
+        ('saved jobs', SavedJobPost.objects.filter(user_id=saver_id)
+            .select_related('job', 'job__company').order_by('-created_at', '-pk')[:PAGE], False),
+        ('saved state of a page', SavedJobPost.objects.filter(
+            user_id=saver_id, job_id__in=[job.pk]).values_list('job_id', flat=True), False),
+        ('my applications', JobApplication.objects.filter(user_id=applicant_id)
+            .select_related('job', 'job__company').order_by('-applied_at', '-pk')[:PAGE], False),
+        ('job applications', JobApplication.objects.filter(job_id=busiest_job_id)
+            .select_related('user', 'user__jobseeker_profile').order_by('-applied_at', '-pk')[:PAGE], False),
+        # Merges the per-job index ranges of every company job, so a sort is expected
+        ('company applications', JobApplication.objects.filter(
+            job__in=JobPost.objects.filter(company_id=company_id)
+        ).order_by('-applied_at', '-pk')[:PAGE], True),
+        ('active job count', active.order_by().values('pk'), False),
+        ('expiration sweep', active.filter(expires_at__lte=timezone.now()).order_by().values('pk'), False),
+    ]
+
+
+def analyze(connection):
+    """Refresh planner statistics so plans reflect the current data volume"""
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
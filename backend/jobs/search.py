@@ -0,0 +1,124 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, FloatField, Func, Lookup, TextField, Value
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+
+# The PostgreSQL search vector and the SQLite FTS5 table searched here, and
+# the triggers maintaining them, are created by migration 0004
+SEARCH_CONFIG = 'english'
+FTS_TABLE = 'jobs_jobpost_fts'
+
+# JobPost's reverse relation to the unmanaged JobPostSearchDocument model
+FTS_DOCUMENT_RELATION = 'search_document'
+
+# Relative weights for job_title, company_name and job_description on SQLite,
+# mirroring the A/B/C weights of the PostgreSQL search vector
+FTS_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+def fts_table_available(connection):
+    """Check (once per connection) whether the SQLite search shadow table exists"""
+    available = getattr(connection, '_jobs_fts_available', None)
+    if available is None:
+        available = FTS_TABLE in connection.introspection.table_names()
+        connection._jobs_fts_available = available
+    return available
+
+
+def tokenize_search_terms(terms):
+    """Split raw search terms into plain word tokens safe to embed in a query"""
+    return [token for term in terms for token in re.findall(r'\w+', term)]
+
+
+def build_tsquery(tokens):
+    """Build a PostgreSQL tsquery string, treating the last token as a prefix"""
+    parts = list(tokens[:-1]) + [f'{tokens[-1]}:*']
+    return ' & '.join(parts)
+
+
+def build_fts_query(tokens):
+    """Build an FTS5 MATCH expression, treating the last token as a prefix"""
+    parts = [f'"{token}"' for token in tokens[:-1]] + [f'"{tokens[-1]}"*']
+    return ' '.join(parts)
+
+
+class JobPostSearchFilter(filters.SearchFilter):
+    """
+    Ranked full-text search over job title, company name and job description.
+
+    Uses the trigger-maintained ``search_vector`` column and its GIN index on
+    PostgreSQL, and the FTS5 shadow table on SQLite. Any other backend falls
+    back to DRF's ``SearchFilter`` over the view's ``search_fields``.
+
+    Results are ordered by relevance unless the client asks for an explicit
+    ordering, so this backend should be listed after ``OrderingFilter``.
+    """
+
+    rank_field = 'search_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        tokens = tokenize_search_terms(self.get_search_terms(request))
+        if not tokens:
+            return queryset
+
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql':
+            queryset = self.filter_postgresql(queryset, tokens)
+        elif connection.vendor == 'sqlite' and fts_table_available(connection):
+            queryset = self.filter_sqlite(queryset, tokens)
+        else:
+            return super().filter_queryset(request, queryset, view)
+
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return queryset.order_by(f'-{self.rank_field}', *queryset.query.order_by)
+
+    def filter_postgresql(self, queryset, tokens):
+        query = SearchQuery(build_tsquery(tokens), config=SEARCH_CONFIG, search_type='raw')
+        return queryset.filter(search_vector=query).annotate(
+            **{self.rank_field: SearchRank(F('search_vector'), query)}
+        )
+
+    def filter_sqlite(self, queryset, tokens):
+        # One join to the FTS table: MATCH runs once and the job rows are
+        # then looked up by primary key, rather than once per job
+        document = f'{FTS_DOCUMENT_RELATION}__document'
+        return queryset.filter(**{f'{document}__match': build_fts_query(tokens)}).annotate(
+            **{self.rank_field: Bm25(F(document), *FTS_WEIGHTS)}
+        )
+
+
+class FtsDocumentField(TextField):
+    """
+    The hidden column of an FTS5 table, named like the table itself, which
+    stands for the whole row in MATCH queries and auxiliary functions such
+    as bm25(). Only ``__match`` lookups and Bm25 use it.
+    """
+
+
+@FtsDocumentField.register_lookup
+class FtsMatch(Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
+
+
+class Bm25(Func):
+    """
+    Relevance of the matched row, higher is better: bm25() with a weight per
+    column (the unindexed job_id column gets 0), negated.
+    """
+
+    function = 'bm25'
+    template = '-%(function)s(%(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, document, *weights):
+        super().__init__(document, Value(0.0), *(Value(float(weight)) for weight in weights))
@@ -1,9 +1,45 @@
 from rest_framework import serializers
+from django.db import models
 from accounts.serializers import UserSerializer, CompanySerializer
+from monitoring.serializers import TimedSerializerMixin
 from .models import JobPost, SavedJobPost, JobApplication
+from .fieldsets import SparseFieldsetMixin
 
 
-class JobPostSerializer(serializers.ModelSerializer):
+def get_saved_job_ids(request, job_ids):
+    """Return the subset of job_ids saved by the requesting user, using a single query"""
+    if not request or not request.user.is_authenticated or not job_ids:
+        return set()
+    return set(
+        SavedJobPost.objects.filter(user=request.user, job_id__in=job_ids)
+        .values_list('job_id', flat=True)
+    )
+
+
+class SavedStateListSerializer(serializers.ListSerializer):
+    """List serializer that resolves the saved state of a whole page up front"""
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        iterable = list(iterable)
+        self.context['saved_job_ids'] = self.resolve_saved_job_ids(iterable)
+        return super().to_representation(iterable)
+    
+    def resolve_saved_job_ids(self, items):
+        return get_saved_job_ids(self.context.get('request'), [item.pk for item in items])
+
+
+class SavedJobPostListSerializer(SavedStateListSerializer):
+    """Saved job rows are saved by definition, so no query is needed"""
+    
+    def resolve_saved_job_ids(self, items):
+        request = self.context.get('request')
+        if not request or not request.user.is_authenticated:
+            return set()
+        return {item.job_id for item in items if item.user_id == request.user.pk}
+
+
+class JobPostSerializer(TimedSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for job posts"""
     
     company_details = CompanySerializer(source='company', read_only=True)
@@ -12,11 +48,11 @@ class JobPostSerializer(serializers.ModelSerializer):
         model = JobPost
         fields = (
             'id', 'job_title', 'employment_type', 'location',
-            'salary_from', 'salary_to', 'job_description',
+            'salary_from', 'salary_to', 'job_description', 'excerpt',
             'listing_duration', 'benefits', 'status', 'applications',
             'payment_session_id', 'company', 'company_details', 'created_at', 'updated_at'
         )
-        read_only_fields = ('id', 'company', 'applications', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'company', 'excerpt', 'applications', 'created_at', 'updated_at')
     
     def create(self, validated_data):
         # Get company from the authenticated user
@@ -28,7 +64,7 @@ class JobPostSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class JobPostListSerializer(serializers.ModelSerializer):
+class JobPostListSerializer(TimedSerializerMixin, SparseFieldsetMixin, serializers.ModelSerializer):
     """Lightweight serializer for job post lists"""
     
     company_name = serializers.CharField(source='company.name', read_only=True)
@@ -39,21 +75,28 @@ class JobPostListSerializer(serializers.ModelSerializer):
         model = JobPost
         fields = (
             'id', 'job_title', 'employment_type', 'location',
-            'salary_from', 'salary_to', 'job_description', 'listing_duration',
+            'salary_from', 'salary_to', 'job_description', 'excerpt', 'listing_duration',
             'benefits', 'status', 'applications',
             'company_name', 'company_logo', 'is_saved',
             'created_at'
         )
+        # The full description is only sent when asked for with ?fields=
+        optional_fields = ('job_description',)
+        list_serializer_class = SavedStateListSerializer
     
     def get_is_saved(self, obj):
         """Check if the current user has saved this job"""
+        saved_job_ids = self.context.get('saved_job_ids')
+        if saved_job_ids is not None:
+            return obj.pk in saved_job_ids
+        
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return SavedJobPost.objects.filter(user=request.user, job=obj).exists()
         return False
 
 
-class SavedJobPostSerializer(serializers.ModelSerializer):
+class SavedJobPostSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for saved job posts"""
     
     job_details = JobPostListSerializer(source='job', read_only=True)
@@ -62,13 +105,14 @@ class SavedJobPostSerializer(serializers.ModelSerializer):
         model = SavedJobPost
         fields = ('id', 'job', 'job_details', 'created_at')
         read_only_fields = ('id', 'created_at')
+        list_serializer_class = SavedJobPostListSerializer
     
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobApplicationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for job applications"""
     
     user_email = serializers.CharField(source='user.email', read_only=True)
@@ -87,4 +131,35 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data['user'] = self.context['request'].user
-        return super().create(validated_data)
\ No newline at end of file
+        return super().create(validated_data)
+
+class BulkJobIdsSerializer(serializers.Serializer):
+    """Job post IDs of a bulk save, unsave or apply request"""
+    
+    MAX_JOBS = 100
+    
+    job_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_JOBS)
+    
+    def validate_job_ids(self, value):
+        # Drop duplicates, keeping the order of first appearance
+        return list(dict.fromkeys(value))
+
+
+class BulkApplySerializer(BulkJobIdsSerializer):
+    """Job post IDs and the cover letter sent with every application"""
+    
+    cover_letter = serializers.CharField(required=False, allow_blank=True, default='')
+
+
+class BulkApplicationStatusSerializer(serializers.Serializer):
+    """Applications of a bulk status update and their new status"""
+    
+    MAX_APPLICATIONS = 500
+    
+    application_ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=MAX_APPLICATIONS
+    )
+    status = serializers.ChoiceField(choices=JobApplication.ApplicationStatus.choices)
+    
+    def validate_application_ids(self, value):
+        return list(dict.fromkeys(value))
@@ -0,0 +1,65 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from accounts.models import Company
+from . import notifications, stats
+from .cache import invalidate_job_feed
+from .models import JobApplication, JobPost
+
+
+# Sent once per batch of application status updates, inside the updating
+# transaction, with ``changes``: a list of dicts with application_id, job_id,
+# user_id, old_status and new_status. Receivers with external side effects
+# should defer them with transaction.on_commit.
+applications_status_changed = Signal()
+
+
+@receiver([post_save, post_delete], sender=JobPost)
+def job_post_changed(sender, instance, **kwargs):
+    """Invalidate cached feed pages and the company's job details"""
+    invalidate_job_feed([instance.company_id])
+
+
+@receiver([post_save, post_delete], sender=Company)
+def company_changed(sender, instance, **kwargs):
+    """Company name and logo are embedded in every job response of the company"""
+    invalidate_job_feed([instance.pk])
+
+
+@receiver(pre_save, sender=JobPost)
+def job_post_saving(sender, instance, **kwargs):
+    """Remember the counted state of an existing job post before it changes"""
+    if not instance._state.adding:
+        instance._stats_before = stats.loaded_state(instance) or stats.stored_state(instance)
+
+
+@receiver(post_save, sender=JobPost)
+def job_post_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Move the job post between platform stats counters"""
+    before = None if created else getattr(instance, '_stats_before', None)
+    after = stats.row_state(instance)
+    if before is not None and update_fields is not None:
+        after = {field: after[field] if field in update_fields else before[field] for field in after}
+    stats.record_change(JobPost, before, after)
+    instance._loaded_values = {**getattr(instance, '_loaded_values', {}), **after}
+
+
+@receiver(post_delete, sender=JobPost)
+def job_post_deleted(sender, instance, **kwargs):
+    stats.record_change(JobPost, stats.loaded_state(instance) or stats.row_state(instance), None)
+
+
+@receiver([post_save, post_delete], sender=Company)
+@receiver([post_save, post_delete], sender=JobApplication)
+def counted_row_changed(sender, instance, created=False, **kwargs):
+    """Companies and applications only enter or leave their counters when created or deleted"""
+    if kwargs['signal'] is post_delete:
+        stats.record_change(sender, stats.row_state(instance), None)
+    elif created:
+        stats.record_change(sender, None, stats.row_state(instance))
+
+
+@receiver(applications_status_changed, sender=JobApplication)
+def queue_status_notifications(sender, changes, **kwargs):
+    """Queue applicant emails in the outbox; `manage.py send_notifications` delivers them"""
+    notifications.enqueue_status_changes(changes)
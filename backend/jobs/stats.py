@@ -0,0 +1,327 @@
+"""
+Incrementally maintained platform statistics.
+
+Every counter is a set of PlatformStat rows (one per dimension value) that
+is adjusted with ``value = value + delta`` from the JobPost, Company and
+JobApplication signal handlers and from bulk status updates, inside the
+writing transaction (counters that most requests write to are sharded over
+several rows). Reading the stats is a single indexed query; nothing scans
+the base tables per request. ``reconcile()`` recomputes every counter
+from the base tables (``manage.py reconcile_stats``, run periodically) and
+corrects any drift left by writes that bypass signals.
+
+Reads never reconcile: until the first ``reconcile_stats`` run (part of the
+pre-deploy command, with ``--if-missing``) counters read as zero or only
+count the changes made since.
+
+To add a stat, append a Counter to COUNTERS and run ``reconcile_stats``.
+"""
+import random
+import time
+from collections import Counter as Tally
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from accounts.models import Company
+from .models import JobApplication, JobPost, PlatformStat
+
+
+ACTIVE_JOBS = 'active_jobs'
+JOBS_BY_EMPLOYMENT_TYPE = 'active_jobs.employment_type'
+JOBS_BY_LOCATION = 'active_jobs.location'
+JOBS_BY_SALARY_BAND = 'active_jobs.salary_band'
+COMPANIES = 'companies'
+APPLICATIONS_PER_DAY = 'applications.day'
+RECONCILED_AT = 'reconciled_at'
+# PostgreSQL advisory lock held by reconcile(), so that two runs (e.g. the
+# pre-deploy seeding and the periodic worker) do not both recreate the rows
+RECONCILE_LOCK_ID = 0x706c6174
+
+TOTAL = ''
+# Separates the shard number from the dimension of a sharded counter's rows
+SHARD_SEPARATOR = '#'
+
+# Lower bounds of the salary bands; a job falls in the band of its salary midpoint
+SALARY_BAND_EDGES = (0, 25000, 50000, 75000, 100000, 150000, 200000)
+
+
+def salary_band(salary_from, salary_to):
+    midpoint = (salary_from + salary_to) // 2
+    for lower, upper in zip(SALARY_BAND_EDGES, SALARY_BAND_EDGES[1:]):
+        if midpoint < upper:
+            return f'{lower}-{upper}'
+    return f'{SALARY_BAND_EDGES[-1]}+'
+
+
+def band_lower_bound(band):
+    return int(band.split('-')[0].rstrip('+'))
+
+
+def active(dimension):
+    """Only count active job posts"""
+    return lambda state: dimension(state) if state['status'] == JobPost.JobPostStatus.ACTIVE else None
+
+
+@dataclass(frozen=True)
+class Counter:
+    """
+    Count of ``model`` rows per dimension value.
+
+    ``dimension`` maps a row's ``fields`` to the dimension value it is
+    counted under, or None if the row is not counted. A counter with
+    ``shards`` > 1 is spread over that many PlatformStat rows per dimension
+    value, each write going to a random one, so that concurrent writers do
+    not all wait for the same row lock; readers add the shards up.
+    """
+    metric: str
+    model: type
+    fields: tuple
+    dimension: Callable
+    shards: int = 1
+
+
+COUNTERS = (
+    Counter(ACTIVE_JOBS, JobPost, ('status',), active(lambda state: TOTAL)),
+    Counter(JOBS_BY_EMPLOYMENT_TYPE, JobPost, ('status', 'employment_type'),
+            active(lambda state: state['employment_type'])),
+    Counter(JOBS_BY_LOCATION, JobPost, ('status', 'location'), active(lambda state: state['location'])),
+    Counter(JOBS_BY_SALARY_BAND, JobPost, ('status', 'salary_from', 'salary_to'),
+            active(lambda state: salary_band(state['salary_from'], state['salary_to']))),
+    Counter(COMPANIES, Company, (), lambda state: TOTAL),
+    # Every application increments today's count
+    Counter(APPLICATIONS_PER_DAY, JobApplication, ('applied_at',),
+            lambda state: timezone.localdate(state['applied_at']).isoformat(), shards=16),
+)
+
+SHARDS = {counter.metric: counter.shards for counter in COUNTERS if counter.shards > 1}
+
+
+def shard_key(metric, dimension):
+    """The PlatformStat row a change of a counter is written to"""
+    shard = random.randrange(SHARDS.get(metric, 1))
+    return metric, f'{dimension}{SHARD_SEPARATOR}{shard}' if shard else dimension
+
+
+def counter_key(metric, dimension):
+    """The counter a PlatformStat row is (a shard of)"""
+    if metric in SHARDS:
+        dimension = dimension.partition(SHARD_SEPARATOR)[0]
+    return metric, dimension
+
+
+def counters_for(model):
+    return [counter for counter in COUNTERS if counter.model is model]
+
+
+def tracked_fields(model):
+    return sorted({field for counter in counters_for(model) for field in counter.fields})
+
+
+def row_state(instance, fields=None):
+    """Values of the tracked fields of a model instance"""
+    return {field: getattr(instance, field) for field in fields or tracked_fields(type(instance))}
+
+
+def loaded_state(instance):
+    """
+    Tracked field values as last read from or written to the database.
+
+    Uses the values JobPost keeps from loading (see JobPost.from_db) and
+    returns None if they are unavailable, e.g. because a field was deferred.
+    """
+    fields = tracked_fields(type(instance))
+    loaded = getattr(instance, '_loaded_values', None)
+    if loaded is not None and all(field in loaded for field in fields):
+        return {field: loaded[field] for field in fields}
+    return None
+
+
+def stored_state(instance):
+    """Tracked field values currently in the database"""
+    fields = tracked_fields(type(instance))
+    if not fields:
+        return {}
+    return type(instance)._base_manager.filter(pk=instance.pk).values(*fields).first()
+
+
+def contributions(model, state):
+    """The (metric, dimension) keys a row with this state is counted under"""
+    if state is None:
+        return []
+    keys = []
+    for counter in counters_for(model):
+        dimension = counter.dimension(state)
+        if dimension is not None:
+            keys.append((counter.metric, dimension))
+    return keys
+
+
+def changes(model, before_states, after_states):
+    """Counter deltas for rows changing from the before to the after states"""
+    deltas = Tally()
+    for state in before_states:
+        deltas.subtract(contributions(model, state))
+    for state in after_states:
+        deltas.update(contributions(model, state))
+    return deltas
+
+
+def apply_deltas(deltas):
+    """Add the deltas to their counters, creating missing rows"""
+    rows = Tally()
+    for key, delta in deltas.items():
+        if delta:
+            rows[shard_key(*key)] += delta
+    # Fixed order so concurrent transactions lock the rows in the same order
+    for (metric, dimension), delta in sorted(rows.items()):
+        stats = PlatformStat.objects.filter(metric=metric, dimension=dimension)
+        if stats.update(value=F('value') + delta):
+            continue
+        try:
+            with transaction.atomic():
+                PlatformStat.objects.create(metric=metric, dimension=dimension, value=delta)
+        except IntegrityError:
+            # Created concurrently
+            stats.update(value=F('value') + delta)
+
+
+def record_change(model, before, after):
+    apply_deltas(changes(model, [before] if before is not None else [], [after] if after is not None else []))
+
+
+def record_created(model, instances):
+    """Count rows inserted with bulk_create, which sends no signals"""
+    apply_deltas(changes(model, [], [row_state(instance) for instance in instances]))
+
+
+def bulk_update(queryset, **values):
+    """
+    ``queryset.update(**values)`` that keeps the counters in step.
+
+    Queryset updates send no model signals, so the tracked fields of the
+    affected rows are read first and the counters adjusted by the difference.
+    Returns the number of rows updated.
+    """
+    model = queryset.model
+    fields = tracked_fields(model)
+    with transaction.atomic():
+        before = list(queryset.select_for_update().values(*fields)) if fields else []
+        updated = queryset.update(**values)
+        after = [{**state, **{field: values[field] for field in fields if field in values}} for state in before]
+        apply_deltas(changes(model, before, after))
+    return updated
+
+
+def recompute():
+    """True values of every counter, read from the base tables"""
+    deltas = Tally()
+    for model in {counter.model for counter in COUNTERS}:
+        fields = tracked_fields(model)
+        if not fields:
+            count = model._base_manager.count()
+            for key in contributions(model, {}):
+                deltas[key] += count
+            continue
+        for state in model._base_manager.values(*fields).iterator(chunk_size=2000):
+            deltas.update(contributions(model, state))
+    return deltas
+
+
+@transaction.atomic
+def reconcile():
+    """
+    Reset every counter to its true value.
+
+    Returns ``{(metric, dimension): (stored, actual)}`` for the counters that
+    had drifted. Increments committed while the base tables are being read
+    may be overwritten; the next run corrects them.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [RECONCILE_LOCK_ID])
+    actual = recompute()
+    stored = Tally()
+    for stat in PlatformStat.objects.select_for_update().exclude(metric=RECONCILED_AT):
+        stored[counter_key(stat.metric, stat.dimension)] += stat.value
+    drift = {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in stored.keys() | actual.keys()
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
+
+    PlatformStat.objects.all().delete()
+    PlatformStat.objects.bulk_create(
+        [PlatformStat(metric=metric, dimension=dimension, value=value)
+         for (metric, dimension), value in actual.items() if value]
+        + [PlatformStat(metric=RECONCILED_AT, dimension=TOTAL, value=int(time.time()))],
+        batch_size=1000,
+    )
+    return drift
+
+
+def is_reconciled():
+    """Whether reconcile() has ever run, i.e. the counters are seeded"""
+    return PlatformStat.objects.filter(metric=RECONCILED_AT).exists()
+
+
+def totals_from(stats):
+    values = {stat.metric: max(stat.value, 0) for stat in stats if stat.dimension == TOTAL}
+    return {
+        'total_active_jobs': values.get(ACTIVE_JOBS, 0),
+        'total_companies': values.get(COMPANIES, 0),
+    }
+
+
+def get_totals():
+    """Active job and company counts"""
+    return totals_from(PlatformStat.objects.filter(metric__in=[ACTIVE_JOBS, COMPANIES]))
+
+
+async def aget_totals():
+    return totals_from([stat async for stat in PlatformStat.objects.filter(metric__in=[ACTIVE_JOBS, COMPANIES])])
+
+
+def get_breakdown(locations=20, days=30):
+    """
+    Active jobs per employment type, top locations and salary band, the
+    median salary band, and applications per day for the last ``days`` days.
+    """
+    since = (timezone.localdate() - timedelta(days=days - 1)).isoformat()
+    # A shard of a sharded counter may be negative on its own
+    stats = PlatformStat.objects.filter(
+        Q(metric__in=[JOBS_BY_EMPLOYMENT_TYPE, JOBS_BY_SALARY_BAND], value__gt=0)
+        | Q(metric=APPLICATIONS_PER_DAY, dimension__gte=since)
+    )
+    top_locations = PlatformStat.objects.filter(metric=JOBS_BY_LOCATION, value__gt=0).order_by('-value', 'dimension')
+    counts = Tally()
+    for stat in [*stats, *top_locations[:locations]]:
+        counts[counter_key(stat.metric, stat.dimension)] += stat.value
+    by_metric = {}
+    for (metric, dimension), value in counts.items():
+        if value > 0:
+            by_metric.setdefault(metric, {})[dimension] = value
+
+    salary_bands = dict(sorted(by_metric.get(JOBS_BY_SALARY_BAND, {}).items(), key=lambda item: band_lower_bound(item[0])))
+    return {
+        'jobs_by_employment_type': dict(sorted(by_metric.get(JOBS_BY_EMPLOYMENT_TYPE, {}).items())),
+        'jobs_by_location': dict(sorted(by_metric.get(JOBS_BY_LOCATION, {}).items(), key=lambda item: (-item[1], item[0]))),
+        'jobs_by_salary_band': salary_bands,
+        'median_salary_band': median_band(salary_bands),
+        'applications_per_day': dict(sorted(by_metric.get(APPLICATIONS_PER_DAY, {}).items())),
+    }
+
+
+def median_band(bands):
+    """Band containing the median job, given job counts per band in ascending order"""
+    total = sum(bands.values())
+    seen = 0
+    for band, count in bands.items():
+        seen += count
+        if seen * 2 >= total and total:
+            return band
+    return None
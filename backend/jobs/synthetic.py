@@ -0,0 +1,174 @@
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from accounts.models import Company, CustomUser, JobSeeker
+from . import stats
+from .excerpts import make_excerpt
+from .models import JobApplication, JobPost, SavedJobPost
+
+
+EMPLOYMENT_TYPES = ['Full-time', 'Part-time', 'Contract', 'Internship', 'Temporary']
+EMPLOYMENT_TYPE_WEIGHTS = [60, 15, 15, 5, 5]
+LOCATIONS = [
+    'Remote', 'New York', 'San Francisco', 'London', 'Berlin', 'Bangalore',
+    'Toronto', 'Sydney', 'Paris', 'Singapore', 'Austin', 'Amsterdam',
+]
+TITLE_LEVELS = ['Junior', 'Mid-level', 'Senior', 'Staff', 'Lead', 'Principal']
+TITLE_ROLES = [
+    'Python Developer', 'Frontend Engineer', 'Data Scientist', 'DevOps Engineer',
+    'Product Manager', 'UX Designer', 'Backend Engineer', 'QA Engineer',
+    'Mobile Developer', 'Machine Learning Engineer', 'Site Reliability Engineer',
+]
+WORDS = (
+    'build ship scale design review mentor own deliver improve collaborate product '
+    'platform api service customer data pipeline cloud team roadmap quality testing '
+    'performance security infrastructure analytics experience growth remote hybrid '
+    'django react postgres kubernetes python typescript aws observability'
+).split()
+BENEFITS = [
+    '401k', 'Distributed team', 'Async', 'Vision insurance', 'Dental insurance',
+    'Medical insurance', 'Unlimited vacation', 'Paid time off', '4 day workweek',
+    'Learning budget', 'Free gym membership', 'Home office budget', 'Pay in crypto',
+]
+LISTING_DURATIONS = [30, 60, 90]
+DEFAULT_PASSWORD = 'synthetic-password'
+
+
+@dataclass
+class SyntheticDataset:
+    """Objects created by generate(), returned so callers can drive requests against them"""
+
+    companies: list = field(default_factory=list)
+    job_seekers: list = field(default_factory=list)
+    jobs: list = field(default_factory=list)
+    saved_jobs: int = 0
+    applications: int = 0
+
+
+def pareto_count(rng, mean, maximum):
+    """Heavy-tailed count with roughly the given mean: most small, a few very large"""
+    alpha = 1.5
+    scale = mean * (alpha - 1) / alpha
+    return max(0, min(maximum, int(scale * rng.paretovariate(alpha))))
+
+
+def job_description(rng):
+    """Rich-text HTML with a log-normal length, like TipTap output in production"""
+    paragraphs = max(1, min(40, int(rng.lognormvariate(1.5, 0.6))))
+    return ''.join(
+        '<p>' + ' '.join(rng.choice(WORDS) for _ in range(rng.randint(20, 80))) + '.</p>'
+        for _ in range(paragraphs)
+    )
+
+
+def generate(companies=10, jobs=200, job_seekers=100, saved_per_seeker=5,
+             applications_per_seeker=3, seed=0, batch_size=1000, prefix='synthetic'):
+    """
+    Bulk-create a synthetic dataset with realistic size distributions.
+
+    Jobs are spread over companies with a heavy tail, job descriptions have a
+    log-normal length, and saved jobs and applications per job seeker are
+    heavy-tailed around the given means. Everything is created with
+    bulk_create, so model signals are not sent; the platform stats are
+    reconciled at the end instead.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    password = make_password(DEFAULT_PASSWORD)
+    dataset = SyntheticDataset()
+
+    company_users = [
+        CustomUser(
+            email=f'{prefix}-company-{i}@example.com', username=f'{prefix}-company-{i}@example.com',
+            name=f'Company {i}', password=password, user_type=CustomUser.UserType.COMPANY,
+            onboarding_completed=True,
+        )
+        for i in range(companies)
+    ]
+    CustomUser.objects.bulk_create(company_users, batch_size=batch_size)
+    dataset.companies = Company.objects.bulk_create([
+        Company(
+            user=user, name=f'{prefix.title()} Company {i}', location=rng.choice(LOCATIONS),
+            website=f'https://company-{i}.example.com', about='Synthetic company',
+            logo=f'https://company-{i}.example.com/logo.png',
+        )
+        for i, user in enumerate(company_users)
+    ], batch_size=batch_size)
+
+    seeker_users = [
+        CustomUser(
+            email=f'{prefix}-seeker-{i}@example.com', username=f'{prefix}-seeker-{i}@example.com',
+            name=f'Job Seeker {i}', password=password, user_type=CustomUser.UserType.JOB_SEEKER,
+            onboarding_completed=True,
+        )
+        for i in range(job_seekers)
+    ]
+    CustomUser.objects.bulk_create(seeker_users, batch_size=batch_size)
+    JobSeeker.objects.bulk_create([
+        JobSeeker(user=user, name=user.name, about='Synthetic job seeker',
+                  resume=f'https://resumes.example.com/{i}.pdf')
+        for i, user in enumerate(seeker_users)
+    ], batch_size=batch_size)
+    dataset.job_seekers = seeker_users
+
+    if dataset.companies and jobs:
+        # A few companies post most of the jobs
+        company_weights = [rng.paretovariate(1.2) for _ in dataset.companies]
+        job_posts = []
+        for _ in range(jobs):
+            salary_from = rng.randrange(20_000, 200_000, 1_000)
+            job_posts.append(JobPost(
+                company=rng.choices(dataset.companies, weights=company_weights)[0],
+                job_title=f'{rng.choice(TITLE_LEVELS)} {rng.choice(TITLE_ROLES)}',
+                employment_type=rng.choices(EMPLOYMENT_TYPES, weights=EMPLOYMENT_TYPE_WEIGHTS)[0],
+                location=rng.choice(LOCATIONS),
+                salary_from=salary_from,
+                salary_to=salary_from + rng.randrange(0, 100_000, 1_000),
+                job_description=job_description(rng),
+                listing_duration=rng.choice(LISTING_DURATIONS),
+                benefits=rng.sample(BENEFITS, rng.randint(0, 6)),
+                status=rng.choices(
+                    [JobPost.JobPostStatus.ACTIVE, JobPost.JobPostStatus.EXPIRED, JobPost.JobPostStatus.DRAFT],
+                    weights=[70, 25, 5],
+                )[0],
+            ))
+        for job in job_posts:
+            # bulk_create does not call JobPost.save(), which maintains the excerpt
+            job.excerpt = make_excerpt(job.job_description)
+        dataset.jobs = JobPost.objects.bulk_create(job_posts, batch_size=batch_size)
+
+        # created_at is auto_now_add, so spread it over the last 120 days afterwards
+        for job in dataset.jobs:
+            job.created_at = now - timedelta(seconds=rng.randint(0, 120 * 86400))
+            job.expires_at = job.created_at + timedelta(days=job.listing_duration)
+        JobPost.objects.bulk_update(dataset.jobs, ['created_at', 'expires_at'], batch_size=batch_size)
+
+    if dataset.jobs:
+        saved_jobs, applications = [], []
+        for user in seeker_users:
+            for job in rng.sample(dataset.jobs, min(len(dataset.jobs), pareto_count(rng, saved_per_seeker, 200))):
+                saved_jobs.append(SavedJobPost(user=user, job=job))
+            for job in rng.sample(dataset.jobs, min(len(dataset.jobs), pareto_count(rng, applications_per_seeker, 100))):
+                applications.append(JobApplication(
+                    user=user, job=job,
+                    status=rng.choices(JobApplication.ApplicationStatus.values, weights=[70, 15, 5, 10])[0],
+                    cover_letter=' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 150))),
+                ))
+        SavedJobPost.objects.bulk_create(saved_jobs, batch_size=batch_size)
+        JobApplication.objects.bulk_create(applications, batch_size=batch_size)
+        dataset.saved_jobs = len(saved_jobs)
+        dataset.applications = len(applications)
+
+        counts = {}
+        for application in applications:
+            counts[application.job_id] = counts.get(application.job_id, 0) + 1
+        for job in dataset.jobs:
+            job.applications = counts.get(job.pk, 0)
+        JobPost.objects.bulk_update(dataset.jobs, ['applications'], batch_size=batch_size)
+
+    stats.reconcile()
+    return dataset
@@ -0,0 +1,211 @@
+import uuid
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import Company, CustomUser, JobSeeker
+from jobs.models import JobApplication, JobPost, Notification, SavedJobPost
+
+
+def create_company(email, name):
+    user = CustomUser.objects.create_user(email, 'bulk-password', user_type='COMPANY')
+    return Company.objects.create(user=user, name=name, location='Remote', website='https://example.com')
+
+
+def create_job_seeker(email):
+    user = CustomUser.objects.create_user(email, 'bulk-password', user_type='JOB_SEEKER')
+    JobSeeker.objects.create(user=user, name='Jo Seeker', about='About me', resume='https://example.com/cv.pdf')
+    return user
+
+
+def create_job(company, job_title, status=JobPost.JobPostStatus.ACTIVE):
+    return JobPost.objects.create(
+        company=company, job_title=job_title, job_description='<p>Join our team.</p>',
+        employment_type='Full-time', location='Remote', salary_from=50000, salary_to=80000,
+        listing_duration=30, status=status,
+    )
+
+
+def results_by_job(response):
+    return {result['job_id']: result['status'] for result in response.json()['results']}
+
+
+class BulkActionTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = create_company('acme@example.com', 'Acme')
+        cls.other_company = create_company('globex@example.com', 'Globex')
+        cls.seeker = create_job_seeker('seeker@example.com')
+        cls.job = create_job(cls.company, 'Python Developer')
+        cls.other_job = create_job(cls.other_company, 'Go Developer')
+        cls.draft_job = create_job(cls.company, 'Unpublished', status=JobPost.JobPostStatus.DRAFT)
+
+    def client_for(self, user):
+        client = APIClient(HTTP_HOST='localhost')
+        client.force_authenticate(user)
+        return client
+
+    def post(self, user, url, data):
+        return self.client_for(user).post(url, data, format='json')
+
+    def patch(self, user, url, data):
+        return self.client_for(user).patch(url, data, format='json')
+
+
+class BulkSaveTests(BulkActionTestCase):
+
+    def test_reports_every_job_once(self):
+        SavedJobPost.objects.create(user=self.seeker, job=self.other_job)
+        missing = uuid.uuid4()
+
+        response = self.post(self.seeker, '/api/jobs/bulk-save/', {
+            'job_ids': [str(self.job.pk), str(self.other_job.pk), str(self.draft_job.pk), str(missing), str(self.job.pk)],
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(results_by_job(response), {
+            str(self.job.pk): 'saved',
+            str(self.other_job.pk): 'already_saved',
+            str(self.draft_job.pk): 'not_found',
+            str(missing): 'not_found',
+        })
+        self.assertEqual(response.json()['summary'], {'saved': 1, 'already_saved': 1, 'not_found': 2})
+        saved = SavedJobPost.objects.get(user=self.seeker, job=self.job)
+        self.assertEqual(response.json()['results'][0]['saved_job_id'], str(saved.pk))
+        self.assertEqual(SavedJobPost.objects.filter(user=self.seeker).count(), 2)
+
+    def test_rejects_empty_and_oversized_requests(self):
+        self.assertEqual(self.post(self.seeker, '/api/jobs/bulk-save/', {'job_ids': []}).status_code, 400)
+        job_ids = [str(uuid.uuid4()) for _ in range(101)]
+        self.assertEqual(self.post(self.seeker, '/api/jobs/bulk-save/', {'job_ids': job_ids}).status_code, 400)
+
+    def test_unsave_only_removes_own_saved_jobs(self):
+        SavedJobPost.objects.create(user=self.seeker, job=self.job)
+        other_seeker = create_job_seeker('other@example.com')
+        SavedJobPost.objects.create(user=other_seeker, job=self.other_job)
+
+        response = self.post(self.seeker, '/api/jobs/bulk-unsave/', {
+            'job_ids': [str(self.job.pk), str(self.other_job.pk)],
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(results_by_job(response), {
+            str(self.job.pk): 'removed',
+            str(self.other_job.pk): 'not_saved',
+        })
+        self.assertFalse(SavedJobPost.objects.filter(user=self.seeker).exists())
+        self.assertTrue(SavedJobPost.objects.filter(user=other_seeker, job=self.other_job).exists())
+
+
+class BulkApplyTests(BulkActionTestCase):
+
+    def test_applies_once_per_job_and_counts_applications(self):
+        JobApplication.objects.create(user=self.seeker, job=self.other_job)
+        JobPost.objects.filter(pk=self.other_job.pk).update(applications=1)
+
+        response = self.post(self.seeker, '/api/jobs/bulk-apply/', {
+            'job_ids': [str(self.job.pk), str(self.other_job.pk), str(self.draft_job.pk)],
+            'cover_letter': 'Hello',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(results_by_job(response), {
+            str(self.job.pk): 'applied',
+            str(self.other_job.pk): 'already_applied',
+            str(self.draft_job.pk): 'not_found',
+        })
+        application = JobApplication.objects.get(user=self.seeker, job=self.job)
+        self.assertEqual(application.cover_letter, 'Hello')
+        self.assertEqual(response.json()['results'][0]['application_id'], str(application.pk))
+        self.job.refresh_from_db()
+        self.other_job.refresh_from_db()
+        self.assertEqual((self.job.applications, self.other_job.applications), (1, 1))
+
+    def test_company_cannot_apply_to_own_jobs(self):
+        JobSeeker.objects.create(user=self.company.user, name='Acme', about='About', resume='https://example.com/cv.pdf')
+
+        response = self.post(self.company.user, '/api/jobs/bulk-apply/', {
+            'job_ids': [str(self.job.pk), str(self.other_job.pk)],
+        })
+
+        self.assertEqual(results_by_job(response), {
+            str(self.job.pk): 'own_job',
+            str(self.other_job.pk): 'applied',
+        })
+        self.assertFalse(JobApplication.objects.filter(job=self.job).exists())
+
+    def test_requires_a_job_seeker_profile(self):
+        response = self.post(self.other_company.user, '/api/jobs/bulk-apply/', {'job_ids': [str(self.job.pk)]})
+        self.assertEqual(response.status_code, 403)
+
+    def test_single_apply_rejects_duplicates(self):
+        url = f'/api/jobs/{self.job.pk}/apply/'
+        self.assertEqual(self.post(self.seeker, url, {'cover_letter': 'Hi'}).status_code, 201)
+        response = self.post(self.seeker, url, {'cover_letter': 'Again'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['application']['cover_letter'], 'Hi')
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications, 1)
+
+
+class ApplicationStatusTests(BulkActionTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.application = JobApplication.objects.create(user=cls.seeker, job=cls.job)
+        cls.reviewed = JobApplication.objects.create(
+            user=create_job_seeker('reviewed@example.com'), job=cls.job,
+            status=JobApplication.ApplicationStatus.REVIEWED,
+        )
+        cls.foreign = JobApplication.objects.create(user=cls.seeker, job=cls.other_job)
+
+    def test_update_queues_a_notification(self):
+        response = self.patch(self.company.user, f'/api/applications/{self.application.pk}/status/', {'status': 'accepted'})
+
+        self.assertEqual(response.status_code, 200)
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, 'accepted')
+        notification = Notification.objects.get()
+        self.assertEqual(notification.recipient_id, self.seeker.pk)
+        self.assertEqual(notification.payload, {
+            'application_id': str(self.application.pk),
+            'job_id': str(self.job.pk),
+            'old_status': 'pending',
+            'new_status': 'accepted',
+        })
+
+    def test_update_checks_status_and_ownership(self):
+        url = f'/api/applications/{self.application.pk}/status/'
+        self.assertEqual(self.patch(self.company.user, url, {'status': 'hired'}).status_code, 400)
+        self.assertEqual(self.patch(self.other_company.user, url, {'status': 'accepted'}).status_code, 403)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_bulk_update_reports_changed_unchanged_and_not_found(self):
+        missing = uuid.uuid4()
+
+        response = self.patch(self.company.user, '/api/applications/bulk-status/', {
+            'application_ids': [str(self.application.pk), str(self.reviewed.pk), str(self.foreign.pk), str(missing)],
+            'status': 'reviewed',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'status': 'reviewed',
+            'changed': [{'id': str(self.application.pk), 'from': 'pending'}],
+            'unchanged': [str(self.reviewed.pk)],
+            'not_found': [str(self.foreign.pk), str(missing)],
+        })
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, 'pending')
+        self.assertEqual(
+            list(Notification.objects.values_list('payload__application_id', flat=True)),
+            [str(self.application.pk)],
+        )
+
+    def test_bulk_update_requires_a_company(self):
+        response = self.patch(self.seeker, '/api/applications/bulk-status/', {
+            'application_ids': [str(self.application.pk)], 'status': 'reviewed',
+        })
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,114 @@
+from unittest import skipUnless
+
+from django.apps import apps
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import Company, CustomUser
+from jobs.models import JobPost
+
+
+@override_settings(JOB_FEED_CACHE_TIMEOUT=60)
+class JobFeedCacheTests(TestCase):
+    """Anonymous feed and detail responses cached under versions the signal handlers bump"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = CustomUser.objects.create_user('cache@example.com', 'cache-password', user_type='COMPANY')
+        cls.company = Company.objects.create(user=user, name='Acme', location='Remote', website='https://acme.example.com')
+        cls.job = cls.create_job('Python Developer')
+
+    @classmethod
+    def create_job(cls, job_title):
+        return JobPost.objects.create(
+            company=cls.company, job_title=job_title, job_description='<p>Join our team.</p>',
+            employment_type='Full-time', location='Remote', salary_from=50000, salary_to=80000,
+            listing_duration=30, status=JobPost.JobPostStatus.ACTIVE,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def get(self, url, etag=None, **params):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return APIClient().get(url, params, HTTP_HOST='localhost', **headers)
+
+    def titles(self, response):
+        return [job['job_title'] for job in response.json()['results']]
+
+    def test_feed_revalidates_with_etag(self):
+        response = self.get('/api/jobs/')
+        etag = response['ETag']
+
+        self.assertEqual(response.status_code, 200)
+        not_modified = self.get('/api/jobs/', etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertEqual(self.get('/api/jobs/', '"other", ' + etag).status_code, 304)
+        self.assertEqual(self.get('/api/jobs/', etag, page_size=5).status_code, 200)
+
+    def test_feed_is_served_from_cache_until_a_job_changes(self):
+        etag = self.get('/api/jobs/')['ETag']
+        # A queryset update sends no signals, so the cached page is still served
+        JobPost.objects.filter(pk=self.job.pk).update(job_title='Go Developer')
+        self.assertEqual(self.titles(self.get('/api/jobs/')), ['Python Developer'])
+
+        self.create_job('Designer')
+
+        response = self.get('/api/jobs/', etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(sorted(self.titles(response)), ['Designer', 'Go Developer'])
+
+    def test_detail_is_invalidated_by_company_changes(self):
+        url = f'/api/jobs/{self.job.pk}/'
+        response = self.get(url)
+        etag = response['ETag']
+        self.assertEqual(self.get(url, etag).status_code, 304)
+
+        self.company.name = 'Globex'
+        self.company.save()
+
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['company_details']['name'], 'Globex')
+
+    def test_detail_is_cached_per_field_selection(self):
+        url = f'/api/jobs/{self.job.pk}/'
+        full = self.get(url)
+        sparse = self.get(url, fields='id,job_title')
+
+        self.assertNotEqual(full['ETag'], sparse['ETag'])
+        self.assertEqual(set(sparse.json()), {'id', 'job_title'})
+        self.assertIn('job_description', self.get(url).json())
+
+    def test_authenticated_requests_bypass_the_cache(self):
+        client = APIClient(HTTP_HOST='localhost')
+        client.force_authenticate(self.company.user)
+        response = client.get('/api/jobs/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+
+    @override_settings(JOB_FEED_CACHE_TIMEOUT=0)
+    def test_disabled_without_a_timeout(self):
+        self.assertFalse(self.get('/api/jobs/').has_header('ETag'))
+
+    @skipUnless(apps.is_installed('django.contrib.admin'), 'the admin is disabled with API_ONLY')
+    def test_admin_status_actions_invalidate(self):
+        from django.contrib.admin.sites import site
+
+        url = f'/api/jobs/{self.job.pk}/'
+        feed_etag = self.get('/api/jobs/')['ETag']
+        detail_etag = self.get(url)['ETag']
+
+        # As in a changelist filtered on the status the action changes
+        site._registry[JobPost].set_status(JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE), 'DRAFT')
+
+        response = self.get('/api/jobs/', feed_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.titles(response), [])
+        response = self.get(url, detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'DRAFT')
@@ -0,0 +1,144 @@
+from datetime import timedelta
+from smtplib import SMTPException
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import Company, CustomUser
+from jobs import notifications
+from jobs.models import JobApplication, JobPost, Notification
+
+
+class FailingConnection:
+    """Email connection that fails to send to the given addresses"""
+
+    def __init__(self, failing):
+        self.failing = set(failing)
+        self.sent = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.failing & set(message.to):
+                raise SMTPException('Mailbox unavailable')
+            self.sent.append(message)
+        return len(messages)
+
+
+@override_settings(NOTIFICATION_BATCH_SIZE=100, NOTIFICATION_MAX_ATTEMPTS=3, NOTIFICATION_RETRY_DELAY=60)
+class NotificationOutboxTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = CustomUser.objects.create_user('outbox@example.com', 'outbox-password', user_type='COMPANY')
+        company = Company.objects.create(user=user, name='Acme', location='Remote', website='https://acme.example.com')
+        cls.jobs = [
+            JobPost.objects.create(
+                company=company, job_title=job_title, job_description='<p>Join our team.</p>',
+                employment_type='Full-time', location='Remote', salary_from=50000, salary_to=80000,
+                listing_duration=30, status=JobPost.JobPostStatus.ACTIVE,
+            )
+            for job_title in ('Python Developer', 'Go Developer')
+        ]
+        cls.ann = CustomUser.objects.create_user('ann@example.com', 'outbox-password', user_type='JOB_SEEKER')
+        cls.bob = CustomUser.objects.create_user('bob@example.com', 'outbox-password', user_type='JOB_SEEKER')
+        cls.applications = {
+            (user.email, job.job_title): JobApplication.objects.create(user=user, job=job)
+            for user in (cls.ann, cls.bob)
+            for job in cls.jobs
+        }
+
+    def queue(self, email, job_title, old_status, new_status):
+        application = self.applications[email, job_title]
+        notifications.enqueue_status_changes([{
+            'application_id': application.pk,
+            'job_id': application.job_id,
+            'user_id': application.user_id,
+            'old_status': old_status,
+            'new_status': new_status,
+        }])
+        return Notification.objects.latest('id')
+
+    def test_coalesces_changes_per_application(self):
+        self.queue('ann@example.com', 'Python Developer', 'pending', 'reviewed')
+        self.queue('ann@example.com', 'Go Developer', 'pending', 'reviewed')
+        self.queue('ann@example.com', 'Python Developer', 'reviewed', 'accepted')
+        self.queue('ann@example.com', 'Go Developer', 'reviewed', 'pending')
+
+        changes = notifications.coalesce(Notification.objects.all())
+
+        self.assertEqual([(change['old_status'], change['new_status']) for change in changes], [('pending', 'accepted')])
+
+    def test_sends_one_email_per_recipient(self):
+        self.queue('ann@example.com', 'Python Developer', 'pending', 'reviewed')
+        self.queue('ann@example.com', 'Go Developer', 'pending', 'rejected')
+        self.queue('bob@example.com', 'Go Developer', 'pending', 'accepted')
+
+        result = notifications.drain()
+
+        self.assertEqual(result, {'notifications': 3, 'emails': 2, 'retried': 0, 'failed': 0})
+        subjects = {message.to[0]: message.subject for message in mail.outbox}
+        self.assertEqual(subjects, {
+            'ann@example.com': 'Updates on 2 of your job applications',
+            'bob@example.com': 'Update on your job application',
+        })
+        bob_email = next(message for message in mail.outbox if message.to == ['bob@example.com'])
+        self.assertIn('Go Developer at Acme: Pending -> Accepted', bob_email.body)
+        self.assertFalse(Notification.objects.exclude(status=Notification.Status.SENT).exists())
+        self.assertEqual(notifications.drain()['notifications'], 0)
+
+    def test_changes_that_cancel_out_send_nothing(self):
+        self.queue('ann@example.com', 'Python Developer', 'pending', 'reviewed')
+        self.queue('ann@example.com', 'Python Developer', 'reviewed', 'pending')
+
+        result = notifications.drain()
+
+        self.assertEqual(result, {'notifications': 2, 'emails': 0, 'retried': 0, 'failed': 0})
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(Notification.objects.filter(status=Notification.Status.SENT).count(), 2)
+
+    def test_claims_due_notifications_oldest_first(self):
+        later = self.queue('ann@example.com', 'Python Developer', 'pending', 'reviewed')
+        first = self.queue('bob@example.com', 'Python Developer', 'pending', 'reviewed')
+        scheduled = self.queue('bob@example.com', 'Go Developer', 'pending', 'reviewed')
+        now = timezone.now()
+        Notification.objects.filter(pk=first.pk).update(available_at=now - timedelta(minutes=2))
+        Notification.objects.filter(pk=later.pk).update(available_at=now - timedelta(minutes=1))
+        Notification.objects.filter(pk=scheduled.pk).update(available_at=now + timedelta(minutes=1))
+
+        self.assertEqual([n.pk for n in notifications.claim_batch(10, now)], [first.pk, later.pk])
+        self.assertEqual([n.pk for n in notifications.claim_batch(1, now)], [first.pk])
+
+    def test_failed_deliveries_back_off_then_fail(self):
+        failing = self.queue('ann@example.com', 'Python Developer', 'pending', 'reviewed')
+        delivered = self.queue('bob@example.com', 'Python Developer', 'pending', 'reviewed')
+        connection = FailingConnection(['ann@example.com'])
+        self.enterContext(self.assertLogs('jobs.notifications', 'WARNING'))
+
+        for attempt, delay in enumerate([60, 120], start=1):
+            before = timezone.now()
+            result = notifications.drain(email_connection=connection)
+            self.assertEqual(result['retried'], 1)
+            failing.refresh_from_db()
+            self.assertEqual((failing.status, failing.attempts), (Notification.Status.PENDING, attempt))
+            self.assertEqual(failing.last_error, 'Mailbox unavailable')
+            self.assertGreaterEqual(failing.available_at, before + timedelta(seconds=delay))
+            self.assertLessEqual(failing.available_at, timezone.now() + timedelta(seconds=delay))
+            # Not due yet
+            self.assertEqual(notifications.drain(email_connection=connection)['notifications'], 0)
+            Notification.objects.filter(pk=failing.pk).update(available_at=timezone.now())
+
+        result = notifications.drain(email_connection=connection)
+
+        self.assertEqual(result, {'notifications': 1, 'emails': 0, 'retried': 0, 'failed': 1})
+        failing.refresh_from_db()
+        self.assertEqual((failing.status, failing.attempts), (Notification.Status.FAILED, 3))
+        delivered.refresh_from_db()
+        self.assertEqual(delivered.status, Notification.Status.SENT)
+        self.assertEqual([message.to for message in connection.sent], [['bob@example.com']])
@@ -0,0 +1,99 @@
+import base64
+import json
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import Company, CustomUser
+from jobs.models import JobPost
+
+
+def cursor(*payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('ascii')).decode('ascii')
+
+
+class KeysetPaginationTests(TestCase):
+    """KeysetPagination on the job feed, which orders by -created_at and pk"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = CustomUser.objects.create_user('pages@example.com', 'pages-password', user_type='COMPANY')
+        company = Company.objects.create(user=user, name='Acme', location='Remote', website='https://acme.example.com')
+        for i in range(7):
+            JobPost.objects.create(
+                company=company, job_title=f'Job {i}', job_description='<p>Join our team.</p>',
+                employment_type='Full-time', location='Remote', salary_from=40000 + i % 3 * 10000,
+                salary_to=90000, listing_duration=30, status=JobPost.JobPostStatus.ACTIVE,
+            )
+        # Four jobs share a timestamp so pages have to break ties on pk
+        now = timezone.now()
+        jobs = list(JobPost.objects.order_by('job_title'))
+        for i, job in enumerate(jobs):
+            JobPost.objects.filter(pk=job.pk).update(created_at=now - timedelta(minutes=min(i, 3)))
+
+    def get(self, url, params=None):
+        return APIClient().get(url, params, HTTP_HOST='localhost')
+
+    def walk(self, url, params=None, link='next'):
+        """IDs of every page reached by following the links from the first page"""
+        pages = []
+        response = self.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append([job['id'] for job in response.json()['results']])
+            if not response.json()[link]:
+                return pages, response
+            response = self.get(response.json()[link])
+
+    def expected(self, *ordering):
+        return [str(pk) for pk in JobPost.objects.order_by(*ordering).values_list('pk', flat=True)]
+
+    def test_pages_cover_every_job_once_in_order(self):
+        pages, last = self.walk('/api/jobs/', {'pagination': 'cursor', 'page_size': 3})
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), self.expected('-created_at', '-pk'))
+        self.assertEqual(last.json()['count'], 7)
+
+    def test_previous_links_walk_back_to_the_first_page(self):
+        pages, last = self.walk('/api/jobs/', {'pagination': 'cursor', 'page_size': 3})
+
+        back = [pages[-1]]
+        response = last
+        while response.json()['previous']:
+            response = self.get(response.json()['previous'])
+            back.append([job['id'] for job in response.json()['results']])
+
+        self.assertEqual(back, pages[::-1])
+        self.assertIsNone(response.json()['previous'])
+
+    def test_follows_the_requested_ordering(self):
+        pages, _ = self.walk('/api/jobs/', {'pagination': 'cursor', 'page_size': 2, 'ordering': 'salary_from'})
+        self.assertEqual(sum(pages, []), self.expected('salary_from', 'pk'))
+
+    def test_count_can_be_skipped(self):
+        response = self.get('/api/jobs/', {'pagination': 'cursor', 'count': 'false'})
+        self.assertNotIn('count', response.json())
+        self.assertEqual(len(response.json()['results']), 7)
+
+    def test_page_numbers_without_cursor_mode(self):
+        response = self.get('/api/jobs/', {'page': 2, 'page_size': 5})
+        self.assertEqual(response.json()['count'], 7)
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertIsNone(response.json()['next'])
+
+    def test_invalid_cursors_are_not_found(self):
+        job = JobPost.objects.first()
+        for value in [
+            'not-base64!',
+            base64.urlsafe_b64encode(b'not json').decode('ascii'),
+            cursor('2024-01-01T00:00:00Z', str(job.pk)),
+            cursor('yesterday', str(job.pk), 0),
+            cursor(job.created_at.isoformat(), 'not-a-uuid', 0),
+        ]:
+            with self.subTest(cursor=value):
+                response = self.get('/api/jobs/', {'cursor': value})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
@@ -0,0 +1,33 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from jobs.query_plans import analyze, get_checks, is_supported, plan_problems
+from jobs.synthetic import generate
+
+
+@skipUnless(is_supported(connection.vendor), f'query plan checks are not supported on {connection.vendor}')
+class QueryPlanTests(TestCase):
+    """The checks of ``manage.py check_query_plans``, so a lost index fails the suite"""
+
+    @classmethod
+    def setUpTestData(cls):
+        generate(companies=10, jobs=500, job_seekers=100, prefix='queryplan')
+        analyze(connection)
+
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            # A table this small is cheaper to scan and sort than to read
+            # through an index; only fall back to that if no index applies
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('SET LOCAL enable_sort = off')
+
+    def test_endpoint_queries_use_indexes(self):
+        checks = get_checks()
+        self.assertTrue(checks)
+        for name, queryset, allow_sort in checks:
+            with self.subTest(name):
+                plan = queryset.explain()
+                self.assertEqual(plan_problems(connection.vendor, plan, allow_sort), [], plan)
@@ -0,0 +1,67 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import Company, CustomUser
+from jobs.models import JobPost
+from jobs.search import fts_table_available
+
+
+def create_job(company, job_title, job_description='<p>Join our team.</p>'):
+    return JobPost.objects.create(
+        company=company, job_title=job_title, job_description=job_description,
+        employment_type='Full-time', location='Remote', salary_from=50000, salary_to=80000,
+        listing_duration=30, status=JobPost.JobPostStatus.ACTIVE,
+    )
+
+
+@skipUnless(connection.vendor == 'sqlite', 'tests the SQLite FTS5 backend')
+class SqliteSearchTests(TestCase):
+    """JobPostSearchFilter on SQLite, which joins the FTS5 table through JobPostSearchDocument"""
+
+    @classmethod
+    def setUpTestData(cls):
+        if not fts_table_available(connection):
+            return
+        user = CustomUser.objects.create_user('search@example.com', 'search-password', user_type='COMPANY')
+        cls.company = Company.objects.create(user=user, name='Acme', location='Remote', website='https://acme.example.com')
+        cls.title_match = create_job(cls.company, 'Python Developer')
+        cls.description_match = create_job(cls.company, 'Backend Engineer', '<p>Some Python experience helps.</p>')
+        create_job(cls.company, 'Product Designer')
+
+    def setUp(self):
+        if not fts_table_available(connection):
+            self.skipTest('SQLite was built without FTS5')
+
+    def search(self, terms, **params):
+        response = APIClient().get('/api/jobs/', {'search': terms, **params}, HTTP_HOST='localhost')
+        self.assertEqual(response.status_code, 200)
+        return [job['id'] for job in response.json()['results']]
+
+    def test_matches_ranked_by_weighted_column(self):
+        self.assertEqual(self.search('python'), [str(self.title_match.pk), str(self.description_match.pk)])
+
+    def test_last_term_matches_as_prefix(self):
+        self.assertEqual(self.search('desig'), [str(JobPost.objects.get(job_title='Product Designer').pk)])
+
+    def test_company_name_is_searched_and_kept_in_sync(self):
+        self.assertEqual(len(self.search('acme')), 3)
+        self.company.name = 'Globex'
+        self.company.save()
+        self.assertEqual(self.search('acme'), [])
+        self.assertEqual(len(self.search('globex')), 3)
+
+    def test_edited_and_deleted_jobs_leave_the_index(self):
+        self.title_match.job_title = 'Go Developer'
+        self.title_match.save()
+        self.assertEqual(self.search('python'), [str(self.description_match.pk)])
+        self.description_match.delete()
+        self.assertEqual(self.search('python'), [])
+
+    def test_match_runs_once_in_a_join(self):
+        queryset = JobPost.objects.filter(search_document__document__match='"python"*')
+        plan = queryset.explain()
+        self.assertIn('VIRTUAL TABLE INDEX', plan)
+        self.assertEqual(queryset.count(), 2)
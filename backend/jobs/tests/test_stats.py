@@ -0,0 +1,126 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Company, CustomUser
+from jobs import stats
+from jobs.models import JobApplication, JobPost, PlatformStat
+
+
+def counter(metric, dimension=stats.TOTAL):
+    """Value of a counter, adding up its shards"""
+    return sum(
+        stat.value for stat in PlatformStat.objects.filter(metric=metric)
+        if stats.counter_key(stat.metric, stat.dimension) == (metric, dimension)
+    )
+
+
+class PlatformStatCounterTests(TestCase):
+    """Counters kept in step by the signal handlers and stats.bulk_update"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = CustomUser.objects.create_user('stats@example.com', 'stats-password', user_type='COMPANY')
+        cls.company = Company.objects.create(user=user, name='Acme', location='Remote', website='https://acme.example.com')
+
+    def create_job(self, location='Remote', status=JobPost.JobPostStatus.ACTIVE, salary_from=50000):
+        return JobPost.objects.create(
+            company=self.company, job_title='Python Developer', job_description='<p>Join our team.</p>',
+            employment_type='Full-time', location=location, salary_from=salary_from, salary_to=salary_from + 20000,
+            listing_duration=30, status=status,
+        )
+
+    def test_counts_active_jobs_per_dimension(self):
+        self.create_job()
+        self.create_job(location='Berlin', salary_from=120000)
+        self.create_job(status=JobPost.JobPostStatus.DRAFT)
+
+        self.assertEqual(stats.get_totals(), {'total_active_jobs': 2, 'total_companies': 1})
+        breakdown = stats.get_breakdown()
+        self.assertEqual(breakdown['jobs_by_employment_type'], {'Full-time': 2})
+        self.assertEqual(breakdown['jobs_by_location'], {'Berlin': 1, 'Remote': 1})
+        self.assertEqual(breakdown['jobs_by_salary_band'], {'50000-75000': 1, '100000-150000': 1})
+
+    def test_saves_move_jobs_between_counters(self):
+        job = self.create_job()
+        job.location = 'Berlin'
+        job.save()
+        self.assertEqual((counter(stats.JOBS_BY_LOCATION, 'Remote'), counter(stats.JOBS_BY_LOCATION, 'Berlin')), (0, 1))
+
+        job.status = JobPost.JobPostStatus.EXPIRED
+        job.save(update_fields=['status'])
+        self.assertEqual(counter(stats.ACTIVE_JOBS), 0)
+        self.assertEqual(counter(stats.JOBS_BY_LOCATION, 'Berlin'), 0)
+
+        job.delete()
+        self.assertEqual(counter(stats.ACTIVE_JOBS), 0)
+
+    def test_bulk_update_adjusts_counters(self):
+        jobs = [self.create_job(), self.create_job(), self.create_job(location='Berlin')]
+
+        updated = stats.bulk_update(JobPost.objects.filter(location='Remote'), status=JobPost.JobPostStatus.DRAFT)
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(counter(stats.ACTIVE_JOBS), 1)
+        self.assertEqual(counter(stats.JOBS_BY_LOCATION, 'Remote'), 0)
+        stats.bulk_update(JobPost.objects.filter(pk=jobs[0].pk), status=JobPost.JobPostStatus.ACTIVE)
+        self.assertEqual(counter(stats.ACTIVE_JOBS), 2)
+
+    def test_applications_are_counted_per_day_over_shards(self):
+        job = self.create_job()
+        for i in range(20):
+            user = CustomUser.objects.create_user(f'seeker{i}@example.com', 'stats-password', user_type='JOB_SEEKER')
+            JobApplication.objects.create(user=user, job=job)
+
+        today = timezone.localdate().isoformat()
+        self.assertEqual(counter(stats.APPLICATIONS_PER_DAY, today), 20)
+        self.assertEqual(stats.get_breakdown()['applications_per_day'], {today: 20})
+
+    def test_reconcile_corrects_drift(self):
+        job = self.create_job()
+        self.create_job(location='Berlin')
+        # Writes that bypass the signals
+        JobPost.objects.filter(pk=job.pk).update(status=JobPost.JobPostStatus.DRAFT)
+        PlatformStat.objects.filter(metric=stats.COMPANIES).update(value=5)
+
+        drift = stats.reconcile()
+
+        self.assertEqual(drift, {
+            (stats.ACTIVE_JOBS, stats.TOTAL): (2, 1),
+            (stats.JOBS_BY_EMPLOYMENT_TYPE, 'Full-time'): (2, 1),
+            (stats.JOBS_BY_LOCATION, 'Remote'): (1, 0),
+            (stats.JOBS_BY_SALARY_BAND, '50000-75000'): (2, 1),
+            (stats.COMPANIES, stats.TOTAL): (5, 1),
+        })
+        self.assertEqual(stats.get_totals(), {'total_active_jobs': 1, 'total_companies': 1})
+        self.assertTrue(stats.is_reconciled())
+        self.assertEqual(stats.reconcile(), {})
+
+    def test_reconcile_adds_up_shards(self):
+        today = timezone.localdate().isoformat()
+        job = self.create_job()
+        user = CustomUser.objects.create_user('seeker@example.com', 'stats-password', user_type='JOB_SEEKER')
+        JobApplication.objects.create(user=user, job=job)
+        PlatformStat.objects.filter(metric=stats.APPLICATIONS_PER_DAY).delete()
+        PlatformStat.objects.bulk_create([
+            PlatformStat(metric=stats.APPLICATIONS_PER_DAY, dimension=today, value=3),
+            PlatformStat(metric=stats.APPLICATIONS_PER_DAY, dimension=f'{today}{stats.SHARD_SEPARATOR}5', value=-2),
+        ])
+
+        self.assertEqual(stats.reconcile(), {})
+        self.assertEqual(
+            list(PlatformStat.objects.filter(metric=stats.APPLICATIONS_PER_DAY).values_list('dimension', 'value')),
+            [(today, 1)],
+        )
+
+
+class SalaryBandTests(TestCase):
+
+    def test_bands_use_the_salary_midpoint(self):
+        self.assertEqual(stats.salary_band(20000, 40000), '25000-50000')
+        self.assertEqual(stats.salary_band(0, 10000), '0-25000')
+        self.assertEqual(stats.salary_band(190000, 250000), '200000+')
+
+    def test_median_band(self):
+        self.assertEqual(stats.median_band({'0-25000': 1, '25000-50000': 1, '50000-75000': 3}), '50000-75000')
+        self.assertEqual(stats.median_band({'0-25000': 2, '25000-50000': 2}), '0-25000')
+        self.assertIsNone(stats.median_band({}))
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     JobPostListCreateView,
@@ -6,17 +7,27 @@ from .views import (
     SavedJobPostListView,
     save_job_post,
     unsave_job_post,
+    bulk_save_job_posts,
+    bulk_unsave_job_posts,
     apply_to_job,
+    bulk_apply_to_jobs,
     my_applications,
     company_job_applications,
     all_company_applications,
     update_application_status,
+    bulk_update_application_status,
     job_post_stats,
+    job_post_stats_breakdown,
 )
 
+if settings.ASYNC_VIEWS:
+    from .async_views import job_list_create, job_post_stats
+else:
+    job_list_create = JobPostListCreateView.as_view()
+
 urlpatterns = [
     # Job post endpoints
-    path('jobs/', JobPostListCreateView.as_view(), name='job-list-create'),
+    path('jobs/', job_list_create, name='job-list-create'),
     path('jobs/<uuid:pk>/', JobPostDetailView.as_view(), name='job-detail'),
     path('my-jobs/', MyJobPostsView.as_view(), name='my-jobs'),
     
@@ -24,16 +35,21 @@ urlpatterns = [
     path('saved-jobs/', SavedJobPostListView.as_view(), name='saved-jobs'),
     path('jobs/<uuid:job_id>/save/', save_job_post, name='save-job'),
     path('saved-jobs/<uuid:saved_job_id>/remove/', unsave_job_post, name='unsave-job'),
+    path('jobs/bulk-save/', bulk_save_job_posts, name='bulk-save-jobs'),
+    path('jobs/bulk-unsave/', bulk_unsave_job_posts, name='bulk-unsave-jobs'),
     
     # Job application endpoints
     path('jobs/<uuid:job_id>/apply/', apply_to_job, name='apply-to-job'),
+    path('jobs/bulk-apply/', bulk_apply_to_jobs, name='bulk-apply-to-jobs'),
     path('my-applications/', my_applications, name='my-applications'),
     
     # Company application management endpoints
     path('jobs/<uuid:job_id>/applications/', company_job_applications, name='job-applications'),
     path('company-applications/', all_company_applications, name='company-applications'),
     path('applications/<uuid:application_id>/status/', update_application_status, name='update-application-status'),
+    path('applications/bulk-status/', bulk_update_application_status, name='bulk-update-application-status'),
     
     # Statistics
     path('stats/', job_post_stats, name='job-stats'),
+    path('stats/breakdown/', job_post_stats_breakdown, name='job-stats-breakdown'),
 ]
\ No newline at end of file
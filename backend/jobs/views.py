@@ -3,22 +3,53 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from .models import JobPost, SavedJobPost, JobApplication
-from .serializers import JobPostSerializer, JobPostListSerializer, SavedJobPostSerializer, JobApplicationSerializer
-from accounts.models import Company
+from .serializers import (
+    JobPostSerializer, JobPostListSerializer, SavedJobPostSerializer, JobApplicationSerializer,
+    BulkJobIdsSerializer, BulkApplySerializer, BulkApplicationStatusSerializer,
+)
+from .search import JobPostSearchFilter
+from .pagination import KeysetPagination
+from .exports import export_requested, streaming_export_response
+from .cache import JobFeedCacheMixin
+from .fieldsets import SparseQuerysetMixin
+from .signals import applications_status_changed
+from . import stats
 
 
-class JobPostListCreateView(generics.ListCreateAPIView):
+def paginated_response(request, queryset, serializer_class, **extra):
+    """Paginate a queryset inside a function view and serialize the page"""
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = serializer_class(page, many=True, context={'request': request})
+    response = paginator.get_paginated_response(serializer.data)
+    response.data.update(extra)
+    return response
+
+
+def bulk_response(results):
+    """Per-item results of a bulk request, with a count of each status"""
+    summary = {}
+    for result in results:
+        summary[result['status']] = summary.get(result['status'], 0) + 1
+    return Response({'results': results, 'summary': summary}, status=status.HTTP_200_OK)
+
+
+class JobPostListCreateView(JobFeedCacheMixin, SparseQuerysetMixin, generics.ListCreateAPIView):
     """List all job posts or create a new one"""
     
-    queryset = JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE)
+    queryset = JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE).select_related('company')
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, JobPostSearchFilter]
     filterset_fields = ['employment_type', 'location', 'company']
     search_fields = ['job_title', 'job_description', 'company__name']
     ordering_fields = ['created_at', 'salary_from', 'salary_to']
     ordering = ['-created_at']
+    pagination_class = KeysetPagination
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -33,7 +64,7 @@ class JobPostListCreateView(generics.ListCreateAPIView):
         serializer.save()
 
 
-class JobPostDetailView(generics.RetrieveUpdateDestroyAPIView):
+class JobPostDetailView(JobFeedCacheMixin, SparseQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update or delete a specific job post"""
     
     queryset = JobPost.objects.all()
@@ -51,13 +82,13 @@ class JobPostDetailView(generics.RetrieveUpdateDestroyAPIView):
         
         # Check ownership for edit/delete operations
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
-            if not hasattr(self.request.user, 'company_profile') or obj.company != self.request.user.company_profile:
+            if not hasattr(self.request.user, 'company_profile') or obj.company_id != self.request.user.company_profile.pk:
                 raise PermissionError('You can only modify your own job posts')
         
         return obj
 
 
-class MyJobPostsView(generics.ListAPIView):
+class MyJobPostsView(SparseQuerysetMixin, generics.ListAPIView):
     """List job posts created by the current user's company"""
     
     serializer_class = JobPostListSerializer
@@ -71,7 +102,7 @@ class MyJobPostsView(generics.ListAPIView):
         if not hasattr(self.request.user, 'company_profile'):
             return JobPost.objects.none()
         
-        return JobPost.objects.filter(company=self.request.user.company_profile)
+        return JobPost.objects.filter(company=self.request.user.company_profile).select_related('company')
 
 
 class SavedJobPostListView(generics.ListAPIView):
@@ -81,7 +112,10 @@ class SavedJobPostListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return SavedJobPost.objects.filter(user=self.request.user).select_related('job', 'job__company')
+        # The nested job rows only show an excerpt, so the large text columns are not read
+        return SavedJobPost.objects.filter(user=self.request.user).select_related('job', 'job__company').defer(
+            'job__job_description', 'job__search_vector'
+        )
 
 
 @api_view(['POST'])
@@ -121,12 +155,65 @@ def unsave_job_post(request, saved_job_id):
     }, status=status.HTTP_200_OK)
 
 
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_save_job_posts(request):
+    """Save up to 100 job posts at once; each job is reported as saved, already_saved or not_found"""
+    
+    serializer = BulkJobIdsSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    job_ids = serializer.validated_data['job_ids']
+    
+    active_ids = set(JobPost.objects.filter(
+        id__in=job_ids, status=JobPost.JobPostStatus.ACTIVE
+    ).values_list('id', flat=True))
+    saved_jobs = [SavedJobPost(user_id=request.user.pk, job_id=job_id) for job_id in job_ids if job_id in active_ids]
+    
+    # Already saved jobs are skipped by the (user, job) unique constraint; the
+    # rows that made it in are the ones carrying the IDs generated here
+    with transaction.atomic():
+        SavedJobPost.objects.bulk_create(saved_jobs, ignore_conflicts=True)
+        created = dict(SavedJobPost.objects.filter(
+            pk__in=[saved_job.pk for saved_job in saved_jobs]
+        ).values_list('job_id', 'id'))
+    
+    results = []
+    for job_id in job_ids:
+        if job_id in created:
+            results.append({'job_id': job_id, 'status': 'saved', 'saved_job_id': created[job_id]})
+        elif job_id in active_ids:
+            results.append({'job_id': job_id, 'status': 'already_saved'})
+        else:
+            results.append({'job_id': job_id, 'status': 'not_found'})
+    return bulk_response(results)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_unsave_job_posts(request):
+    """Remove up to 100 job posts from the saved jobs; each job is reported as removed or not_saved"""
+    
+    serializer = BulkJobIdsSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    job_ids = serializer.validated_data['job_ids']
+    
+    saved_jobs = SavedJobPost.objects.filter(user_id=request.user.pk, job_id__in=job_ids)
+    with transaction.atomic():
+        removed = set(saved_jobs.select_for_update().values_list('job_id', flat=True))
+        saved_jobs.delete()
+    
+    return bulk_response([
+        {'job_id': job_id, 'status': 'removed' if job_id in removed else 'not_saved'}
+        for job_id in job_ids
+    ])
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def apply_to_job(request, job_id):
     """Apply to a job posting"""
     
-    job = get_object_or_404(JobPost, id=job_id, status=JobPost.JobPostStatus.ACTIVE)
+    job = get_object_or_404(JobPost.objects.select_related('company'), id=job_id, status=JobPost.JobPostStatus.ACTIVE)
     
     # Check if user is a job seeker
     if not hasattr(request.user, 'jobseeker_profile'):
@@ -135,27 +222,27 @@ def apply_to_job(request, job_id):
         }, status=status.HTTP_403_FORBIDDEN)
     
     # Check if user is trying to apply to their own company's job
-    if hasattr(request.user, 'company_profile') and job.company == request.user.company_profile:
+    if hasattr(request.user, 'company_profile') and job.company_id == request.user.company_profile.pk:
         return Response({
             'error': 'Companies cannot apply to their own jobs'
         }, status=status.HTTP_403_FORBIDDEN)
     
-    # Check if already applied
-    existing_application = JobApplication.objects.filter(user=request.user, job=job).first()
-    if existing_application:
-        return Response({
-            'error': 'You have already applied to this job',
-            'application': JobApplicationSerializer(existing_application).data
-        }, status=status.HTTP_400_BAD_REQUEST)
-    
-    # Create application
+    # Create application; the (user, job) unique constraint rejects duplicates
     serializer = JobApplicationSerializer(data=request.data, context={'request': request})
     if serializer.is_valid():
-        application = serializer.save(job=job)
-        
-        # Increment application count on the job
-        job.applications += 1
-        job.save()
+        try:
+            with transaction.atomic():
+                application = serializer.save(job=job)
+                
+                # Increment application count with a single-column UPDATE so concurrent
+                # applies cannot lose increments and the rest of the row is left alone
+                JobPost.objects.filter(pk=job.pk).update(applications=F('applications') + 1)
+        except IntegrityError:
+            existing_application = JobApplication.objects.filter(user=request.user, job=job).first()
+            return Response({
+                'error': 'You have already applied to this job',
+                'application': JobApplicationSerializer(existing_application).data
+            }, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'message': 'Application submitted successfully',
@@ -165,47 +252,100 @@ def apply_to_job(request, job_id):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_apply_to_jobs(request):
+    """
+    Apply to up to 100 jobs at once with the same cover letter; each job is
+    reported as applied, already_applied, own_job or not_found
+    """
+    
+    if not hasattr(request.user, 'jobseeker_profile'):
+        return Response({
+            'error': 'Only job seekers can apply for jobs'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = BulkApplySerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    job_ids = serializer.validated_data['job_ids']
+    
+    job_companies = dict(JobPost.objects.filter(
+        id__in=job_ids, status=JobPost.JobPostStatus.ACTIVE
+    ).values_list('id', 'company_id'))
+    own_company_id = request.user.company_profile.pk if hasattr(request.user, 'company_profile') else None
+    applications = [
+        JobApplication(user_id=request.user.pk, job_id=job_id, cover_letter=serializer.validated_data['cover_letter'])
+        for job_id in job_ids
+        if job_id in job_companies and job_companies[job_id] != own_company_id
+    ]
+    
+    with transaction.atomic():
+        JobApplication.objects.bulk_create(applications, ignore_conflicts=True)
+        created = dict(JobApplication.objects.filter(
+            pk__in=[application.pk for application in applications]
+        ).values_list('job_id', 'id'))
+        
+        # Every job gets at most one new application, so one UPDATE covers all counters
+        JobPost.objects.filter(pk__in=created).update(applications=F('applications') + 1)
+        stats.record_created(JobApplication, [
+            application for application in applications if application.job_id in created
+        ])
+    
+    results = []
+    for job_id in job_ids:
+        if job_id in created:
+            results.append({'job_id': job_id, 'status': 'applied', 'application_id': created[job_id]})
+        elif job_id not in job_companies:
+            results.append({'job_id': job_id, 'status': 'not_found'})
+        elif job_companies[job_id] == own_company_id:
+            results.append({'job_id': job_id, 'status': 'own_job'})
+        else:
+            results.append({'job_id': job_id, 'status': 'already_applied'})
+    return bulk_response(results)
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def my_applications(request):
-    """Get current user's job applications"""
+    """Get current user's job applications (?export=ndjson|csv streams all of them)"""
     
-    applications = JobApplication.objects.filter(user=request.user).select_related('job', 'job__company')
-    serializer = JobApplicationSerializer(applications, many=True)
+    applications = JobApplication.objects.filter(user=request.user).select_related(
+        'user', 'user__jobseeker_profile', 'job', 'job__company'
+    ).order_by('-applied_at')
     
-    return Response({
-        'results': serializer.data,
-        'count': applications.count()
-    })
+    if export_requested(request):
+        return streaming_export_response(request, applications, JobApplicationSerializer, 'my-applications')
+    
+    return paginated_response(request, applications, JobApplicationSerializer)
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def company_job_applications(request, job_id):
-    """Get all applications for a specific job (company only)"""
+    """Get all applications for a specific job (company only, ?export=ndjson|csv streams all of them)"""
     
     job = get_object_or_404(JobPost, id=job_id)
     
     # Check if user owns this job
-    if not hasattr(request.user, 'company_profile') or job.company != request.user.company_profile:
+    if not hasattr(request.user, 'company_profile') or job.company_id != request.user.company_profile.pk:
         return Response({
             'error': 'You can only view applications for your own jobs'
         }, status=status.HTTP_403_FORBIDDEN)
     
-    applications = JobApplication.objects.filter(job=job).select_related('user', 'user__jobseeker_profile').order_by('-applied_at')
-    serializer = JobApplicationSerializer(applications, many=True)
+    applications = JobApplication.objects.filter(job=job).select_related(
+        'user', 'user__jobseeker_profile', 'job', 'job__company'
+    ).order_by('-applied_at')
     
-    return Response({
-        'results': serializer.data,
-        'count': applications.count(),
-        'job_title': job.job_title
-    })
+    if export_requested(request):
+        return streaming_export_response(request, applications, JobApplicationSerializer, f'job-{job.id}-applications')
+    
+    return paginated_response(request, applications, JobApplicationSerializer, job_title=job.job_title)
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def all_company_applications(request):
-    """Get all applications across all company's jobs"""
+    """Get all applications across all company's jobs (?export=ndjson|csv streams all of them)"""
     
     if not hasattr(request.user, 'company_profile'):
         return Response({
@@ -213,14 +353,14 @@ def all_company_applications(request):
         }, status=status.HTTP_403_FORBIDDEN)
     
     company_jobs = JobPost.objects.filter(company=request.user.company_profile)
-    applications = JobApplication.objects.filter(job__in=company_jobs).select_related('user', 'user__jobseeker_profile', 'job').order_by('-applied_at')
+    applications = JobApplication.objects.filter(job__in=company_jobs).select_related(
+        'user', 'user__jobseeker_profile', 'job', 'job__company'
+    ).order_by('-applied_at')
     
-    serializer = JobApplicationSerializer(applications, many=True)
+    if export_requested(request):
+        return streaming_export_response(request, applications, JobApplicationSerializer, 'company-applications')
     
-    return Response({
-        'results': serializer.data,
-        'count': applications.count()
-    })
+    return paginated_response(request, applications, JobApplicationSerializer)
 
 
 @api_view(['PATCH'])
@@ -228,10 +368,13 @@ def all_company_applications(request):
 def update_application_status(request, application_id):
     """Update application status (company only)"""
     
-    application = get_object_or_404(JobApplication, id=application_id)
+    application = get_object_or_404(
+        JobApplication.objects.select_related('user', 'user__jobseeker_profile', 'job', 'job__company'),
+        id=application_id
+    )
     
     # Check if user owns the job this application is for
-    if not hasattr(request.user, 'company_profile') or application.job.company != request.user.company_profile:
+    if not hasattr(request.user, 'company_profile') or application.job.company_id != request.user.company_profile.pk:
         return Response({
             'error': 'You can only update applications for your own jobs'
         }, status=status.HTTP_403_FORBIDDEN)
@@ -244,10 +387,16 @@ def update_application_status(request, application_id):
     
     old_status = application.status
     application.status = new_status
-    application.save()
-    
-    # Here you could add email notification logic
-    # send_application_status_notification(application, old_status, new_status)
+    with transaction.atomic():
+        application.save(update_fields=['status', 'updated_at'])
+        if new_status != old_status:
+            applications_status_changed.send(sender=JobApplication, changes=[{
+                'application_id': application.pk,
+                'job_id': application.job_id,
+                'user_id': application.user_id,
+                'old_status': old_status,
+                'new_status': new_status,
+            }])
     
     serializer = JobApplicationSerializer(application)
     
@@ -257,14 +406,75 @@ def update_application_status(request, application_id):
     })
 
 
+@api_view(['PATCH'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_update_application_status(request):
+    """
+    Set the status of up to 500 applications to the company's jobs at once.
+    
+    Body: {"application_ids": [...], "status": "reviewed"}. Returns the
+    previous status of every changed application; applications that are
+    missing or belong to another company's jobs are listed as not_found.
+    """
+    
+    if not hasattr(request.user, 'company_profile'):
+        return Response({
+            'error': 'Only companies can update applications'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    serializer = BulkApplicationStatusSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    application_ids = serializer.validated_data['application_ids']
+    new_status = serializer.validated_data['status']
+    
+    with transaction.atomic():
+        # Ownership of the whole batch in one join, locking the rows until the update
+        owned = JobApplication.objects.filter(
+            id__in=application_ids, job__company_id=request.user.company_profile.pk
+        ).select_for_update(of=('self',)).values_list('id', 'job_id', 'user_id', 'status')
+        changes = [
+            {
+                'application_id': application_id,
+                'job_id': job_id,
+                'user_id': user_id,
+                'old_status': old_status,
+                'new_status': new_status,
+            }
+            for application_id, job_id, user_id, old_status in owned
+        ]
+        found = {change['application_id'] for change in changes}
+        changes = [change for change in changes if change['old_status'] != new_status]
+        
+        if changes:
+            JobApplication.objects.filter(
+                id__in=[change['application_id'] for change in changes]
+            ).update(status=new_status, updated_at=timezone.now())
+            applications_status_changed.send(sender=JobApplication, changes=changes)
+    
+    changed = {change['application_id']: change['old_status'] for change in changes}
+    return Response({
+        'status': new_status,
+        'changed': [
+            {'id': application_id, 'from': changed[application_id]}
+            for application_id in application_ids if application_id in changed
+        ],
+        'unchanged': [
+            application_id for application_id in application_ids
+            if application_id in found and application_id not in changed
+        ],
+        'not_found': [application_id for application_id in application_ids if application_id not in found],
+    })
+
+
 @api_view(['GET'])
 def job_post_stats(request):
     """Get general job posting statistics"""
     
-    total_jobs = JobPost.objects.filter(status=JobPost.JobPostStatus.ACTIVE).count()
-    total_companies = Company.objects.count()
+    return Response(stats.get_totals())
+
+
+@api_view(['GET'])
+def job_post_stats_breakdown(request):
+    """Get active jobs per employment type, location and salary band, and applications per day"""
     
-    return Response({
-        'total_active_jobs': total_jobs,
-        'total_companies': total_companies,
-    })
\ No newline at end of file
+    return Response(stats.get_breakdown())
\ No newline at end of file
@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from monitoring.startup import profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        'Profile Django startup in fresh interpreters: time settings import, django.setup(), '
+        'URLconf and middleware loading, and attribute import time to installed apps and packages'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Cold starts to take the median of')
+        parser.add_argument('--top', type=int, default=25, help='Slowest modules to list')
+        parser.add_argument('--api-only', action='store_true', help='Profile the API_ONLY settings profile')
+        parser.add_argument('--json', action='store_true', help='Print the full report as JSON')
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1')
+        env = {'API_ONLY': 'True'} if options['api_only'] else None
+        try:
+            report = profile_startup(runs=options['runs'], top=options['top'], env=env)
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f'Startup phases (median of {report["runs"]} runs, {len(report["installed_apps"])} apps)')
+        for phase, ms in report['phases_ms'].items():
+            self.stdout.write(f'  {phase:<20} {ms:>8.1f} ms')
+
+        self.stdout.write('\nImport time by app / package (self time)')
+        for name, ms in list(report['import_ms_by_owner'].items())[:options['top']]:
+            self.stdout.write(f'  {name:<50} {ms:>8.1f} ms')
+
+        self.stdout.write('\nSlowest modules (cumulative import time)')
+        for name, ms in report['slowest_modules_ms'].items():
+            self.stdout.write(f'  {name:<50} {ms:>8.1f} ms')
@@ -0,0 +1,76 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from monitoring.metrics import pool_report, process_local_cache_warning, reset_route_stats, route_report
+
+
+class Command(BaseCommand):
+    help = (
+        'Report per-route request latency, DB time, serialization and rendering time and query '
+        'counts collected by RequestMetricsMiddleware across all workers'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='Print the full report as JSON')
+        parser.add_argument('--reset', action='store_true', help='Clear the collected statistics')
+        parser.add_argument('--pools', action='store_true', help='Report database connection pool statistics instead')
+
+    def handle(self, *args, **options):
+        # This command runs in its own process, so a process-local cache holds
+        # nothing the workers recorded
+        warning = process_local_cache_warning()
+        if warning:
+            raise CommandError(warning)
+
+        if options['reset']:
+            reset_route_stats()
+            self.stdout.write(self.style.SUCCESS('Request metrics reset'))
+            return
+
+        if options['pools']:
+            self.report_pools(options['json'])
+            return
+
+        report = route_report()
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        if not report:
+            self.stdout.write('No requests recorded yet')
+            return
+
+        header = f'{"route":<55} {"count":>7} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"db ms":>8} {"ser ms":>8} {"render ms":>9} {"queries":>8}'
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for route, stats in report.items():
+            self.stdout.write(
+                f'{route:<55} {stats["count"]:>7} '
+                f'{stats["total_ms"]["p50"]:>8.1f} {stats["total_ms"]["p95"]:>8.1f} {stats["total_ms"]["p99"]:>8.1f} '
+                f'{stats["db_ms"]["mean"]:>8.1f} {stats["serialize_ms"]["mean"]:>8.1f} {stats["render_ms"]["mean"]:>9.1f} {stats["queries"]["mean"]:>8.1f}'
+            )
+
+    def report_pools(self, as_json):
+        report = pool_report()
+        if as_json:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        if not report:
+            self.stdout.write('No connection pool statistics yet (needs DB_POOL)')
+            return
+
+        header = (
+            f'{"worker / database":<40} {"size":>5} {"out":>5} {"idle":>5} {"wait":>5} {"checkouts":>10} '
+            f'{"timeouts":>8} {"wait p95 ms":>11} {"max age s":>9}'
+        )
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for worker, pools in report.items():
+            for alias, stats in pools.items():
+                self.stdout.write(
+                    f'{f"{worker} / {alias}":<40} {stats["size"]:>5} {stats["checked_out"]:>5} {stats["idle"]:>5} '
+                    f'{stats["waiting"]:>5} {stats["checkouts"]:>10} {stats["timeouts"]:>8} '
+                    f'{stats["wait_ms"]["p95"] or 0:>11.1f} {stats["connection_age_s"]["max"] or 0:>9.1f}'
+                )
@@ -0,0 +1,305 @@
+import bisect
+import os
+import socket
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+# Upper bounds of the histogram buckets; the last bucket is unbounded
+TIME_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+WORKERS_KEY = 'monitoring:workers'
+GENERATION_KEY = 'monitoring:generation'
+SNAPSHOT_KEY = 'monitoring:snapshot:{worker}'
+POOLS_KEY = 'monitoring:pools:{worker}'
+SNAPSHOT_TIMEOUT = 86400
+
+current_metrics = ContextVar('current_metrics', default=None)
+
+PROCESS_LOCAL_CACHE_WARNING = (
+    'The default cache ({backend}) is local to each process, so reports only show '
+    'the process they run in; set CACHE_BACKEND to a cache shared by all workers'
+)
+
+
+def cache_is_shared():
+    """Whether the default cache is seen by every worker, which merged reports need"""
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def process_local_cache_warning():
+    """Why a report cannot cover all workers, or None if it can"""
+    if cache_is_shared():
+        return None
+    return PROCESS_LOCAL_CACHE_WARNING.format(backend=settings.CACHES['default']['BACKEND'])
+
+
+class Histogram:
+    """Fixed-bucket histogram that can be merged across processes"""
+
+    def __init__(self, bounds, counts=None, total=0.0, maximum=0.0):
+        self.bounds = tuple(bounds)
+        self.counts = list(counts) if counts else [0] * (len(self.bounds) + 1)
+        self.total = total
+        self.maximum = maximum
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (capped at the observed max)"""
+        count = self.count
+        if not count:
+            return None
+        threshold = q / 100 * count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= threshold:
+                bound = self.bounds[index] if index < len(self.bounds) else self.maximum
+                return round(min(bound, self.maximum), 3)
+        return round(self.maximum, 3)
+
+    def to_dict(self):
+        return {'counts': self.counts, 'total': self.total, 'max': self.maximum}
+
+    @classmethod
+    def from_dict(cls, bounds, data):
+        return cls(bounds, data['counts'], data['total'], data['max'])
+
+    def summary(self):
+        count = self.count
+        return {
+            'mean': round(self.total / count, 3) if count else None,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': round(self.maximum, 3),
+        }
+
+
+class RouteStats:
+    """Per-route histograms of total time, DB time, serialization time, rendering time and query count"""
+
+    histograms = {
+        'total_ms': TIME_BUCKETS_MS,
+        'db_ms': TIME_BUCKETS_MS,
+        'serialize_ms': TIME_BUCKETS_MS,
+        'render_ms': TIME_BUCKETS_MS,
+        'queries': QUERY_BUCKETS,
+    }
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.values = {
+            name: Histogram.from_dict(bounds, data[name]) if name in data else Histogram(bounds)
+            for name, bounds in self.histograms.items()
+        }
+
+    def observe(self, request_metrics):
+        self.values['total_ms'].observe(request_metrics.total_ms)
+        self.values['db_ms'].observe(request_metrics.db_ms)
+        self.values['serialize_ms'].observe(request_metrics.serialize_ms)
+        self.values['render_ms'].observe(request_metrics.render_ms)
+        self.values['queries'].observe(request_metrics.queries)
+
+    def merge(self, other):
+        for name, histogram in self.values.items():
+            histogram.merge(other.values[name])
+
+    def to_dict(self):
+        return {name: histogram.to_dict() for name, histogram in self.values.items()}
+
+    def summary(self):
+        result = {'count': self.values['total_ms'].count}
+        result.update({name: histogram.summary() for name, histogram in self.values.items()})
+        return result
+
+
+class RequestMetrics:
+    """Timings collected for a single request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.serializing = False
+        self.render_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.total_seconds = None
+
+    def record_query(self, execute, sql, params, many, context):
+        """Time one query of the request (called by monitoring.signals.record_query)"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - started
+            self.queries += 1
+
+    def finish(self):
+        self.total_seconds = time.perf_counter() - self.started
+
+    @property
+    def total_ms(self):
+        return self.total_seconds * 1000
+
+    @property
+    def db_ms(self):
+        return self.db_seconds * 1000
+
+    @property
+    def serialize_ms(self):
+        return self.serialize_seconds * 1000
+
+    @property
+    def render_ms(self):
+        return self.render_seconds * 1000
+
+    def server_timing(self):
+        return ', '.join([
+            f'db;dur={self.db_ms:.2f};desc="{self.queries} queries"',
+            f'dbpool;dur={self.pool_wait_seconds * 1000:.2f};desc="connection pool wait"',
+            f'serialize;dur={self.serialize_ms:.2f}',
+            f'render;dur={self.render_ms:.2f};desc="JSON encoding"',
+            f'total;dur={self.total_ms:.2f}',
+        ])
+
+
+class MetricsRegistry:
+    """
+    In-process per-route statistics.
+
+    Every worker keeps its own registry and periodically writes a snapshot to
+    the cache under its own key, so reports can merge all workers without a
+    cache round trip per request.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+        self.last_flush = time.monotonic()
+        self.generation = None
+        self.identify()
+
+    def identify(self):
+        self.worker = f'{socket.gethostname()}:{os.getpid()}'
+
+    def record(self, route, request_metrics):
+        with self.lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            stats.observe(request_metrics)
+        self.maybe_flush()
+
+    def snapshot(self):
+        with self.lock:
+            return {route: stats.to_dict() for route, stats in self.routes.items()}
+
+    def maybe_flush(self):
+        interval = getattr(settings, 'REQUEST_METRICS_FLUSH_INTERVAL', 10)
+        if time.monotonic() - self.last_flush >= interval:
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        # A reset from any process bumps the generation; drop what was counted before it
+        generation = cache.get(GENERATION_KEY, 0)
+        if self.generation is not None and generation != self.generation:
+            self.reset()
+        self.generation = generation
+        cache.set(SNAPSHOT_KEY.format(worker=self.worker), self.snapshot(), SNAPSHOT_TIMEOUT)
+        # Imported here: worknest.db.pool itself records into these metrics
+        from worknest.db.pool import pool_stats
+        pools = pool_stats()
+        if pools:
+            cache.set(POOLS_KEY.format(worker=self.worker), pools, SNAPSHOT_TIMEOUT)
+        workers = cache.get(WORKERS_KEY) or []
+        if self.worker not in workers:
+            cache.set(WORKERS_KEY, workers + [self.worker], SNAPSHOT_TIMEOUT)
+
+    def reset(self):
+        with self.lock:
+            self.routes = {}
+
+
+registry = MetricsRegistry()
+# Workers forked from a preloaded master report under their own pid
+os.register_at_fork(after_in_child=registry.identify)
+
+
+def collect_route_stats():
+    """Merge the flushed snapshots of all workers, including this process"""
+    if registry.routes:
+        registry.flush()
+    merged = {}
+    workers = cache.get(WORKERS_KEY) or []
+    live_workers = []
+    for worker in workers:
+        snapshot = cache.get(SNAPSHOT_KEY.format(worker=worker))
+        if snapshot is None:
+            continue
+        live_workers.append(worker)
+        for route, data in snapshot.items():
+            stats = RouteStats(data)
+            if route in merged:
+                merged[route].merge(stats)
+            else:
+                merged[route] = stats
+    if live_workers != workers:
+        cache.set(WORKERS_KEY, live_workers, SNAPSHOT_TIMEOUT)
+    return merged
+
+
+def route_report():
+    """Per-route summaries sorted by total time spent"""
+    stats = collect_route_stats()
+    return dict(sorted(
+        ((route, route_stats.summary()) for route, route_stats in stats.items()),
+        key=lambda item: -stats[item[0]].values['total_ms'].total,
+    ))
+
+
+def pool_report():
+    """Database connection pool statistics of every worker, as of its last flush"""
+    from worknest.db.pool import pool_stats
+    if pool_stats():
+        registry.flush()
+    report = {}
+    for worker in cache.get(WORKERS_KEY) or []:
+        pools = cache.get(POOLS_KEY.format(worker=worker))
+        if pools:
+            report[worker] = pools
+    return report
+
+
+def reset_route_stats():
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, None)
+    registry.reset()
+    for worker in cache.get(WORKERS_KEY) or []:
+        cache.delete(SNAPSHOT_KEY.format(worker=worker))
+        cache.delete(POOLS_KEY.format(worker=worker))
+    cache.delete(WORKERS_KEY)
@@ -0,0 +1,75 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .metrics import RequestMetrics, current_metrics, registry
+
+
+def route_name(request):
+    """Route pattern of the resolved view, e.g. ``GET api/jobs/<uuid:pk>/``"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+    return f'{request.method} {match.route}'
+
+
+class RequestMetricsMiddleware:
+    """
+    Record query count, DB time, serialization time, rendering time and total
+    time per request.
+
+    Queries are timed by the execute wrapper that ``monitoring.signals``
+    installs on every connection, which finds the request's metrics through
+    ``current_metrics``; serializers are timed by
+    ``monitoring.serializers.TimedSerializerMixin`` and JSON encoding by
+    ``monitoring.renderers.TimedJSONRenderer``. The numbers are added to the
+    response as a ``Server-Timing`` header and aggregated into per-route
+    histograms (see ``manage.py request_metrics``).
+
+    Supports sync and async requests, so it does not force Django to run an
+    ASGI middleware chain in a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+            return await self.get_response(request)
+
+        metrics = RequestMetrics()
+        # Context variables carry over to the sync_to_async threads running the queries
+        token = current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        metrics.finish()
+        route = route_name(request)
+        if route is not None:
+            registry.record(route, metrics)
+        if getattr(settings, 'REQUEST_METRICS_SERVER_TIMING', True):
+            response['Server-Timing'] = metrics.server_timing()
+        return response
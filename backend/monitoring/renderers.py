@@ -0,0 +1,18 @@
+import time
+
+from rest_framework.renderers import JSONRenderer
+
+from .metrics import current_metrics
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer that reports its JSON encoding time to the request metrics"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        started = time.perf_counter()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            metrics = current_metrics.get()
+            if metrics is not None:
+                metrics.render_seconds += time.perf_counter() - started
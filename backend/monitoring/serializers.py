@@ -0,0 +1,29 @@
+import time
+
+from .metrics import current_metrics
+
+
+class TimedSerializerMixin:
+    """
+    Serializer mixin reporting the time spent in ``to_representation`` to
+    the request metrics.
+
+    Only the outermost call is timed, so nested serializers and the items of
+    a ``many=True`` list are counted once. Queries run while serializing
+    (e.g. relations that were not prefetched) count as DB time, not as
+    serialization time.
+    """
+
+    def to_representation(self, instance):
+        metrics = current_metrics.get()
+        if metrics is None or metrics.serializing:
+            return super().to_representation(instance)
+
+        metrics.serializing = True
+        started = time.perf_counter()
+        db_seconds = metrics.db_seconds
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializing = False
+            metrics.serialize_seconds += time.perf_counter() - started - (metrics.db_seconds - db_seconds)
@@ -0,0 +1,27 @@
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .metrics import current_metrics
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper of every connection, timing queries run for a measured request"""
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics.record_query(execute, sql, params, many, context)
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    Time the queries of every connection for RequestMetricsMiddleware.
+
+    Connections are per thread, and async views run their queries in
+    sync_to_async threads, so the middleware cannot wrap them itself; the
+    request's metrics are found through the context variable, which follows
+    the request into those threads. Inserted first so the wrappers of
+    ``connection.execute_wrapper()`` blocks still pop their own entry.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
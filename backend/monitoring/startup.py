@@ -0,0 +1,119 @@
+"""
+Startup profiling.
+
+``profile_startup()`` boots Django in fresh interpreters started with
+``python -X importtime`` (the current process has everything imported
+already), times the startup phases a worker goes through before serving its
+first request and attributes import time to installed apps and top-level
+packages.
+"""
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+
+
+# Runs in the child interpreter; prints the phase timings as JSON
+CHILD_SCRIPT = '''
+import json, time
+started = time.perf_counter()
+import django
+from django.conf import settings
+settings.INSTALLED_APPS
+phases = {'settings': time.perf_counter() - started}
+
+mark = time.perf_counter()
+django.setup(set_prefix=False)
+phases['django.setup'] = time.perf_counter() - mark
+
+mark = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().reverse_dict
+phases['urlconf'] = time.perf_counter() - mark
+
+mark = time.perf_counter()
+from django.core.handlers.wsgi import WSGIHandler
+WSGIHandler()
+phases['middleware'] = time.perf_counter() - mark
+
+phases['total'] = time.perf_counter() - started
+print(json.dumps({'phases': phases, 'installed_apps': list(settings.INSTALLED_APPS)}))
+'''
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def parse_importtime(output):
+    """``[(module, self_us, cumulative_us, depth)]`` from ``-X importtime`` output"""
+    modules = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return modules
+
+
+def owner(module, app_modules):
+    """The installed app a module belongs to (longest matching package), else its top-level package"""
+    best = None
+    for app in app_modules:
+        if (module == app or module.startswith(app + '.')) and (best is None or len(app) > len(best)):
+            best = app
+    return best or module.split('.')[0]
+
+
+def run_child(env):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT],
+        capture_output=True, text=True, env=env, cwd=settings.BASE_DIR,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Django failed to start:\n{result.stderr[-2000:]}')
+    return json.loads(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def profile_startup(runs=3, top=25, env=None):
+    """
+    Median phase timings (ms) over ``runs`` cold starts, import time per
+    owner (installed app or package) and the slowest modules by cumulative
+    import time. ``env`` adds environment variables for the child processes,
+    e.g. ``{'API_ONLY': 'True'}``.
+    """
+    child_env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE, **(env or {})}
+    phase_runs = defaultdict(list)
+    owner_runs = defaultdict(list)
+    module_runs = defaultdict(list)
+    installed_apps = []
+
+    for _ in range(runs):
+        child, modules = run_child(child_env)
+        installed_apps = child['installed_apps']
+        for phase, seconds in child['phases'].items():
+            phase_runs[phase].append(seconds * 1000)
+
+        app_modules = [app.split('.apps.')[0] for app in installed_apps]
+        by_owner = defaultdict(int)
+        for module, self_us, cumulative_us, depth in modules:
+            by_owner[owner(module, app_modules)] += self_us
+            module_runs[module].append(cumulative_us)
+        for name in by_owner.keys() | owner_runs.keys():
+            owner_runs[name].append(by_owner.get(name, 0) / 1000)
+
+    def median(values):
+        return round(statistics.median(values), 1)
+
+    owners = sorted(((name, median(values)) for name, values in owner_runs.items()), key=lambda item: -item[1])
+    slowest = sorted(((name, median(values) / 1000) for name, values in module_runs.items()), key=lambda item: -item[1])
+    return {
+        'runs': runs,
+        'installed_apps': installed_apps,
+        'phases_ms': {phase: median(values) for phase, values in phase_runs.items()},
+        'import_ms_by_owner': {name: ms for name, ms in owners if ms >= 0.1},
+        'slowest_modules_ms': {name: round(ms, 1) for name, ms in slowest[:top]},
+    }
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import request_metrics
+
+urlpatterns = [
+    path('metrics/', request_metrics, name='request-metrics'),
+]
@@ -0,0 +1,20 @@
+from rest_framework import permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from .metrics import pool_report, process_local_cache_warning, route_report
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def request_metrics(request):
+    """
+    Per-route latency and query count histograms and connection pool
+    statistics (staff only). With a process-local cache only the worker
+    serving the request is included, and the response says so.
+    """
+    data = {'routes': route_report(), 'pools': pool_report()}
+    warning = process_local_cache_warning()
+    if warning:
+        data['warning'] = warning
+    return Response(data)
@@ -0,0 +1,22 @@
+"""
+ASGI config for worknest project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Serving through it enables the async views (see ASYNC_VIEWS), e.g. with
+``gunicorn worknest.asgi -k uvicorn.workers.UvicornWorker``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'worknest.settings')
+os.environ.setdefault('ASYNC_VIEWS', 'True')
+# Persistent connections are not closed reliably under ASGI (Django recommends
+# disabling them); DB_POOL still reuses connections
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
+application = get_asgi_application()
@@ -0,0 +1,59 @@
+"""
+Helpers for the plain Django async views served in ASGI mode.
+
+DRF 3.14 views are synchronous, so the async endpoints are regular Django
+views; these helpers give them DRF's request parsing, JWT authentication
+and error format.
+"""
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from rest_framework import exceptions
+from rest_framework.utils.encoders import JSONEncoder
+
+from accounts.authentication import ClaimsJWTAuthentication
+
+
+def json_response(data, status=200, headers=None):
+    """JsonResponse rendered like DRF's JSONRenderer (compact, unescaped unicode)"""
+    return JsonResponse(
+        data, status=status, headers=headers, encoder=JSONEncoder, safe=False,
+        json_dumps_params={'separators': (',', ':'), 'ensure_ascii': False},
+    )
+
+
+def read_data(request):
+    """Parsed JSON or form body, like DRF's request.data"""
+    if request.content_type == 'application/json':
+        try:
+            return json.loads(request.body or b'{}')
+        except ValueError as e:
+            raise exceptions.ParseError(f'JSON parse error - {e}')
+    return request.POST
+
+
+def error_response(exc, request=None):
+    """Response for an APIException in the format of DRF's exception handler"""
+    if isinstance(exc.detail, (list, dict)):
+        data = exc.detail
+    else:
+        data = {'detail': exc.detail}
+    headers = {}
+    if request is not None and isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        headers['WWW-Authenticate'] = ClaimsJWTAuthentication().authenticate_header(request)
+    return json_response(data, status=exc.status_code, headers=headers)
+
+
+async def authenticate(request):
+    """
+    Authenticate the request's JWT and set request.user.
+
+    Raises NotAuthenticated without credentials and AuthenticationFailed for
+    invalid tokens.
+    """
+    result = await sync_to_async(ClaimsJWTAuthentication().authenticate)(request)
+    if result is None:
+        raise exceptions.NotAuthenticated()
+    request.user, request.auth = result
+    return request.user
@@ -0,0 +1,260 @@
+"""
+In-process database connection pool.
+
+Django 5.0 has no built-in pool: a connection is either opened per request
+or kept by one thread for CONN_MAX_AGE seconds. The pooled backends
+(``worknest.db.postgresql`` and ``worknest.db.sqlite3``, enabled with
+DB_POOL) instead check a connection out of a per-process pool when Django
+connects and return it when Django closes the connection at the end of the
+request, so the threads of a worker share at most ``max_size`` open
+connections and a new request rarely pays for a TCP+TLS handshake.
+
+A pool belongs to one set of connection parameters (NAME, HOST, PORT and
+USER). When the settings of an alias change, e.g. when the test runner
+switches it to the test database, the old pool is retired: its idle
+connections are closed, and connections still checked out are closed when
+they are returned instead of being handed to the new settings.
+
+Pool statistics (checked out connections, checkout wait times, connection
+ages) are reported by ``pool_stats()`` and collected per worker by the
+monitoring app.
+"""
+import os
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+from monitoring.metrics import TIME_BUCKETS_MS, Histogram, current_metrics
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections to one database.
+
+    ``getconn(connect)`` hands out the most recently returned idle connection,
+    opens a new one with ``connect()`` while fewer than ``max_size`` are open,
+    or waits up to ``timeout`` seconds for one to be returned. Connections
+    older than ``max_lifetime`` or idle for longer than ``max_idle`` seconds
+    are closed instead of being reused.
+    """
+
+    def __init__(self, max_size=4, timeout=10, max_lifetime=3600, max_idle=600, key=None):
+        self.key = key
+        self.retired = False
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.condition = threading.Condition()
+        self.idle = deque()  # (connection, returned_at), most recently returned last
+        self.opened_at = {}  # id(connection) -> time it was opened
+        self.size = 0  # open connections, idle or checked out, plus ones being opened
+        self.checked_out = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.wait_ms = Histogram(TIME_BUCKETS_MS)
+
+    def getconn(self, connect):
+        """Return ``(connection, reused)``; raises OperationalError after ``timeout`` seconds"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        stale = []
+        try:
+            with self.condition:
+                while True:
+                    while self.idle:
+                        connection, returned_at = self.idle.pop()
+                        if self.expired(connection, returned_at):
+                            stale.append(connection)
+                            self.forget(connection)
+                            continue
+                        self.checked_out_locked(started)
+                        return connection, True
+                    if self.size < self.max_size:
+                        self.size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise OperationalError(
+                            f'No database connection available within {self.timeout}s '
+                            f'({self.max_size} checked out)'
+                        )
+                    self.waiting += 1
+                    try:
+                        self.condition.wait(remaining)
+                    finally:
+                        self.waiting -= 1
+        finally:
+            close_quietly(stale)
+
+        try:
+            connection = connect()
+        except BaseException:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.opened_at[id(connection)] = time.monotonic()
+            self.connections_opened += 1
+            self.checked_out_locked(started)
+        return connection, False
+
+    def putconn(self, connection, discard=False):
+        """
+        Return a checked out connection.
+
+        An open transaction is rolled back; connections that fail to roll
+        back, are discarded, have outlived ``max_lifetime`` or belong to a
+        retired pool are closed.
+        """
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        with self.condition:
+            self.checked_out -= 1
+            if discard or self.retired or self.expired(connection):
+                self.forget(connection)
+            else:
+                self.idle.append((connection, time.monotonic()))
+                connection = None
+            self.condition.notify()
+        if connection is not None:
+            close_quietly([connection])
+
+    def retire(self):
+        """Close the idle connections and every connection returned from now on"""
+        with self.condition:
+            self.retired = True
+            stale = [connection for connection, returned_at in self.idle]
+            self.idle.clear()
+            for connection in stale:
+                self.forget(connection)
+        close_quietly(stale)
+
+    def checked_out_locked(self, started):
+        waited = (time.monotonic() - started) * 1000
+        self.checked_out += 1
+        self.checkouts += 1
+        self.wait_ms.observe(waited)
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.pool_wait_seconds += waited / 1000
+
+    def expired(self, connection, returned_at=None):
+        now = time.monotonic()
+        if now - self.opened_at.get(id(connection), now) >= self.max_lifetime:
+            return True
+        return returned_at is not None and now - returned_at >= self.max_idle
+
+    def forget(self, connection):
+        self.opened_at.pop(id(connection), None)
+        self.size -= 1
+        self.connections_closed += 1
+
+    def stats(self):
+        now = time.monotonic()
+        with self.condition:
+            ages = [now - opened for opened in self.opened_at.values()]
+            return {
+                'max_size': self.max_size,
+                'size': self.size,
+                'idle': len(self.idle),
+                'checked_out': self.checked_out,
+                'waiting': self.waiting,
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'connections_opened': self.connections_opened,
+                'connections_closed': self.connections_closed,
+                'wait_ms': self.wait_ms.summary(),
+                'connection_age_s': {
+                    'mean': round(sum(ages) / len(ages), 1) if ages else None,
+                    'max': round(max(ages), 1) if ages else None,
+                },
+            }
+
+
+def close_quietly(connections):
+    for connection in connections:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+pools = {}
+pools_lock = threading.Lock()
+# A forked worker starts with no pools; connections opened before the fork belong to the parent
+os.register_at_fork(after_in_child=pools.clear)
+
+
+def pool_key(settings_dict):
+    """The connection parameters a pooled connection was opened with"""
+    return tuple(settings_dict.get(name) for name in ('NAME', 'HOST', 'PORT', 'USER'))
+
+
+def get_pool(alias, settings_dict):
+    """
+    The pool of a database alias in this process, created on first use and
+    replaced, retiring the old one, when the alias' connection parameters
+    change.
+    """
+    key = pool_key(settings_dict)
+    pool = pools.get(alias)
+    if pool is None or pool.key != key:
+        with pools_lock:
+            pool = pools.get(alias)
+            if pool is None or pool.key != key:
+                if pool is not None:
+                    pool.retire()
+                pool = pools[alias] = ConnectionPool(key=key, **(settings_dict.get('POOL') or {}))
+    return pool
+
+
+def pool_stats():
+    """Statistics of every pool of this process, by database alias"""
+    return {alias: pool.stats() for alias, pool in pools.items()}
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    DatabaseWrapper mixin taking connections from a ConnectionPool.
+
+    Pool options come from the ``POOL`` key of the database settings. With
+    CONN_HEALTH_CHECKS, a reused connection is checked with ``SELECT 1``
+    before it is handed to Django, and replaced if the check fails.
+    Connections go back to the pool they came from (``connection_pool``).
+    """
+
+    def get_new_connection(self, conn_params):
+        self.connection_pool = get_pool(self.alias, self.settings_dict)
+        connect = lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(conn_params)
+        while True:
+            connection, reused = self.connection_pool.getconn(connect)
+            if not reused or not self.settings_dict['CONN_HEALTH_CHECKS'] or self.pooled_connection_usable(connection):
+                return connection
+            self.connection_pool.putconn(connection, discard=True)
+
+    def pooled_connection_usable(self, connection):
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute('SELECT 1')
+            finally:
+                cursor.close()
+        except self.Database.Error:
+            return False
+        return True
+
+    def _close(self):
+        if self.connection is not None:
+            # The pool the connection came from, even if the settings changed since
+            self.connection_pool.putconn(self.connection)
@@ -0,0 +1,101 @@
+"""
+Browser-only variants of Django's session, CSRF, authentication and
+messages middleware, and an async-capable WhiteNoise.
+
+API requests (paths under settings.API_PATH_PREFIX) are authenticated by
+DRF from a JWT bearer token and are CSRF exempt, so these middleware have
+nothing to do for them: they pass API requests straight through, and only
+the admin and other browser pages pay for sessions, CSRF cookies and
+messages.
+
+Every middleware in MIDDLEWARE supports both sync and async requests, so
+under ASGI Django runs the whole chain, and the async views, in the event
+loop instead of adapting it to a thread.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth import middleware as auth_middleware
+from django.contrib.messages import middleware as messages_middleware
+from django.contrib.sessions import middleware as sessions_middleware
+from django.middleware import csrf
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+def is_api_request(request):
+    return request.path_info.startswith(settings.API_PATH_PREFIX)
+
+
+class BrowserOnlyMixin:
+    """Skip the middleware's request and response processing for API requests"""
+
+    def __call__(self, request):
+        if is_api_request(request):
+            # A coroutine in async mode, which the caller awaits
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SessionMiddleware(sessions_middleware.SessionMiddleware):
+    """
+    Sessions for browser requests only.
+
+    API requests get an empty session that is never loaded or saved, whatever
+    cookies they carry: allauth's AccountMiddleware (which allauth requires
+    in MIDDLEWARE) looks into request.session after every response.
+    """
+
+    def __call__(self, request):
+        if is_api_request(request):
+            request.session = self.SessionStore()
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class CsrfViewMiddleware(BrowserOnlyMixin, csrf.CsrfViewMiddleware):
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(BrowserOnlyMixin, auth_middleware.AuthenticationMiddleware):
+    pass
+
+
+class MessageMiddleware(BrowserOnlyMixin, messages_middleware.MessageMiddleware):
+    pass
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise for both sync and async middleware chains.
+
+    WhiteNoise 6 only supports sync requests, which would make Django run the
+    whole chain in a thread under ASGI. Looking a file up is a dictionary
+    lookup (a filesystem one with autorefresh); other requests go straight
+    on to the next middleware, and static files are served from a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
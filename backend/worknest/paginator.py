@@ -0,0 +1,48 @@
+"""
+Paginator for admin changelists of large tables.
+
+On PostgreSQL ``COUNT(*)`` reads the whole table, which takes seconds once a
+table has millions of rows, and the changelist counts on every page view.
+For unfiltered changelists EstimatedCountPaginator uses the planner's row
+estimate of the table instead (``pg_class.reltuples``, refreshed by
+autovacuum and ANALYZE) once it is above ADMIN_COUNT_ESTIMATE_THRESHOLD.
+Smaller tables, filtered or searched changelists and other databases are
+counted exactly.
+"""
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    """Planner estimate of the rows of an unfiltered PostgreSQL queryset, or None"""
+    query = queryset.query
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql' or query.where or query.distinct or query.is_sliced or query.combinator:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # -1 until the table is first vacuumed or analyzed (PostgreSQL 14+)
+    return int(row[0]) if row and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator counting large unfiltered querysets from the table statistics.
+
+    The estimate can be off by a few percent, so the last page links may
+    point past the end of the list; those pages are shown empty.
+    """
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            estimate = estimated_count(self.object_list)
+            if estimate is not None and estimate >= settings.ADMIN_COUNT_ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
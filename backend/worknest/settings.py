@@ -2,6 +2,7 @@ from pathlib import Path
 import os
 import dj_database_url
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -30,29 +31,35 @@ THIRD_PARTY_APPS = [
     'allauth.account',
     'allauth.socialaccount',
     'allauth.socialaccount.providers.google',
-    'allauth.socialaccount.providers.github',
 ]
 
 LOCAL_APPS = [
     'accounts',
     'jobs',
+    'monitoring',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
+# Every entry supports async requests, so ASGI serves the chain without a thread
 MIDDLEWARE = [
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'worknest.middleware.StaticFilesMiddleware',  # WhiteNoise
+    'monitoring.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    # Browser-only variants: requests under API_PATH_PREFIX skip them (see worknest.middleware)
+    'worknest.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'worknest.middleware.CsrfViewMiddleware',
+    'worknest.middleware.AuthenticationMiddleware',
     'allauth.account.middleware.AccountMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'worknest.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# JWT authenticated API routes, served without sessions, CSRF or messages
+API_PATH_PREFIX = '/api/'
+
 ROOT_URLCONF = 'worknest.urls'
 
 TEMPLATES = [
@@ -71,15 +78,39 @@ TEMPLATES = [
     },
 ]
 
+# API-only profile: leave out the admin, static files and messages, which only
+# browser pages use, so workers import and set up less at startup (measure it
+# with `manage.py profile_startup --api-only`). Sessions stay: allauth's
+# AccountMiddleware requires them
+API_ONLY = config('API_ONLY', default=False, cast=bool)
+if API_ONLY:
+    BROWSER_APPS = ['django.contrib.admin', 'django.contrib.messages', 'django.contrib.staticfiles']
+    BROWSER_MIDDLEWARE = ['worknest.middleware.StaticFilesMiddleware', 'worknest.middleware.MessageMiddleware']
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in BROWSER_APPS]
+    MIDDLEWARE = [middleware for middleware in MIDDLEWARE if middleware not in BROWSER_MIDDLEWARE]
+    TEMPLATES[0]['OPTIONS']['context_processors'].remove('django.contrib.messages.context_processors.messages')
+
 WSGI_APPLICATION = 'worknest.wsgi.application'
+ASGI_APPLICATION = 'worknest.asgi.application'
+
+# Route the I/O-bound endpoints (Google OAuth, job feed, stats) to async views.
+# worknest.asgi turns this on; under WSGI the sync DRF views are used
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
 
 # Database configuration
 DATABASE_URL = config('DATABASE_URL', default=None)
 
+# Persistent connections: seconds a thread keeps its connection open across
+# requests (0 closes it after every request), checked with SELECT 1 before reuse
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+
 if DATABASE_URL:
     # Production database (Railway PostgreSQL)
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL)
+        'default': dj_database_url.parse(
+            DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=DB_CONN_HEALTH_CHECKS,
+        )
     }
 else:
     # Development database (SQLite)
@@ -87,9 +118,89 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
         }
     }
 
+# Connection pool shared by the threads of each worker process, instead of
+# one persistent connection per thread (see worknest.db.pool). Size it to the
+# threads per worker; the database sees up to workers x DB_POOL_MAX_SIZE connections
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+POOLED_ENGINES = {
+    'django.db.backends.postgresql': 'worknest.db.postgresql',
+    'django.db.backends.sqlite3': 'worknest.db.sqlite3',
+}
+
+if DB_POOL:
+    engine = DATABASES['default']['ENGINE']
+    if engine not in POOLED_ENGINES:
+        raise ImproperlyConfigured(f'DB_POOL is not supported with {engine}')
+    DATABASES['default'].update({
+        'ENGINE': POOLED_ENGINES[engine],
+        # Django closes the connection after every request, returning it to the pool
+        'CONN_MAX_AGE': 0,
+        'POOL': {
+            'max_size': config('DB_POOL_MAX_SIZE', default=4, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+            'max_lifetime': config('DB_POOL_MAX_LIFETIME', default=3600, cast=float),
+            'max_idle': config('DB_POOL_MAX_IDLE', default=600, cast=float),
+        },
+    })
+
+# Cache configuration (use a shared backend such as file-based cache when
+# running several workers so feed invalidation reaches all of them)
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='worknest'),
+    }
+}
+# Backends whose entries only the process that wrote them can see
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+CACHE_IS_SHARED = CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+# Seconds anonymous job feed and job detail responses are cached (0 disables).
+# Invalidation has to reach every worker, so it needs a shared cache: with a
+# process-local one the other workers would keep serving stale pages
+JOB_FEED_CACHE_TIMEOUT = config('JOB_FEED_CACHE_TIMEOUT', default=300 if CACHE_IS_SHARED else 0, cast=int)
+if JOB_FEED_CACHE_TIMEOUT > 0 and not CACHE_IS_SHARED:
+    raise ImproperlyConfigured(
+        f"JOB_FEED_CACHE_TIMEOUT needs a shared CACHE_BACKEND, not {CACHES['default']['BACKEND']}"
+    )
+
+# Request instrumentation (query count, DB/serialization/render/total time per route).
+# Per-worker statistics are flushed to the cache every REQUEST_METRICS_FLUSH_INTERVAL
+# seconds and merged by `manage.py request_metrics` and /api/monitoring/metrics/
+REQUEST_METRICS_ENABLED = config('REQUEST_METRICS_ENABLED', default=True, cast=bool)
+REQUEST_METRICS_SERVER_TIMING = config('REQUEST_METRICS_SERVER_TIMING', default=True, cast=bool)
+REQUEST_METRICS_FLUSH_INTERVAL = config('REQUEST_METRICS_FLUSH_INTERVAL', default=10, cast=int)
+
+# In-process cache of full user rows for users authenticated from JWT claims (seconds)
+JWT_USER_CACHE_TIMEOUT = config('JWT_USER_CACHE_TIMEOUT', default=10, cast=int)
+
+# Email delivery. Notifications are queued in the database and sent by
+# `manage.py send_notifications`; use the console or locmem backend locally
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = config('EMAIL_HOST', default='localhost')
+EMAIL_PORT = config('EMAIL_PORT', default=25, cast=int)
+EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
+EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=False, cast=bool)
+EMAIL_TIMEOUT = config('EMAIL_TIMEOUT', default=10, cast=int)
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='WorkNest <noreply@worknest.local>')
+
+# Notification outbox worker: notifications per batch, delivery attempts before
+# giving up, first retry delay in seconds (doubled after every failure) and
+# days sent notifications are kept
+NOTIFICATION_BATCH_SIZE = config('NOTIFICATION_BATCH_SIZE', default=100, cast=int)
+NOTIFICATION_MAX_ATTEMPTS = config('NOTIFICATION_MAX_ATTEMPTS', default=5, cast=int)
+NOTIFICATION_RETRY_DELAY = config('NOTIFICATION_RETRY_DELAY', default=60, cast=int)
+NOTIFICATION_RETENTION_DAYS = config('NOTIFICATION_RETENTION_DAYS', default=7, cast=int)
+
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
@@ -109,6 +220,32 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing. PASSWORD_HASHER picks the hasher for new passwords; the
+# others stay listed so existing hashes verify and are rehashed with the
+# preferred hasher (and current parameters) on the next successful login
+PASSWORD_HASHER_STRATEGIES = {
+    'argon2': 'accounts.hashers.TunedArgon2PasswordHasher',
+    'scrypt': 'accounts.hashers.TunedScryptPasswordHasher',
+    'pbkdf2': 'accounts.hashers.TunedPBKDF2PasswordHasher',
+}
+PASSWORD_HASHER = config('PASSWORD_HASHER', default='argon2')
+if PASSWORD_HASHER not in PASSWORD_HASHER_STRATEGIES:
+    raise ImproperlyConfigured(
+        f"PASSWORD_HASHER must be one of {', '.join(PASSWORD_HASHER_STRATEGIES)}, not {PASSWORD_HASHER!r}"
+    )
+PASSWORD_HASHERS = [PASSWORD_HASHER_STRATEGIES[PASSWORD_HASHER]] + [
+    path for strategy, path in PASSWORD_HASHER_STRATEGIES.items() if strategy != PASSWORD_HASHER
+]
+
+# Argon2id costs (memory in KiB), sized for sync gunicorn workers
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=2, cast=int)
+ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', default=19456, cast=int)
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=1, cast=int)
+SCRYPT_WORK_FACTOR = config('SCRYPT_WORK_FACTOR', default=2 ** 14, cast=int)
+SCRYPT_BLOCK_SIZE = config('SCRYPT_BLOCK_SIZE', default=8, cast=int)
+SCRYPT_PARALLELISM = config('SCRYPT_PARALLELISM', default=1, cast=int)
+PBKDF2_ITERATIONS = config('PBKDF2_ITERATIONS', default=720000, cast=int)
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -122,9 +259,15 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Admin changelists of tables with at least this many rows show PostgreSQL's
+# row estimate instead of an exact COUNT(*) (see worknest.paginator)
+ADMIN_COUNT_ESTIMATE_THRESHOLD = config('ADMIN_COUNT_ESTIMATE_THRESHOLD', default=100000, cast=int)
+
 # Session Configuration
+# Sessions only back the admin (the API uses JWTs); signed_cookies or cache
+# keep them out of the django_session table
+SESSION_ENGINE = config('SESSION_ENGINE', default='django.contrib.sessions.backends.db')
 SESSION_COOKIE_AGE = 86400 * 30  # 30 days
-SESSION_SAVE_EVERY_REQUEST = True
 SESSION_EXPIRE_AT_BROWSER_CLOSE = False
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SECURE = not DEBUG  # True in production
@@ -152,13 +295,13 @@ CSRF_TRUSTED_ORIGINS = [
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.ClaimsJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'monitoring.renderers.TimedJSONRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20
@@ -228,7 +371,7 @@ CORS_ALLOWED_HEADERS = [
 
 # Django Allauth Settings
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
+    'accounts.backends.EmailPasswordBackend',
     'allauth.account.auth_backends.AuthenticationBackend',
 ]
 
@@ -245,11 +388,6 @@ SOCIALACCOUNT_PROVIDERS = {
             'access_type': 'online',
         }
     },
-    'github': {
-        'SCOPE': [
-            'user:email',
-        ],
-    }
 }
 
 # OAuth Environment Variables
@@ -258,10 +396,15 @@ SOCIALACCOUNT_PROVIDERS['google']['APP'] = {
     'secret': config('GOOGLE_CLIENT_SECRET', default=''),
 }
 
-SOCIALACCOUNT_PROVIDERS['github']['APP'] = {
-    'client_id': config('GITHUB_CLIENT_ID', default=''),
-    'secret': config('GITHUB_CLIENT_SECRET', default=''),
-}
+# Google OAuth HTTP client: pooled keep-alive session with bounded timeouts and
+# retries; the endpoint URLs can point at a local stub server for testing
+GOOGLE_OAUTH_TOKEN_URL = config('GOOGLE_OAUTH_TOKEN_URL', default='https://oauth2.googleapis.com/token')
+GOOGLE_OAUTH_USERINFO_URL = config('GOOGLE_OAUTH_USERINFO_URL', default='https://www.googleapis.com/oauth2/v2/userinfo')
+GOOGLE_OAUTH_CONNECT_TIMEOUT = config('GOOGLE_OAUTH_CONNECT_TIMEOUT', default=3.05, cast=float)
+GOOGLE_OAUTH_READ_TIMEOUT = config('GOOGLE_OAUTH_READ_TIMEOUT', default=5, cast=float)
+GOOGLE_OAUTH_RETRIES = config('GOOGLE_OAUTH_RETRIES', default=2, cast=int)
+GOOGLE_OAUTH_POOL_SIZE = config('GOOGLE_OAUTH_POOL_SIZE', default=10, cast=int)
+GOOGLE_USERINFO_CACHE_TIMEOUT = config('GOOGLE_USERINFO_CACHE_TIMEOUT', default=60, cast=int)
 
 # Allauth Configuration
 ACCOUNT_EMAIL_REQUIRED = True
@@ -1,8 +1,14 @@
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/auth/', include('accounts.urls')),
+    path('api/monitoring/', include('monitoring.urls')),
     path('api/', include('jobs.urls')),
-]
\ No newline at end of file
+]
+
+# Not installed with API_ONLY
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
@@ -16,6 +16,8 @@ interface iAppProps {
     job_title: string;
     jobDescription?: string;
     job_description?: string;
+    // Plain-text snippet precomputed by the API for list views
+    excerpt?: string;
     salaryFrom: number;
     salary_from: number;
     salaryTo: number;
@@ -134,6 +136,7 @@ export function JobCard({ job }: iAppProps) {
           <div className="!mt-5">
             <p className="text-base text-muted-foreground line-clamp-2">
               {(() => {
+                if (job.excerpt) return job.excerpt;
                 const description = job.job_description || job.jobDescription;
                 if (!description) return "No description available";
                 